@@ -0,0 +1,106 @@
+// Compares the table-driven Huffman decoder against the bit-by-bit tree walk on generated player names.
+// Usage: node benchmarks/huffmanDecode.js [numberOfNames] [rounds]
+const huffmanTreeParser = require('../services/huffmanTreeParser');
+
+const NUMBER_OF_NAMES = parseInt(process.argv[2], 10) || 50000;
+const ROUNDS = parseInt(process.argv[3], 10) || 5;
+
+const SYLLABLES = ['an', 'ar', 'be', 'bra', 'car', 'da', 'de', 'el', 'fi', 'ga', 'har', 'is', 'ja', 'ke', 'la', 'ma',
+    'mi', 'ne', 'no', 'or', 'pa', 'qu', 'ri', 'ro', 'sa', 'son', 'ta', 'ty', 'ul', 've', 'wa', 'xe', 'yo', 'zi'];
+
+function randomName(random) {
+    const parts = 1 + Math.floor(random() * 3);
+    let name = '';
+
+    for (let i = 0; i < parts; i++) {
+        name += SYLLABLES[Math.floor(random() * SYLLABLES.length)];
+    }
+
+    return name.charAt(0).toUpperCase() + name.slice(1) + (random() < 0.05 ? ' Jr.' : '');
+}
+
+// Small deterministic PRNG so every run decodes the same data
+function createRandom(seed) {
+    return () => {
+        seed = (seed * 1664525 + 1013904223) >>> 0;
+        return seed / 0x100000000;
+    };
+}
+
+// Builds a Huffman tree for the character frequencies in 'names' and writes it in the format parseTree reads
+function buildTreeBuffer(names) {
+    const counts = {};
+    names.forEach((name) => {
+        for (const char of name) {
+            counts[char] = (counts[char] || 0) + 1;
+        }
+    });
+
+    let queue = Object.keys(counts).map((char) => ({ value: char.charCodeAt(0), weight: counts[char], isLeaf: true }));
+
+    while (queue.length > 1) {
+        queue.sort((a, b) => a.weight - b.weight);
+        const [left, right] = queue.splice(0, 2);
+        queue.push({ left: left, right: right, weight: left.weight + right.weight, isLeaf: false });
+    }
+
+    // parseTree reads two (index, value) entries per internal node, level by level, queueing right children before left ones
+    const bytes = [];
+    let level = [queue[0]];
+
+    while (level.length > 0) {
+        const nextLevel = [];
+
+        level.forEach((node) => {
+            [node.left, node.right].forEach((child) => {
+                bytes.push(child.isLeaf ? 0 : 1, child.isLeaf ? child.value : 0);
+            });
+
+            if (!node.right.isLeaf) {
+                nextLevel.push(node.right);
+            }
+            if (!node.left.isLeaf) {
+                nextLevel.push(node.left);
+            }
+        });
+
+        level = nextLevel;
+    }
+
+    return Buffer.from(bytes);
+}
+
+function time(decode, root, encodedNames, names) {
+    const start = process.hrtime.bigint();
+
+    for (let i = 0; i < encodedNames.length; i++) {
+        if (decode(root, encodedNames[i], names[i].length) !== names[i]) {
+            throw new Error(`Decoded value for '${names[i]}' doesn't match`);
+        }
+    }
+
+    return Number(process.hrtime.bigint() - start) / 1e6;
+}
+
+const random = createRandom(0x4D414444);
+const names = [];
+
+for (let i = 0; i < NUMBER_OF_NAMES; i++) {
+    names.push(randomName(random));
+}
+
+const root = huffmanTreeParser.parseTree(buildTreeBuffer(names));
+const encodedNames = names.map((name) => huffmanTreeParser.encodeStringFromRoot(root, name));
+
+const tableBuildStart = process.hrtime.bigint();
+root.decodeTable = huffmanTreeParser.buildDecodeTable(root);
+const tableBuildMs = Number(process.hrtime.bigint() - tableBuildStart) / 1e6;
+
+console.log(`${NUMBER_OF_NAMES} names, ${ROUNDS} rounds, decode table built in ${tableBuildMs.toFixed(2)} ms`);
+
+for (let round = 1; round <= ROUNDS; round++) {
+    const treeWalkMs = time(huffmanTreeParser.decodeBufferFromRoot, root, encodedNames, names);
+    const tableMs = time(huffmanTreeParser.decodeBuffer, root, encodedNames, names);
+
+    console.log(`round ${round}: tree walk ${treeWalkMs.toFixed(1)} ms, decode table ${tableMs.toFixed(1)} ms (${(treeWalkMs / tableMs).toFixed(1)}x)`);
+}
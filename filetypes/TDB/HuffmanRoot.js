@@ -2,6 +2,7 @@ class HuffmanRoot {
     constructor() {
         this._index = 0;
         this._lookupTable = {};
+        this._decodeTable = null;
         this._huffmanValue = '';
     };
 
@@ -13,6 +14,15 @@ class HuffmanRoot {
         this._lookupTable = table;
     };
 
+    // Byte-at-a-time decoding table, built from the tree the first time a value is decoded
+    get decodeTable() {
+        return this._decodeTable;
+    };
+
+    set decodeTable(table) {
+        this._decodeTable = table;
+    };
+
     get huffmanValue() {
         return this._huffmanValue;
     };
@@ -11,7 +11,7 @@ class TDBHuffmanField extends TDBExtraDataField {
 
     get value() {
         if (this.extraDataBuffer) {
-            return huffmanTreeParser.decodeBufferFromRoot(this._huffmanTreeRoot, this.extraDataBuffer.slice(this.offsetLength), this.extraDataOffset);  
+            return huffmanTreeParser.decodeBuffer(this._huffmanTreeRoot, this.extraDataBuffer.slice(this.offsetLength), this.extraDataOffset);  
         }
         else {
             return '';
@@ -0,0 +1,58 @@
+const FIELD_TYPE_STRING = 1;
+
+// A single cell of a TDB2ColumnStore, with the same interface as TDB2Field
+class TDB2ColumnField {
+    constructor(column, row) {
+        this[Symbol.toStringTag] = 'TDB2ColumnField';
+        this._column = column;
+        this._row = row;
+    };
+
+    get key() {
+        return this._column.key;
+    };
+
+    // Alias for key
+    get name() {
+        return this.key;
+    };
+
+    get type() {
+        return this._column.type;
+    };
+
+    get rawKey() {
+        return this._column.rawKey;
+    };
+
+    get raw() {
+        return this._column.getRaw(this._row);
+    };
+
+    set raw(raw) {
+        this._column.setRaw(this._row, raw);
+    };
+
+    get value() {
+        return this._column.getValue(this._row);
+    };
+
+    set value(value) {
+        this._column.setValue(this._row, value);
+    };
+
+    // Byte length of string fields, including the null terminator
+    get length() {
+        return this.type === FIELD_TYPE_STRING ? this.raw.length : 0;
+    };
+
+    get isChanged() {
+        return this._column.isChanged(this._row);
+    };
+
+    set isChanged(isChanged) {
+        this._column.setChanged(this._row, isChanged);
+    };
+};
+
+module.exports = TDB2ColumnField;
@@ -0,0 +1,105 @@
+const TDB2Record = require('./TDB2Record');
+const TDB2Field = require('./TDB2Field');
+
+// A record of a table in columnar mode. Its fields live in the table's TDB2ColumnStore,
+// and it has the same interface as TDB2Record for reading, editing and writing.
+class TDB2ColumnRecord {
+    constructor(store, row) {
+        this[Symbol.toStringTag] = 'TDB2ColumnRecord';
+        this._store = store;
+        this._row = row;
+        this._index = row;
+    };
+
+    // A new object of field views each time. Fields can't be added to or removed from a columnar record.
+    get fields() {
+        return this._store.getRowFields(this._row);
+    };
+
+    get index() {
+        return this._index;
+    };
+
+    set index(index) {
+        this._index = index;
+    };
+
+    // Row of the record in its column store
+    get row() {
+        return this._row;
+    };
+
+    get store() {
+        return this._store;
+    };
+
+    get subRecord() {
+        return null;
+    };
+
+    get isSubRecord() {
+        return false;
+    };
+
+    get parentRecord() {
+        return null;
+    };
+
+    get raw() {
+        return this._store.getRecordRaw(this._row);
+    };
+
+    get compressedRaw() {
+        return null;
+    };
+
+    discardRaw() {
+        this._store.setRecordRaw(this._row, null);
+    };
+
+    get isChanged() {
+        return this._store.isRowChanged(this._row);
+    };
+
+    get isLoaded() {
+        return true;
+    };
+
+    getFieldByKey(key) {
+        return this._store.getField(key, this._row);
+    };
+
+    // Copies the record's fields out of the column store into a regular TDB2Record
+    toRecord() {
+        const record = new TDB2Record();
+        record.index = this._index;
+
+        const fields = this.fields;
+        for (const key in fields) {
+            const fieldView = fields[key];
+
+            if (fieldView instanceof TDB2Field) {
+                record.fields[key] = fieldView;
+                continue;
+            }
+
+            const field = new TDB2Field();
+            field.key = fieldView.key;
+            field.rawKey = fieldView.rawKey;
+            field.type = fieldView.type;
+            field.length = fieldView.length;
+            field.raw = fieldView.raw;
+            field.isChanged = fieldView.isChanged;
+            record.fields[key] = field;
+        }
+
+        return record;
+    };
+
+    // Returns a deep copy of the current record as a regular TDB2Record
+    deepCopyRecord() {
+        return this.toRecord().deepCopyRecord();
+    };
+};
+
+module.exports = TDB2ColumnRecord;
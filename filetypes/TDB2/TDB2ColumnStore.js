@@ -0,0 +1,480 @@
+const utilService = require('../../services/utilService');
+const TDB2Field = require('./TDB2Field');
+const TDB2ColumnRecord = require('./TDB2ColumnRecord');
+const TDB2ColumnField = require('./TDB2ColumnField');
+
+const FIELD_TYPE_INT = 0;
+const FIELD_TYPE_STRING = 1;
+const FIELD_TYPE_UNK = 3;
+const FIELD_TYPE_FLOAT = 10;
+
+// Field types stored in columns. Anything else (subtables) stays a regular field object.
+const COLUMN_FIELD_TYPES = [FIELD_TYPE_INT, FIELD_TYPE_STRING, FIELD_TYPE_UNK, FIELD_TYPE_FLOAT];
+
+// Offset used for cells and records whose bytes aren't in the source data
+const NO_OFFSET = 0xFFFFFFFF;
+
+// One field of a column store: a typed array of values for int and float fields, and
+// the offset and length of every cell's raw bytes in the source data
+class TDB2Column {
+    constructor(store, key, type, rawKey, numRows) {
+        this.store = store;
+        this.key = key;
+        this.type = type;
+        this.rawKey = rawKey;
+        this.present = new Uint8Array(numRows);
+        this.changed = new Uint8Array(numRows);
+        this.rawOffsets = new Uint32Array(numRows).fill(NO_OFFSET);
+        this.rawLengths = new Uint32Array(numRows);
+        this.values = type === FIELD_TYPE_INT ? new Int32Array(numRows) : type === FIELD_TYPE_FLOAT ? new Float32Array(numRows) : null;
+
+        // Raw bytes of cells that aren't views into the source (set or added after parsing)
+        this.rawOverrides = new Map();
+
+        // Cells kept as regular field objects, like subtables
+        this.fieldObjects = new Map();
+    };
+
+    get isColumnType() {
+        return COLUMN_FIELD_TYPES.includes(this.type);
+    };
+
+    setCell(row, field) {
+        this.present[row] = 1;
+        this.changed[row] = field.isChanged ? 1 : 0;
+
+        if (field.type !== this.type || !COLUMN_FIELD_TYPES.includes(field.type) || !Buffer.isBuffer(field.raw)) {
+            this.fieldObjects.set(row, field);
+            return;
+        }
+
+        this._setRaw(row, field.raw);
+    };
+
+    // Stores a cell read straight from the source data
+    setSourceCell(row, offset, length) {
+        this.present[row] = 1;
+        this.rawOffsets[row] = offset;
+        this.rawLengths[row] = length;
+
+        if (this.type === FIELD_TYPE_INT) {
+            this._storeInt(row, utilService.readModifiedLebCompressedInteger(this.store.source.subarray(offset, offset + length)));
+        }
+        else if (this.type === FIELD_TYPE_FLOAT) {
+            this.values[row] = this.store.source.readFloatBE(offset);
+        }
+    };
+
+    getValue(row) {
+        const field = this.fieldObjects.get(row);
+
+        if (field !== undefined) {
+            return field.value;
+        }
+
+        switch (this.type) {
+            case FIELD_TYPE_INT:
+            case FIELD_TYPE_FLOAT:
+                return this.values[row];
+            case FIELD_TYPE_STRING:
+                const str = this.getRaw(row).toString('utf8');
+                return str.substring(0, str.length - 1);
+        }
+    };
+
+    setValue(row, value) {
+        const field = this.fieldObjects.get(row);
+
+        if (field !== undefined) {
+            field.value = value;
+            return;
+        }
+
+        // Encode the value the same way a regular field would, and leave the cell alone if its bytes don't change
+        const currentRaw = this.getRaw(row);
+        const raw = TDB2Field.encodeValue(this.type, value, currentRaw);
+
+        if (raw === null || (currentRaw && raw.equals(currentRaw))) {
+            return;
+        }
+
+        this._setRaw(row, raw);
+        this.changed[row] = 1;
+    };
+
+    getRaw(row) {
+        const field = this.fieldObjects.get(row);
+
+        if (field !== undefined) {
+            return field.raw;
+        }
+
+        if (this.rawOffsets[row] === NO_OFFSET) {
+            return this.rawOverrides.get(row);
+        }
+
+        return this.store.source.subarray(this.rawOffsets[row], this.rawOffsets[row] + this.rawLengths[row]);
+    };
+
+    setRaw(row, raw) {
+        const field = this.fieldObjects.get(row);
+
+        if (field !== undefined) {
+            field.raw = raw;
+            return;
+        }
+
+        this._setRaw(row, raw);
+    };
+
+    isChanged(row) {
+        const field = this.fieldObjects.get(row);
+        return field !== undefined ? field.isChanged || (field.value !== null && field.value.isChanged === true) : this.changed[row] === 1;
+    };
+
+    setChanged(row, isChanged) {
+        const field = this.fieldObjects.get(row);
+
+        if (field !== undefined) {
+            field.isChanged = isChanged;
+            return;
+        }
+
+        this.changed[row] = isChanged ? 1 : 0;
+    };
+
+    _setRaw(row, raw) {
+        const sourceOffset = this.store.getSourceOffset(raw);
+
+        if (sourceOffset === NO_OFFSET) {
+            this.rawOverrides.set(row, raw);
+        }
+        else {
+            this.rawOverrides.delete(row);
+        }
+
+        this.rawOffsets[row] = sourceOffset;
+        this.rawLengths[row] = raw.length;
+
+        if (this.type === FIELD_TYPE_INT) {
+            this._storeInt(row, utilService.readModifiedLebCompressedInteger(raw));
+        }
+        else if (this.type === FIELD_TYPE_FLOAT) {
+            this.values[row] = raw.readFloatBE(0);
+        }
+    };
+
+    _storeInt(row, value) {
+        // Switch to doubles the first time a value doesn't fit in 32 bits
+        if (this.values instanceof Int32Array && (value | 0) !== value) {
+            this.values = Float64Array.from(this.values);
+        }
+
+        this.values[row] = value;
+    };
+};
+
+// Columnar storage for the records of a parsed TDB2 table. Records and fields become thin views over
+// one typed array per int and float field, with the raw bytes of each cell kept as an offset into the source data.
+class TDB2ColumnStore {
+    constructor(fieldDefinitions, source, numRows) {
+        this._source = source;
+        this._fieldDefinitions = fieldDefinitions;
+        this._numRows = numRows;
+        this._columns = new Map();
+        this._indices = new Float64Array(numRows);
+        this._recordOffsets = new Uint32Array(numRows).fill(NO_OFFSET);
+        this._recordLengths = new Uint32Array(numRows);
+        this._records = null;
+    };
+
+    // Builds a store from the records of an already parsed table
+    static fromTable(table, source) {
+        const store = new TDB2ColumnStore(table.fieldDefinitions, source, table.records.length);
+
+        table.records.forEach((record, row) => {
+            const fields = record.fields;
+
+            for (const key in fields) {
+                store.setCell(row, fields[key]);
+            }
+
+            store.setIndex(row, record.index);
+            store.setRecordRaw(row, record.raw);
+        });
+
+        return store;
+    };
+
+    // Rebuilds a store from toTransferable() data posted by another thread. 'source' has to be the same data
+    // the store was built over (e.g. both views of one SharedArrayBuffer).
+    static fromTransferable(data, source) {
+        const store = new TDB2ColumnStore(data.fieldDefinitions, source, 0);
+        store._numRows = data.numRows;
+        store._indices = data.indices;
+        store._recordOffsets = data.recordOffsets;
+        store._recordLengths = data.recordLengths;
+
+        data.columns.forEach((columnData) => {
+            const column = new TDB2Column(store, columnData.key, columnData.type, Buffer.from(columnData.rawKey), 0);
+            column.present = columnData.present;
+            column.changed = columnData.changed;
+            column.rawOffsets = columnData.rawOffsets;
+            column.rawLengths = columnData.rawLengths;
+            column.values = columnData.values;
+
+            columnData.rawOverrides.forEach(([row, raw]) => {
+                column.rawOverrides.set(row, Buffer.from(raw.buffer, raw.byteOffset, raw.length));
+            });
+
+            store._columns.set(column.key, column);
+        });
+
+        return store;
+    };
+
+    // Plain data for posting the store to another thread, and the list of buffers to transfer with it.
+    // Returns null if any cell is a field object (like a subtable), since those can't be posted.
+    toTransferable() {
+        const columns = [];
+        const transferList = [this._indices.buffer, this._recordOffsets.buffer, this._recordLengths.buffer];
+
+        for (const column of this._columns.values()) {
+            if (column.fieldObjects.size > 0) {
+                return null;
+            }
+
+            columns.push({
+                key: column.key,
+                type: column.type,
+                rawKey: [...column.rawKey],
+                present: column.present,
+                changed: column.changed,
+                rawOffsets: column.rawOffsets,
+                rawLengths: column.rawLengths,
+                values: column.values,
+                rawOverrides: [...column.rawOverrides].map(([row, raw]) => [row, Uint8Array.from(raw)])
+            });
+
+            transferList.push(column.present.buffer, column.changed.buffer, column.rawOffsets.buffer, column.rawLengths.buffer);
+
+            if (column.values !== null) {
+                transferList.push(column.values.buffer);
+            }
+        }
+
+        return {
+            data: {
+                fieldDefinitions: this._fieldDefinitions,
+                numRows: this._numRows,
+                indices: this._indices,
+                recordOffsets: this._recordOffsets,
+                recordLengths: this._recordLengths,
+                columns: columns
+            },
+            transferList: transferList
+        };
+    };
+
+    get source() {
+        return this._source;
+    };
+
+    get fieldDefinitions() {
+        return this._fieldDefinitions;
+    };
+
+    get numRows() {
+        return this._numRows;
+    };
+
+    // Views over every row, in the order the records were read
+    get records() {
+        if (this._records === null) {
+            this._records = [];
+
+            for (let row = 0; row < this._numRows; row++) {
+                this._records.push(this._createRecordView(row, this._indices[row]));
+            }
+        }
+
+        return this._records;
+    };
+
+    get columnKeys() {
+        return [...this._columns.keys()];
+    };
+
+    getColumn(key) {
+        return this._columns.get(key);
+    };
+
+    addColumn(key, type, rawKey) {
+        const column = new TDB2Column(this, key, type, rawKey, this._numRows);
+        this._columns.set(key, column);
+        return column;
+    };
+
+    // Stores a field object's value in its column
+    setCell(row, field) {
+        let column = this._columns.get(field.key);
+
+        if (column === undefined) {
+            column = this.addColumn(field.key, field.type, field.rawKey);
+        }
+
+        column.setCell(row, field);
+    };
+
+    setIndex(row, index) {
+        this._indices[row] = index;
+    };
+
+    hasCell(key, row) {
+        const column = this._columns.get(key);
+        return column !== undefined && column.present[row] === 1;
+    };
+
+    getValue(key, row) {
+        return this.hasCell(key, row) ? this._columns.get(key).getValue(row) : undefined;
+    };
+
+    setValue(key, row, value) {
+        if (!this.hasCell(key, row)) {
+            throw new Error(`Record ${row} has no field '${key}'.`);
+        }
+
+        this._columns.get(key).setValue(row, value);
+    };
+
+    // Returns the field view for a cell, or the field object for cells that aren't stored in columns
+    getField(key, row) {
+        if (!this.hasCell(key, row)) {
+            return undefined;
+        }
+
+        const column = this._columns.get(key);
+        const field = column.fieldObjects.get(row);
+        return field !== undefined ? field : new TDB2ColumnField(column, row);
+    };
+
+    // Values of one field for every row (undefined where a record doesn't have the field)
+    getColumnValues(key) {
+        const column = this._columns.get(key);
+        const values = new Array(this._numRows);
+
+        if (column === undefined) {
+            return values;
+        }
+
+        for (let row = 0; row < this._numRows; row++) {
+            values[row] = column.present[row] === 1 ? column.getValue(row) : undefined;
+        }
+
+        return values;
+    };
+
+    // Sets one field for several rows at once. 'values' lines up with 'rows'.
+    setColumnValues(key, rows, values) {
+        for (let i = 0; i < rows.length; i++) {
+            this.setValue(key, rows[i], values[i]);
+        }
+    };
+
+    // Plain key/value object of a row's fields, leaving out subtables. keys (a Set) limits it to those fields.
+    getRowValues(row, keys) {
+        const rowValues = {};
+
+        this._columns.forEach((column, key) => {
+            if (column.present[row] === 1 && (!keys || keys.has(key))) {
+                const value = column.getValue(row);
+
+                if (typeof value !== 'object' || value === null) {
+                    rowValues[key] = value;
+                }
+            }
+        });
+
+        return rowValues;
+    };
+
+    getRowFields(row) {
+        const fields = {};
+
+        this._columns.forEach((column, key) => {
+            if (column.present[row] === 1) {
+                fields[key] = this.getField(key, row);
+            }
+        });
+
+        return fields;
+    };
+
+    isRowChanged(row) {
+        for (const column of this._columns.values()) {
+            if (column.present[row] === 1 && column.isChanged(row)) {
+                return true;
+            }
+        }
+
+        return false;
+    };
+
+    getRecordRaw(row) {
+        if (this._recordOffsets[row] === NO_OFFSET) {
+            return null;
+        }
+
+        return this._source.subarray(this._recordOffsets[row], this._recordOffsets[row] + this._recordLengths[row]);
+    };
+
+    setRecordRaw(row, raw) {
+        const sourceOffset = raw ? this.getSourceOffset(raw) : NO_OFFSET;
+        this.setRecordSourceRange(row, sourceOffset, sourceOffset === NO_OFFSET ? 0 : raw.length);
+    };
+
+    setRecordSourceRange(row, offset, length) {
+        this._recordOffsets[row] = offset;
+        this._recordLengths[row] = length;
+    };
+
+    // Offset of 'buf' in the source data, or NO_OFFSET if it isn't a view into it
+    getSourceOffset(buf) {
+        const source = this._source;
+
+        if (!buf || source === null || buf.buffer !== source.buffer) {
+            return NO_OFFSET;
+        }
+
+        const offset = buf.byteOffset - source.byteOffset;
+        return offset >= 0 && offset + buf.length <= source.length ? offset : NO_OFFSET;
+    };
+
+    _createRecordView(row, index) {
+        const store = this;
+        const record = new TDB2ColumnRecord(this, row);
+        record.index = index;
+
+        return new Proxy(record, {
+            get: function (target, prop, receiver) {
+                if (typeof prop === 'string' && store.hasCell(prop, row)) {
+                    return store.getValue(prop, row);
+                }
+
+                return record[prop] !== undefined ? record[prop] : null;
+            },
+            set: function (target, prop, receiver) {
+                if (typeof prop === 'string' && store.hasCell(prop, row)) {
+                    store.setValue(prop, row, receiver);
+                }
+                else {
+                    record[prop] = receiver;
+                }
+
+                return true;
+            }
+        });
+    };
+};
+
+module.exports = TDB2ColumnStore;
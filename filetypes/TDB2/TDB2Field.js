@@ -69,30 +69,52 @@ class TDB2Field {
     };
 
     set value(value) {
+        // Setting a field to the value it already has doesn't change it, so the record can still be written from its original bytes
+        if (this.type === FIELD_TYPE_SUBTABLE || this.type === FIELD_TYPE_SUBTABLE_COMPRESSED) {
+            if (value !== this._value) {
+                this._isChanged = true;
+                this._value = value;
+            }
+            return;
+        }
+
+        const raw = TDB2Field.encodeValue(this.type, value, this._raw);
+
+        if (raw === null || (this._raw && raw.equals(this._raw))) {
+            return;
+        }
+
         this._isChanged = true;
+        this._raw = raw;
 
-        switch(this.type) {
+        if (this.type === FIELD_TYPE_STRING) {
+            this.length = raw.length;
+        }
+    };
+
+    // Raw bytes of a value of an int, string or float field, or null for field types without a value.
+    // An int whose previous bytes had an extra zero after the number (UNWI, TREF) keeps it.
+    static encodeValue(type, value, previousRaw) {
+        switch(type) {
             case FIELD_TYPE_INT:
-                this._raw = utilService.writeModifiedLebCompressedInteger(value);
-                break;
+                const number = utilService.writeModifiedLebCompressedInteger(value);
+                const numberLength = previousRaw ? utilService.getModifiedLebLength(previousRaw) : 0;
+                return previousRaw && previousRaw.length > numberLength ? Buffer.concat([number, previousRaw.subarray(numberLength)]) : number;
             case FIELD_TYPE_STRING:
                 let strHexArray = value.split('').map((char) => {
                     return char.charCodeAt(0);
                 });
 
                 strHexArray.push(0x0);
-                this.length = strHexArray.length;
-
-                this._raw = Buffer.from(strHexArray);
-                break;
-            case FIELD_TYPE_SUBTABLE:
-            case FIELD_TYPE_SUBTABLE_COMPRESSED:
-                this._value = value;
-                break
+                return Buffer.from(strHexArray);
             case FIELD_TYPE_FLOAT:
-                this._raw.writeFloatBE(value, 0);
-                break;
+                // New buffer, since the raw bytes can be a view into the parsed data
+                const raw = Buffer.alloc(4);
+                raw.writeFloatBE(value, 0);
+                return raw;
         }
+
+        return null;
     };
 
     get raw() {
@@ -1,19 +1,28 @@
 const TDB2Table = require('./TDB2Table');
 const TDB2Field = require('./TDB2Field');
 
+const FIELD_TYPE_SUBTABLE = 4;
+const FIELD_TYPE_SUBTABLE_COMPRESSED = 5;
+
 class TDB2Record {
     constructor() {
         this[Symbol.toStringTag] = 'TDB2Record';
         this._fields = {};
         this._parentRecord = null;
         this._subRecord = null;
+        this._compressedRaw = null;
+        this._loader = null;
+        this._offset = -1;
+        this._raw = null;
     };
 
     get fields() {
+        this._load();
         return this._fields;
     };
 
     set fields(fields) {
+        this._loader = null;
         this._fields = fields;
     };
 
@@ -26,6 +35,7 @@ class TDB2Record {
     };
 
     get subRecord() {
+        this._load();
         return this._subRecord;
     };
 
@@ -45,8 +55,80 @@ class TDB2Record {
         this._parentRecord = parentRecord;
     };
 
+    // Offset of the record's field data in the decompressed file
+    get offset() {
+        return this._offset;
+    };
+
+    set offset(offset) {
+        this._offset = offset;
+    };
+
+    // Original bytes of the record's field data (including the terminator), used to write the record back unchanged
+    get raw() {
+        return this._raw;
+    };
+
+    set raw(raw) {
+        this._raw = raw;
+    };
+
+    // Compressed bytes the record was read from, when it came from a compressed record table
+    get compressedRaw() {
+        return this._compressedRaw;
+    };
+
+    // Drops the original bytes once they no longer describe the record's fields
+    discardRaw() {
+        this._raw = null;
+
+        if (this.isLoaded) {
+            this._compressedRaw = null;
+        }
+    };
+
+    // True if a field of this record, its subrecord or any of its subtables changed since it was read
+    get isChanged() {
+        if (!this.isLoaded) {
+            return false;
+        }
+
+        for (const key in this._fields) {
+            const field = this._fields[key];
+
+            if (field.isChanged) {
+                return true;
+            }
+
+            if ((field.type === FIELD_TYPE_SUBTABLE || field.type === FIELD_TYPE_SUBTABLE_COMPRESSED) && field.value && field.value.isChanged) {
+                return true;
+            }
+        }
+
+        return this._subRecord !== null && this._subRecord.isChanged;
+    };
+
+    // False until a lazily loaded record has had its fields decompressed
+    get isLoaded() {
+        return this._loader === null;
+    };
+
+    // Defers reading the record's fields until they are first accessed
+    setLazyLoader(compressedRaw, loader) {
+        this._compressedRaw = compressedRaw;
+        this._loader = loader;
+    };
+
+    _load() {
+        if (this._loader !== null) {
+            const loader = this._loader;
+            this._loader = null;
+            loader(this);
+        }
+    };
+
     getFieldByKey(key) {
-        return this._fields[key];
+        return this.fields[key];
     };
 
     // Returns a deep copy of the current record
@@ -60,8 +142,9 @@ class TDB2Record {
             const copy = new TDB2Record();
             copy._fields = {};
             cache.set(record, copy);
-            for (const key in record._fields) {
-                copy._fields[key] = this.deepCopyRecord(record._fields[key], cache, false);
+            const fields = record.fields;
+            for (const key in fields) {
+                copy._fields[key] = this.deepCopyRecord(fields[key], cache, false);
             }
             copy._index = record._index;
             if (isTopLevel) {
@@ -13,6 +13,9 @@ class TDB2Table {
         this._isSubTable = false;
         this._parentInfo = null;
         this._fieldDefinitions = [];
+        this._rawData = null;
+        this._isChanged = false;
+        this._columnStore = null;
     };
 
     get name() {
@@ -68,6 +71,7 @@ class TDB2Table {
     };
 
     set numEntries(num) {
+        this._isChanged = true;
         this._numEntries = num;
         this._numEntriesRaw = utilService.writeModifiedLebCompressedInteger(num);
     };
@@ -108,6 +112,35 @@ class TDB2Table {
         this._fieldDefinitions = fieldDefinitions;
     };
 
+    // Raw bytes of a table that was skipped while parsing (no records are built for it)
+    get rawData() {
+        return this._rawData;
+    };
+
+    set rawData(rawData) {
+        this._rawData = rawData;
+    };
+
+    get isSkipped() {
+        return this._rawData !== null;
+    };
+
+    // Column storage backing the table's records when it was parsed in columnar mode.
+    // Setting it replaces the records with the store's record views.
+    get columnStore() {
+        return this._columnStore;
+    };
+
+    set columnStore(columnStore) {
+        this._columnStore = columnStore;
+        this._records = columnStore.records.slice();
+    };
+
+    // True if records were added or removed, or any record changed since the table was read
+    get isChanged() {
+        return this._isChanged || this._records.some((record) => record.isChanged);
+    };
+
     // Adds newRecord to the table 
     addRecord(newRecord) {
         // If we're working with a keyed record table, we need to make sure the key doesn't exist already
@@ -1,7 +1,6 @@
 const fs = require('fs');
 const zlib = require('zlib');
-const pipeline = require('stream').pipeline;
-const utilService = require('../services/utilService');
+const { pipeline, Transform } = require('stream');
 
 const CRC = require('../services/CRC');
 const CRC32 = require('crc-32');
@@ -11,6 +10,7 @@ const TDBWriter = require('../streams/TDBWriter');
 
 const TDB2Parser = require('../streams/TDB2/TDB2Parser');
 const TDB2Writer = require('../streams/TDB2/TDB2Writer');
+const TDB2ParallelParser = require('../streams/TDB2/TDB2ParallelParser');
 
 class MaddenRosterHelper {
     constructor() {
@@ -22,7 +22,12 @@ class MaddenRosterHelper {
         this._headerBuffer = null;
     };
 
-    load(filePath) {
+    // options.tables: optional list of TDB2 table names to parse. Every other table is kept as raw bytes
+    // and written back unchanged on save. Ignored for pre-2021 files.
+    // options.columnar: store the parsed TDB2 tables in columns (see TDB2ColumnStore). Ignored for pre-2021 files.
+    // options.parallel: parse large TDB2 tables on worker threads (see TDB2ParallelParser). Tables are always
+    // columnar in this mode. Ignored for pre-2021 files.
+    load(filePath, options = {}) {
         const self = this;
         this._filePath = filePath;
 
@@ -54,25 +59,15 @@ class MaddenRosterHelper {
             function readTdb2Stream(fd, dataStart) {
                 const stream = fs.createReadStream(null, { fd: fd, start: dataStart });
 
-                let postStreamFunctions = [];
-
                 if (self._year >= 2021) {
-                    self._parser = new TDB2Parser();
-                    postStreamFunctions = [
-                        zlib.createInflate(),
-                        self._parser
-                    ];
-                }
-                else {
-                    self._parser = new TDBParser();
-                    postStreamFunctions = [
-                        self._parser
-                    ];
+                    return readInflatedTdb2Stream(stream);
                 }
+
+                self._parser = new TDBParser();
                 
                 pipeline(
                     stream,
-                    ...postStreamFunctions,
+                    self._parser,
                     (err) => {
                         if (err) {
                             reject(err);
@@ -83,88 +78,183 @@ class MaddenRosterHelper {
                     }
                 )
             };
+
+            function readInflatedTdb2Stream(stream) {
+                // The data is inflated once and parsed straight from the buffer, which also lets the parser
+                // skip tables that weren't requested and keep each record's original bytes for the writer
+                const inflatedBuffers = [];
+                const inflate = zlib.createInflate();
+                inflate.on('data', (buf) => {
+                    inflatedBuffers.push(buf);
+                });
+
+                pipeline(
+                    stream,
+                    inflate,
+                    (err) => {
+                        if (err) {
+                            reject(err);
+                            return;
+                        }
+
+                        if (options.parallel) {
+                            return readTdb2Parallel(inflatedBuffers);
+                        }
+
+                        const source = Buffer.concat(inflatedBuffers);
+                        self._parser = new TDB2Parser({ tables: options.tables, source: source, columnar: options.columnar });
+
+                        try {
+                            self._file = self._parser.parseBuffer(source);
+                        }
+                        catch (parseErr) {
+                            reject(parseErr);
+                            return;
+                        }
+
+                        resolve(self._file);
+                    }
+                )
+            };
+
+            function readTdb2Parallel(inflatedBuffers) {
+                // The worker threads read the data from shared memory, so the inflated chunks are joined into a SharedArrayBuffer
+                const totalLength = inflatedBuffers.reduce((length, buf) => length + buf.length, 0);
+                const source = Buffer.from(new SharedArrayBuffer(totalLength));
+                let offset = 0;
+
+                inflatedBuffers.forEach((buf) => {
+                    buf.copy(source, offset);
+                    offset += buf.length;
+                });
+
+                self._parser = new TDB2ParallelParser({ tables: options.tables });
+
+                Promise.resolve()
+                    .then(() => self._parser.parse(source))
+                    .then((file) => {
+                        self._file = file;
+                        resolve(self._file);
+                    })
+                    .catch(reject);
+            };
         });
     };
 
-    save(outputFile) {
-        const self = this;
+    // options.compressionLevel: zlib level used for 2021+ rosters (defaults to 9)
+    save(outputFile, options = {}) {
+        const saveDestination = outputFile ? outputFile : this._filePath;
 
-        return new Promise((resolve, reject) => {
-            const saveDestination = outputFile ? outputFile : this._filePath;
-
-            const cloneFilePromise = new Promise((resolve, reject) => {
-                if (outputFile) {
-                    pipeline(
-                        fs.createReadStream(this._filePath),
-                        fs.createWriteStream(outputFile),
-                        (err) => {
-                            if (err) {
-                                reject(err);
-                            }
-                            resolve();
-                        }
-                    )
-                }
-                else {
-                    resolve();
-                }
+        // Everything is written to a temp file next to the destination and renamed over it at the end,
+        // so a failed save never leaves a half-written roster behind
+        const tempPath = `${saveDestination}.${process.pid}.tmp`;
+
+        const writeData = this._year >= 2021 ? this._writeTdb2Data(tempPath, options) : this._writeTdbData(tempPath);
+
+        return writeData
+            .then((dataEnd) => this._copyOriginalTail(tempPath, dataEnd))
+            .then(() => this._replaceWithTempFile(tempPath, saveDestination))
+            .catch((err) => {
+                return fs.promises.rm(tempPath, { force: true }).then(() => {
+                    throw err;
+                });
             });
+    };
 
-            cloneFilePromise.then(() => {
-                let writer;
+    // Streams the writer output through the CRC and deflate into the temp file, after the header.
+    // Resolves with the end offset of the written data.
+    _writeTdb2Data(tempPath, options) {
+        const compressionLevel = options.compressionLevel !== undefined ? options.compressionLevel : 9;
+        const headerLength = this._headerBuffer.length;
+        const crc = new CRC();
+        let crcValue = 0;
+        let uncompressedLength = 0;
 
-                if (this._year >= 2021) {
-                    writer = new TDB2Writer(this._file);
-                    let dataBuffers = [];
-                    
-                    writer.on('end', () => {
-                        const buffer = Buffer.concat(dataBuffers);
-                        zlib.deflate(buffer, { level: 9 }, (err, result) => {
-                            if (err) {
-                                reject(err);
-                            }
-
-                            let crc = new CRC();
-                            const newCrc = utilService.toUint32(utilService.toUint32(~crc.crc32_be(0, buffer, buffer.length)) ^ 0xFFFFFFFF);
-                            this._headerBuffer.writeUInt32LE(newCrc, 0x1A);
-                            this._headerBuffer.writeUInt32LE(buffer.length, 0x12);
-
-                            writeFile(result);
-                        });
-                    });
+        const checksum = new Transform({
+            transform(chunk, encoding, callback) {
+                crcValue = crc.crc32_be(crcValue, chunk, chunk.length);
+                uncompressedLength += chunk.length;
+                callback(null, chunk);
+            }
+        });
 
-                    writer.on('data', (buf) => {
-                        dataBuffers.push(buf);
-                    });
+        const output = fs.createWriteStream(tempPath, { start: headerLength });
+
+        return new Promise((resolve, reject) => {
+            pipeline(
+                new TDB2Writer(this._file),
+                checksum,
+                zlib.createDeflate({ level: compressionLevel }),
+                output,
+                (err) => {
+                    if (err) {
+                        reject(err);
+                        return;
+                    }
 
+                    this._headerBuffer.writeUInt32LE(crcValue, 0x1A);
+                    this._headerBuffer.writeUInt32LE(uncompressedLength, 0x12);
+                    resolve(headerLength + output.bytesWritten);
                 }
-                else {
-                    let dataBuffers = [];
-                    writer = new TDBWriter(this._file);
+            );
+        });
+    };
 
-                    writer.on('end', () => {
-                        writeFile(Buffer.concat(dataBuffers));
-                    });
+    _writeTdbData(tempPath) {
+        const headerLength = this._headerBuffer.length;
+        const output = fs.createWriteStream(tempPath, { start: headerLength });
 
-                    writer.on('data', (buf) => {
-                        dataBuffers.push(buf);
-                    });
+        return new Promise((resolve, reject) => {
+            pipeline(
+                new TDBWriter(this._file),
+                output,
+                (err) => {
+                    if (err) {
+                        reject(err);
+                        return;
+                    }
+
+                    resolve(headerLength + output.bytesWritten);
                 }
+            );
+        });
+    };
+
+    // Saving used to overwrite a copy of the original file in place, which kept any of its bytes past
+    // the end of the new data. Carry those over so the output stays the same.
+    _copyOriginalTail(tempPath, dataEnd) {
+        return fs.promises.stat(this._filePath).then((stats) => {
+            if (stats.size <= dataEnd) {
+                return;
+            }
 
-                function writeFile(dataBuffer) {
-                    const fileBuffer = Buffer.concat([self._headerBuffer, dataBuffer]);
-                    fs.writeFile(saveDestination, fileBuffer, { flag: 'r+' }, (err) => {
+            return new Promise((resolve, reject) => {
+                pipeline(
+                    fs.createReadStream(this._filePath, { start: dataEnd }),
+                    fs.createWriteStream(tempPath, { flags: 'r+', start: dataEnd }),
+                    (err) => {
                         if (err) {
                             reject(err);
+                            return;
                         }
 
                         resolve();
-                    });
-                };
+                    }
+                );
             });
         });
     };
 
+    _replaceWithTempFile(tempPath, saveDestination) {
+        return fs.promises.open(tempPath, 'r+').then((handle) => {
+            return handle.write(this._headerBuffer, 0, this._headerBuffer.length, 0)
+                .then(() => handle.sync())
+                .finally(() => handle.close());
+        }).then(() => {
+            return fs.promises.rename(tempPath, saveDestination);
+        });
+    };
+
     get filePath() {
         return this._filePath;
     };
@@ -1,61 +1,127 @@
-const MaddenRosterHelper = require('madden-file-tools/helpers/MaddenRosterHelper');
+const os = require('os');
+
+// TDB2Writer gzips compressed records on the libuv threadpool; size it to the machine before any async I/O starts
+if (!process.env.UV_THREADPOOL_SIZE) {
+    process.env.UV_THREADPOOL_SIZE = String(Math.max(4, Math.min(os.cpus().length, 128)));
+}
+
 const fs = require('fs');
 const path = require('path');
 
+// Run from a madden-file-tools checkout, use that checkout's code rather than the published package
+// in node_modules; the bundled app ships only this script and node_modules, so it uses the package
+const TOOLS_ROOT = fs.existsSync(path.join(__dirname, 'helpers', 'MaddenRosterHelper.js')) ? __dirname : 'madden-file-tools';
+
+const MaddenRosterHelper = require(`${TOOLS_ROOT}/helpers/MaddenRosterHelper`);
+const TDB2ColumnRecord = require(`${TOOLS_ROOT}/filetypes/TDB2/TDB2ColumnRecord`);
+
+// Only these tables are parsed into records; the rest of the roster is carried through untouched
+const ROSTER_TABLES = ['PLAY', 'PSAL', 'INJY', 'TEAM', 'DCHT', 'BLOB'];
+
 const DEBUG_WRITE_FILES = false; 
 const DEBUG_OUTPUT_DIR = 'debug_output';
 
+// Per-stage timing/memory report, read back by the Python side from stderr
+const PROFILE_PREFIX = 'MREP_PROFILE ';
+const profileStages = [];
+let profileStageStart = process.hrtime.bigint();
+
+function markStage(stageName) {
+    const now = process.hrtime.bigint();
+    const memory = process.memoryUsage();
+    profileStages.push({
+        stage: stageName,
+        seconds: Number(now - profileStageStart) / 1e9,
+        rssMb: memory.rss / (1024 * 1024),
+        // Highest RSS of the process so far; maxRSS is in kilobytes
+        peakRssMb: process.resourceUsage().maxRSS / 1024,
+        heapUsedMb: memory.heapUsed / (1024 * 1024)
+    });
+    profileStageStart = now;
+}
+
+function reportProfile() {
+    if (PROFILE_ENABLED) {
+        console.error(PROFILE_PREFIX + JSON.stringify(profileStages));
+    }
+}
+
 function findTableByName(file, tableName) {
     if (!file || !file._tables) return null;
     return file._tables.find(table => table.name === tableName);
 }
 
-function simplifyRecord(record) {
+// Copies the plain values of a record's fields, or only the ones in the fields Set when it's given
+function copyFieldValues(target, recordFields, fields) {
+    for (const key in recordFields) {
+        if (fields && !fields.has(key)) continue;
+        const value = recordFields[key].value;
+        if (typeof value !== 'object' || value === null) {
+            target[key] = value;
+        }
+    }
+}
+
+function simplifyRecord(record, fields) {
     const simpleFields = {};
     if (!record) return simpleFields;
 
-    if (record._fields) {
-        for (const key in record._fields) {
-            const value = record._fields[key].value;
-            if (typeof value !== 'object' || value === null) {
-                simpleFields[key] = value;
-            }
-        }
+    // Records of a columnar table are read straight out of the column store
+    if (record instanceof TDB2ColumnRecord) {
+        return record.store.getRowValues(record.row, fields);
+    }
+
+    // 'fields' rather than '_fields' so lazily loaded (compressed) records get decompressed
+    if (record.fields) {
+        copyFieldValues(simpleFields, record.fields, fields);
     }
 
     if (record.CharacterVisuals && record.CharacterVisuals._fields) {
-        for (const key in record.CharacterVisuals._fields) {
-            const value = record.CharacterVisuals._fields[key].value;
-            if (typeof value !== 'object' || value === null) {
-                simpleFields[key] = value;
-            }
-        }
+        copyFieldValues(simpleFields, record.CharacterVisuals._fields, fields);
     }
 
     if (record.PlayerRatings && record.PlayerRatings._fields) {
-        for (const key in record.PlayerRatings._fields) {
-            const value = record.PlayerRatings._fields[key].value;
-            if (typeof value !== 'object' || value === null) {
-                simpleFields[key] = value;
-            }
-        }
+        copyFieldValues(simpleFields, record.PlayerRatings._fields, fields);
     }
     
     return simpleFields;
 }
 
-function readRoster(filePath) {
+// 'read' options: --tables PLAY,TEAM reads only those tables, and --fields PLAY=PGID,PFNA (repeatable)
+// serializes only those fields of a table. Without them every table in ROSTER_TABLES is read in full.
+function parseReadOptions(optionArgs) {
+    const options = { tables: ROSTER_TABLES, fields: {} };
+
+    for (let i = 0; i < optionArgs.length; i++) {
+        const value = optionArgs[i + 1] || '';
+        if (optionArgs[i] === '--tables') {
+            options.tables = value.split(',').map(name => name.trim().toUpperCase()).filter(name => name);
+            i++;
+        }
+        else if (optionArgs[i] === '--fields') {
+            const [tableName, fieldList] = value.split('=');
+            options.fields[tableName.trim().toUpperCase()] = new Set((fieldList || '').split(',').map(key => key.trim()).filter(key => key));
+            i++;
+        }
+    }
+
+    return options;
+}
+
+function readRoster(filePath, options = parseReadOptions([])) {
     if (!fs.existsSync(filePath)) {
         console.error(`Error reading roster: Input file not found: ${filePath}`);
         process.exit(1);
     }
 
     const helper = new MaddenRosterHelper();
-    const tablesToRead = ['PLAY', 'PSAL', 'INJY', 'TEAM', 'DCHT', 'BLOB'];
+    const tablesToRead = options.tables;
     const output = {};
 
-    helper.load(filePath)
+    helper.load(filePath, { tables: tablesToRead, columnar: true, parallel: true })
         .then(file => {
+            markStage('parse roster');
+
             if (DEBUG_WRITE_FILES) {
                 if (!fs.existsSync(DEBUG_OUTPUT_DIR)) fs.mkdirSync(DEBUG_OUTPUT_DIR);
                 console.error(`DEBUG: Writing table data to '${DEBUG_OUTPUT_DIR}'...`);
@@ -64,7 +130,8 @@ function readRoster(filePath) {
             tablesToRead.forEach(tableName => {
                 const table = findTableByName(file, tableName);
                 if (table && table.records) {
-                    const simplifiedRecords = table.records.map(simplifyRecord);
+                    const fields = options.fields[tableName];
+                    const simplifiedRecords = table.records.map(record => simplifyRecord(record, fields));
                     const key = tableName.toLowerCase(); 
                     output[key] = simplifiedRecords;
 
@@ -76,8 +143,13 @@ function readRoster(filePath) {
                     }
                 }
             });
-            
-            console.log(JSON.stringify(output));
+            markStage('simplify records');
+
+            const json = JSON.stringify(output);
+            markStage('serialize json');
+
+            console.log(json);
+            reportProfile();
         })
         .catch(error => {
             console.error(`Error reading roster: ${error.message}`);
@@ -94,8 +166,11 @@ async function writeRoster(originalFilePath, newFilePath) {
     try {
         const stdinData = await readStdin();
         const incomingData = JSON.parse(stdinData);
+        markStage('parse stdin json');
 
-        await helper.load(originalFilePath);
+        const tablesToWrite = [...new Set([...ROSTER_TABLES, ...Object.keys(incomingData).map(key => key.toUpperCase())])];
+        await helper.load(originalFilePath, { tables: tablesToWrite, columnar: true, parallel: true });
+        markStage('parse roster');
 
         for (const key in incomingData) {
             const tableName = key.toUpperCase();
@@ -107,8 +182,9 @@ async function writeRoster(originalFilePath, newFilePath) {
                     const recordToUpdate = table.records[index];
                     if (recordToUpdate) {
                         for (const fieldKey in newRecord) {
-                            if (recordToUpdate._fields[fieldKey]) {
-                                recordToUpdate._fields[fieldKey].value = newRecord[fieldKey];
+                            const fieldToUpdate = recordToUpdate.getFieldByKey(fieldKey);
+                            if (fieldToUpdate) {
+                                fieldToUpdate.value = newRecord[fieldKey];
                             }
                             else if (recordToUpdate.CharacterVisuals && recordToUpdate.CharacterVisuals._fields[fieldKey]) {
                                 recordToUpdate.CharacterVisuals._fields[fieldKey].value = newRecord[fieldKey];
@@ -126,8 +202,13 @@ async function writeRoster(originalFilePath, newFilePath) {
             }
         }
 
+        markStage('apply changes');
+
         await helper.save(newFilePath);
+        markStage('write roster');
+
         console.log("Roster saved successfully.");
+        reportProfile();
     } catch (error) {
         console.error(`Error writing roster: ${error.message}`);
         process.exit(1);
@@ -135,8 +216,9 @@ async function writeRoster(originalFilePath, newFilePath) {
 }
 
 function readStdin() { return new Promise((resolve, reject) => { let data = ''; process.stdin.setEncoding('utf8'); process.stdin.on('readable', () => { let chunk; while ((chunk = process.stdin.read()) !== null) { data += chunk; } }); process.stdin.on('end', () => { resolve(data); }); process.stdin.on('error', reject); }); }
-const args = process.argv.slice(2);
+const PROFILE_ENABLED = process.argv.includes('--profile');
+const args = process.argv.slice(2).filter(arg => arg !== '--profile');
 const command = args[0];
-if (command === 'read') { readRoster(args[1]); }
+if (command === 'read') { readRoster(args[1], parseReadOptions(args.slice(2))); }
 else if (command === 'write') { writeRoster(args[1], args[2]); }
 else { console.error(`Unknown command: '${command}'. Use 'read' or 'write'.`); }
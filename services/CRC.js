@@ -1,38 +1,44 @@
 const utilService = require('./utilService');
 
-class CRC {
-  constructor () {
-    this.CRCPOLY_BE = 0x04c11db7
-    let crc = 0x80000000
+const CRCPOLY_BE = 0x04c11db7;
 
-    let crcTableBe = [0]
+// Byte-at-a-time lookup table for the big-endian (MSB first) CRC-32, shared by every instance
+const CRC_TABLE_BE = (() => {
+  const table = new Uint32Array(256);
 
-    for (let i = 1; i < 1 << 4; i <<= 1) {
-      crc = (crc << 1) ^ (((crc & 0x80000000) != 0) ? this.CRCPOLY_BE : 0)
+  for (let i = 0; i < 256; i++) {
+    let crc = i << 24;
 
-      for (let j = 0; j < i; j++) {
-        crcTableBe[i + j] = crc ^ crcTableBe[j]
-      }
+    for (let bit = 0; bit < 8; bit++) {
+      crc = (crc & 0x80000000) !== 0 ? (crc << 1) ^ CRCPOLY_BE : crc << 1;
     }
 
-    this.crcTable = crcTableBe
+    table[i] = crc >>> 0;
+  }
+
+  return table;
+})();
+
+class CRC {
+  constructor () {
+    this.CRCPOLY_BE = CRCPOLY_BE
+    this.crcTable = CRC_TABLE_BE
   }
 
+  // The result can be passed back in as 'crc' to continue the checksum over the next chunk of data
   crc32_be (crc, p, len, start = 0) {
+    const table = this.crcTable
     let x = utilService.toUint32(start)
-    crc = utilService.toUint32(crc)
-    len = utilService.toUint32(len)
+    const end = x + utilService.toUint32(len)
 
-    crc = utilService.toUint32(crc ^ 0xFFFFFFFF)
+    crc = (crc ^ 0xFFFFFFFF) >>> 0
 
-    while (len-- > 0) {
-      crc = utilService.toUint32(crc ^ p[x++] << 24)
-      crc = utilService.toUint32(((crc << 4) >>> 0) ^ this.crcTable[crc >>> 28])
-      crc = utilService.toUint32(((crc << 4) >>> 0) ^ this.crcTable[crc >>> 28])
+    while (x < end) {
+      crc = ((crc << 8) ^ table[((crc >>> 24) ^ p[x++]) & 0xFF]) >>> 0
     }
 
-    return utilService.toUint32(crc ^ 0xFFFFFFFF)
+    return (crc ^ 0xFFFFFFFF) >>> 0
   }
 }
 
-module.exports = CRC;
\ No newline at end of file
+module.exports = CRC;
@@ -63,6 +63,83 @@ huffmanTreeParser.parseTree = (buf) => {
     return rootNode;
 };
 
+// Marks a decode table entry whose bits run into a missing node
+const INVALID_NODE = 0xFFFF;
+
+huffmanTreeParser.buildDecodeTable = (root) => {
+    // Walking the tree one bit at a time is slow, so decode a whole byte per step instead. A code can stop partway
+    // at the end of a byte, so there's a row of 256 entries for every internal node the byte can start on.
+    // Each entry has the characters that byte completes and the node it ends on.
+    const nodes = [root];
+    const nodeIds = new Map([[root, 0]]);
+
+    for (let i = 0; i < nodes.length; i++) {
+        [nodes[i].left, nodes[i].right].forEach((child) => {
+            if (child instanceof HuffmanNode && !nodeIds.has(child)) {
+                nodeIds.set(child, nodes.length);
+                nodes.push(child);
+            }
+        });
+    }
+
+    const nextNode = new Uint16Array(nodes.length * 256);
+    const output = new Array(nodes.length * 256);
+
+    nodes.forEach((startNode, nodeId) => {
+        for (let byte = 0; byte <= 0xFF; byte++) {
+            const entry = (nodeId << 8) | byte;
+            let text = '';
+            let currentNode = startNode;
+
+            for (let i = 7; i >= 0 && currentNode; i--) {
+                const nodeToLookAt = ((byte >> i) & 1) === 0 ? currentNode.left : currentNode.right;
+
+                if (nodeToLookAt instanceof HuffmanLeaf) {
+                    text += String.fromCharCode(nodeToLookAt.value);
+                    currentNode = root;
+                }
+                else {
+                    currentNode = nodeToLookAt;
+                }
+            }
+
+            output[entry] = text;
+            nextNode[entry] = currentNode ? nodeIds.get(currentNode) : INVALID_NODE;
+        }
+    });
+
+    return {
+        nextNode: nextNode,
+        output: output
+    };
+};
+
+huffmanTreeParser.decodeBuffer = (root, buf, valueLength) => {
+    // Same result as decodeBufferFromRoot, using the root's decode table
+    if (!root.decodeTable) {
+        root.decodeTable = huffmanTreeParser.buildDecodeTable(root);
+    }
+
+    const { nextNode, output } = root.decodeTable;
+    let decodedResult = '';
+    let nodeId = 0;
+
+    // Anything past valueLength is cut off anyway, so stop once there are enough characters
+    for (let i = 0; i < buf.length && decodedResult.length < valueLength; i++) {
+        const entry = (nodeId << 8) | buf[i];
+        nodeId = nextNode[entry];
+
+        if (nodeId === INVALID_NODE) {
+            // Malformed tree, let the tree walk handle (and report) it
+            return huffmanTreeParser.decodeBufferFromRoot(root, buf, valueLength);
+        }
+
+        decodedResult += output[entry];
+    }
+
+    return decodedResult.slice(0, valueLength);
+};
+
 huffmanTreeParser.decodeBufferFromRoot = (root, buf, valueLength) => {
     // Given a buffer to decode and a Huffman root node, decode the text inside the buffer.
     let decodedResult = '';
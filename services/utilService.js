@@ -3,6 +3,9 @@ const { BitView } = require('bit-buffer');
 
 let utilService = {};
 
+// Decoded TDB2 table/field keys, by their packed 3 byte value
+const sixBitKeyCache = new Map();
+
 utilService.intersection = function (arrayOfArrays) {
   return arrayOfArrays
       .reduce((acc,array,index) => { // Intersect arrays
@@ -245,14 +248,46 @@ utilService.getUncompressedTextFromSixBitCompression = function (data) {
   };
 };
 
+// Same result as getUncompressedTextFromSixBitCompression for a 3 byte (4 character) key, without allocating a BitView.
+// There are only a few hundred distinct keys in a file, so the decoded strings are cached.
+utilService.getSixBitKeyText = function (data, offset = 0) {
+  const packed = (data[offset] << 16) | (data[offset + 1] << 8) | data[offset + 2];
+  let text = sixBitKeyCache.get(packed);
+
+  if (text === undefined) {
+    text = String.fromCharCode(
+      (packed >>> 18) + 32,
+      ((packed >>> 12) & 0x3F) + 32,
+      ((packed >>> 6) & 0x3F) + 32,
+      (packed & 0x3F) + 32
+    );
+    sixBitKeyCache.set(packed, text);
+  }
+
+  return text;
+};
+
+// Number of bytes of the modified LEB number at the start of buf. Anything after it, like the
+// extra zero byte that follows UNWI and TREF values, isn't part of the number.
+utilService.getModifiedLebLength = function (buf) {
+  let length = Math.min(buf.length, 1);
+
+  while (length < buf.length && (buf[length - 1] & 0x80) === 0x80) {
+    length += 1;
+  }
+
+  return length;
+};
+
 utilService.readModifiedLebCompressedInteger = function (buf) {
   let value = 0;
   let isNegative = false;
+  const length = utilService.getModifiedLebLength(buf);
 
-  for (let i = (buf.length - 1); i >= 0; i--) {
+  for (let i = (length - 1); i >= 0; i--) {
     let currentByte = buf.readUInt8(i);
 
-    if (i !== (buf.length - 1)) {
+    if (i !== (length - 1)) {
       currentByte = currentByte ^ 0x80;
     }
 
@@ -0,0 +1,182 @@
+import json
+import math
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+JOURNAL_SUFFIX = '.journal'
+JOURNAL_VERSION = 1
+
+
+def journal_path(roster_path):
+    return roster_path + JOURNAL_SUFFIX
+
+
+def roster_fingerprint(roster_path):
+    """Size and modification time of the roster file, to tell whether a journal was started on this version of it."""
+    stat = os.stat(roster_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+class AutosaveJournal:
+    """Appends committed edit batches to a JSON-lines file next to the roster.
+
+    The first line records which version of the roster the edits apply to; every other line is one
+    batch of {index: {column: value}} changes to a table. append() only queues the batch; a
+    background thread encodes it, writes it and fsyncs the file, so autosaving never waits on the disk.
+    """
+
+    def __init__(self, roster_path):
+        self.roster_path = roster_path
+        self.path = journal_path(roster_path)
+        self._queue = queue.Queue()
+        # Set by the writer thread if the disk refuses a write; later batches are still attempted
+        self.write_error = None
+        # Whether the journal holds edits that aren't in any saved roster file
+        self.has_unsaved_edits = False
+
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            self._write_lines([self._header_line()], mode='w')
+
+        self._thread = threading.Thread(target=self._write_loop, name="autosave-journal", daemon=True)
+        self._thread.start()
+
+    def append(self, changes, table='play'):
+        """Queues a batch. Missing values are journalled as null; a TypeError is raised for a value
+        that has no JSON form, before anything is queued."""
+        if changes:
+            changes = {str(index): {column: _json_value(value) for column, value in row.items()}
+                       for index, row in changes.items()}
+            self.has_unsaved_edits = True
+            self._queue.put(('append', table, changes))
+
+    def reset(self):
+        """Empties the journal once its edits are in the roster file, e.g. after saving over it."""
+        self.has_unsaved_edits = False
+        self._queue.put(('reset', None, None))
+
+    def mark_saved(self):
+        """Notes that the edits so far were saved to another file. They stay in the journal, since they
+        still aren't in the roster it's for, but there's no need to keep it once the editor closes."""
+        self.has_unsaved_edits = False
+
+    def close(self, delete=False):
+        """Writes out anything still queued. delete=True removes the journal, for when there's nothing left to recover."""
+        self._queue.put(None)
+        self._thread.join()
+        if delete and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _write_loop(self):
+        while True:
+            commands = [self._queue.get()]
+            # Whatever queued up while the last fsync ran goes out in the same write
+            while not self._queue.empty():
+                commands.append(self._queue.get_nowait())
+
+            lines = []
+            stop = False
+            try:
+                for command in commands:
+                    if command is None:
+                        stop = True
+                        break
+                    action, table, changes = command
+                    if action == 'reset':
+                        self._write_lines([self._header_line()], mode='w')
+                        lines = []
+                    else:
+                        lines.append(json.dumps({'time': time.time(), 'table': table, 'changes': changes}, allow_nan=False))
+                self._write_lines(lines)
+            except OSError as e:
+                self.write_error = e
+            if stop:
+                return
+
+    def _write_lines(self, lines, mode='a'):
+        if not lines and mode == 'a':
+            return
+        with open(self.path, mode, encoding='utf-8') as f:
+            f.write(''.join(line + '\n' for line in lines))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _header_line(self):
+        return json.dumps({'version': JOURNAL_VERSION, 'roster': os.path.basename(self.roster_path),
+                           'fingerprint': roster_fingerprint(self.roster_path), 'started': time.time()})
+
+
+class RecoveredEdits:
+    """The edits in a journal, merged per table into {index: {column: value}} with later batches winning."""
+
+    def __init__(self, tables, batches, last_edit, matches_roster):
+        self.tables = tables
+        self.batches = batches
+        self.last_edit = last_edit
+        self.matches_roster = matches_roster
+
+    @property
+    def is_empty(self):
+        return not self.batches
+
+    def changes(self, table='play'):
+        return self.tables.get(table, {})
+
+    @property
+    def cell_count(self):
+        return sum(len(row) for changes in self.tables.values() for row in changes.values())
+
+
+def read_journal(roster_path):
+    """Reads the journal for roster_path, or returns None if there isn't one.
+
+    A crash can leave the last line half written; reading stops at the first line that doesn't parse.
+    """
+    path = journal_path(roster_path)
+    if not os.path.exists(path):
+        return None
+
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+
+    try:
+        header = json.loads(lines[0])
+    except (IndexError, json.JSONDecodeError):
+        return RecoveredEdits({}, 0, None, False)
+
+    tables, batches, last_edit = {}, 0, None
+    for line in lines[1:]:
+        try:
+            batch = json.loads(line)
+        except json.JSONDecodeError:
+            break
+        table = tables.setdefault(batch['table'], {})
+        for index, row in batch['changes'].items():
+            table.setdefault(int(index), {}).update(row)
+        batches += 1
+        last_edit = batch['time']
+
+    matches_roster = header.get('version') == JOURNAL_VERSION and header.get('fingerprint') == roster_fingerprint(roster_path)
+    return RecoveredEdits(tables, batches, last_edit, matches_roster)
+
+
+def discard_journal(roster_path):
+    path = journal_path(roster_path)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _json_value(value):
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    raise TypeError(f"A {type(value).__name__} value can't be written to the autosave journal.")
@@ -0,0 +1,284 @@
+import ast
+import json
+import re
+
+import numpy as np
+import pandas as pd
+
+from roster_spreadsheet import changes_to_results
+
+# Column names that aren't valid identifiers ("Throw Power", "Jersey Num.") are written in backticks
+BACKTICK_PATTERN = re.compile(r'`([^`]+)`')
+
+SAFE_FUNCTIONS = {
+    'MIN': np.minimum,
+    'MAX': np.maximum,
+    'CLIP': np.clip,
+    'ABS': np.abs,
+    'ROUND': np.round,
+    'IF': np.where,
+}
+
+ALLOWED_NODES = (
+    ast.Expression, ast.Name, ast.Load, ast.Constant, ast.Tuple, ast.List,
+    ast.BinOp, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.UnaryOp, ast.USub, ast.UAdd, ast.Not, ast.Invert,
+    ast.BoolOp, ast.And, ast.Or, ast.BitAnd, ast.BitOr,
+    ast.Compare, ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn,
+    ast.Call,
+)
+
+
+class BulkEditError(ValueError):
+    pass
+
+
+class BulkEdit:
+    """Sets columns of every player that matches a filter.
+
+    filter and the values of assignments are expressions over readable column names, e.g.
+    filter "PositionName == 'WR' and Age < 25" with assignments {"Speed": "Speed + 2"}.
+    An empty filter matches every player. Column names in assignments may be written in backticks
+    here too.
+    """
+
+    def __init__(self, name, filter_text, assignments):
+        self.name = name
+        self.filter_text = filter_text.strip()
+        self.assignments = {column.strip().strip('`'): str(expression).strip() for column, expression in assignments.items()}
+
+    @classmethod
+    def from_text(cls, name, filter_text, assignments_text):
+        """Builds an edit from "Column = expression" lines."""
+        assignments = {}
+        for line in assignments_text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            column, separator, expression = line.partition('=')
+            if not separator or not expression.strip() or expression.startswith('='):
+                raise BulkEditError(f"'{line}' isn't an assignment. Write it as 'Column = expression'.")
+            assignments[column] = expression
+        return cls(name, filter_text, assignments)
+
+
+class BulkEditResult:
+    """The cells a list of edits would change, and how many players each edit matched."""
+
+    def __init__(self, changes, matched):
+        self.changes = changes
+        self.matched = matched
+
+    @property
+    def is_empty(self):
+        return self.changes.empty
+
+    @property
+    def touched_rows(self):
+        return pd.Index(self.changes['index'].unique())
+
+    def to_results(self):
+        return changes_to_results(self.changes)
+
+
+def load_rule_file(path):
+    """Reads a JSON list of {"name", "filter", "set": {column: expression}} edits."""
+    with open(path, 'r', encoding='utf-8') as f:
+        rules = json.load(f)
+    if not isinstance(rules, list):
+        raise BulkEditError("A rule file must contain a list of edits.")
+
+    edits = []
+    for number, rule in enumerate(rules, start=1):
+        if not isinstance(rule, dict):
+            raise BulkEditError(f"Edit {number} isn't an object with a 'set' of column: expression pairs.")
+        if not isinstance(rule.get('set'), dict) or not rule['set']:
+            raise BulkEditError(f"Edit {number} has no 'set' object of column: expression pairs.")
+        if not isinstance(rule.get('filter', ''), str):
+            raise BulkEditError(f"Edit {number}'s 'filter' must be a string.")
+        edits.append(BulkEdit(rule.get('name', f"Edit {number}"), rule.get('filter', ''), rule['set']))
+    return edits
+
+
+def run_bulk_edits(model, edits, value_maps=None):
+    """Evaluates every edit in order against a working copy of the columns they use.
+
+    Each edit sees the results of the ones before it, and the assignments within one edit are
+    evaluated together against the values from before that edit. model itself isn't modified.
+    value_maps works as in roster_spreadsheet.plan_import: new values of a mapped column must be
+    keys of its inverse_map, and its id_column is changed along with it.
+    """
+    value_maps = value_maps or {}
+    compiled = []
+    used_columns = set()
+    for edit in edits:
+        filter_code, filter_columns = compile_expression(edit.filter_text, model.columns) if edit.filter_text else (None, set())
+        assignments = []
+        for column, expression in edit.assignments.items():
+            if column not in model.columns:
+                raise BulkEditError(f"{edit.name}: there is no column named '{column}'.")
+            code, columns = compile_expression(expression, model.columns)
+            assignments.append((column, code))
+            used_columns.update(columns)
+            used_columns.add(column)
+        used_columns.update(filter_columns)
+        compiled.append((edit, filter_code, assignments))
+
+    working = model[sorted(used_columns)].copy()
+    # Mapped columns are categorical, which refuses values outside the map before they can be reported
+    for column in working.columns:
+        if isinstance(working[column].dtype, pd.CategoricalDtype):
+            working[column] = working[column].astype(object)
+    matched = {}
+
+    for edit, filter_code, assignments in compiled:
+        if filter_code is None:
+            rows = working.index
+        else:
+            mask = _evaluate(filter_code, working, edit.name)
+            if np.ndim(mask) == 0:
+                rows = working.index if mask else working.index[:0]
+            else:
+                rows = working.index[np.asarray(mask, dtype=bool)]
+        matched[edit.name] = len(rows)
+        if not len(rows):
+            continue
+
+        subset = working.loc[rows]
+        new_values = {column: _evaluate(code, subset, edit.name) for column, code in assignments}
+        for column, values in new_values.items():
+            values = np.broadcast_to(np.asarray(values), (len(rows),))
+            if pd.api.types.is_integer_dtype(model[column]):
+                numbers = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=float)
+                invalid = ~np.isfinite(numbers)
+                if invalid.any():
+                    first = values[invalid][0]
+                    first = first.item() if isinstance(first, np.generic) else first
+                    raise BulkEditError(f"{edit.name}: {column} holds whole numbers, but the expression gives "
+                                        f"{first!r} for {np.count_nonzero(invalid)} players.")
+                values = np.round(numbers).astype(np.int64)
+            working.loc[rows, column] = values
+
+    changes = []
+    for column in {column for _, _, assignments in compiled for column, _ in assignments}:
+        before = model[column]
+        after = working[column]
+        changed = (before != after) & ~(before.isna() & after.isna())
+        if not changed.any():
+            continue
+        changes.append(pd.DataFrame({
+            'index': model.index[changed.to_numpy()],
+            'column': column,
+            'old': before[changed].to_numpy(),
+            'new': after[changed].to_numpy(),
+        }))
+
+        if column in value_maps:
+            inverse_map, id_column = value_maps[column]
+            invalid = after[changed][~after[changed].isin(inverse_map.keys())]
+            if not invalid.empty:
+                values = ", ".join(map(str, invalid.unique()[:5]))
+                raise BulkEditError(f"{values} isn't a valid value for {column}.")
+            if id_column is not None and id_column in model.columns:
+                changes.append(pd.DataFrame({
+                    'index': model.index[changed.to_numpy()],
+                    'column': id_column,
+                    'old': model.loc[changed, id_column].to_numpy(),
+                    'new': after[changed].map(inverse_map).to_numpy(),
+                }))
+
+    changes = pd.concat(changes, ignore_index=True) if changes else pd.DataFrame(columns=['index', 'column', 'old', 'new'])
+    return BulkEditResult(changes.sort_values(['index', 'column'], ignore_index=True), matched)
+
+
+def compile_expression(text, columns):
+    """Compiles an expression into code that works on whole columns, and returns it with the columns it reads."""
+    names = {}
+
+    def replace_backticks(match):
+        name = f"__column_{len(names)}"
+        names[name] = match.group(1)
+        return name
+
+    try:
+        tree = ast.parse(BACKTICK_PATTERN.sub(replace_backticks, text), mode='eval')
+    except SyntaxError as e:
+        raise BulkEditError(f"Can't read the expression '{text}': {e.msg}") from e
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ALLOWED_NODES):
+            raise BulkEditError(f"'{text}' uses {type(node).__name__}, which isn't allowed in bulk edits.")
+        if isinstance(node, ast.Call) and not (isinstance(node.func, ast.Name) and node.func.id in SAFE_FUNCTIONS):
+            raise BulkEditError(f"'{text}' calls a function other than {', '.join(SAFE_FUNCTIONS)}.")
+
+    used = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id not in SAFE_FUNCTIONS:
+            column = names.get(node.id, node.id)
+            if column not in columns:
+                raise BulkEditError(f"'{text}' refers to '{column}', which isn't a column of the roster.")
+            used.add(column)
+
+    tree = ast.fix_missing_locations(_VectorizeExpression(names).visit(tree))
+    return compile(tree, '<bulk edit>', 'eval'), used
+
+
+def _evaluate(code, frame, edit_name):
+    context = {'__columns': frame, '__isin': _isin, '__not': np.logical_not, **SAFE_FUNCTIONS}
+    try:
+        with np.errstate(all='ignore'):
+            return eval(code, {"__builtins__": {}}, context)
+    except Exception as e:
+        raise BulkEditError(f"{edit_name}: {e}") from e
+
+
+def _isin(values, options):
+    return pd.Series(values).isin(options).to_numpy()
+
+
+class _VectorizeExpression(ast.NodeTransformer):
+    """Rewrites column names to column lookups and the boolean operators to their element-wise versions."""
+
+    def __init__(self, names):
+        self.names = names
+
+    def visit_Name(self, node):
+        if node.id in SAFE_FUNCTIONS:
+            return node
+        column = self.names.get(node.id, node.id)
+        return ast.Subscript(value=ast.Name(id='__columns', ctx=ast.Load()), slice=ast.Constant(value=column), ctx=ast.Load())
+
+    def visit_BoolOp(self, node):
+        self.generic_visit(node)
+        op = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+        result = node.values[0]
+        for value in node.values[1:]:
+            result = ast.BinOp(left=result, op=op, right=value)
+        return result
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            # Not ~, which turns True into -2 rather than False
+            return ast.Call(func=ast.Name(id='__not', ctx=ast.Load()), args=[node.operand], keywords=[])
+        return node
+
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        # a < b < c becomes (a < b) & (b < c), and "in" becomes a membership test over the whole column
+        parts = []
+        left = node.left
+        for op, right in zip(node.ops, node.comparators):
+            if isinstance(op, (ast.In, ast.NotIn)):
+                part = ast.Call(func=ast.Name(id='__isin', ctx=ast.Load()), args=[left, right], keywords=[])
+                if isinstance(op, ast.NotIn):
+                    part = ast.Call(func=ast.Name(id='__not', ctx=ast.Load()), args=[part], keywords=[])
+            else:
+                part = ast.Compare(left=left, ops=[op], comparators=[right])
+            parts.append(part)
+            left = right
+
+        result = parts[0]
+        for part in parts[1:]:
+            result = ast.BinOp(left=result, op=ast.BitAnd(), right=part)
+        return result
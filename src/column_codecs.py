@@ -0,0 +1,170 @@
+import numpy as np
+import pandas as pd
+
+UNKNOWN_LABEL = "Unknown"
+
+# (label column, PLAY field holding the ID, config.json map, label for IDs that aren't in the map)
+CODEC_SPECS = [
+    ('PositionName', 'PPOS', 'position_map', UNKNOWN_LABEL),
+    ('TeamName', 'TGID', 'team_map', UNKNOWN_LABEL),
+    ('CollegeName', 'PCOL', 'college_map', UNKNOWN_LABEL),
+    ('Archetype', 'PLTY', 'archetype_map', UNKNOWN_LABEL),
+    ('XP Rate/TraitDevelopment', 'PROL', 'dev_trait_map', UNKNOWN_LABEL),
+    ('Home State', 'PHSN', 'state_map', UNKNOWN_LABEL),
+    ('Career Phase', 'PCPH', 'career_phase_map', UNKNOWN_LABEL),
+    ('QB Style', 'PQBS', 'throw_style_map', UNKNOWN_LABEL),
+    ('DRAFTTEAM', 'PLDT', 'team_map', "None"),
+]
+# Stored as Name:ID in config.json, unlike the other maps
+INVERTED_MAPS = {'archetype_map'}
+
+
+class ColumnCodec:
+    """Converts one mapped PLAY field between its integer IDs and its readable labels.
+
+    Labels are held as a pandas Categorical whose categories are the map's names in ID order,
+    followed by the unknown label. Encoding reads the Categorical's codes and looks the IDs up
+    with one array take, so neither direction goes through a Python dict per player.
+    """
+
+    def __init__(self, label_column, id_column, id_to_label, unknown_label=UNKNOWN_LABEL):
+        self.label_column = label_column
+        self.id_column = id_column
+        self.unknown_label = unknown_label
+
+        ids = sorted(id_to_label)
+        labels = list(dict.fromkeys(id_to_label[i] for i in ids))
+        if unknown_label not in labels:
+            labels.append(unknown_label)
+        self.categories = pd.Index(labels)
+        self.inverse_map = {label: i for i, label in id_to_label.items()}
+
+        self._sorted_ids = np.asarray(ids, dtype=float)
+        self._codes_by_id = self.categories.get_indexer([id_to_label[i] for i in ids])
+        self._unknown_code = self.categories.get_loc(unknown_label)
+        # The ID each category encodes to; NaN for the unknown label
+        self._ids_by_code = np.array([self.inverse_map.get(label, np.nan) for label in labels], dtype=float)
+
+    @property
+    def in_place(self):
+        """True when the labels replace the ID column instead of sitting next to it."""
+        return self.label_column == self.id_column
+
+    def decode(self, ids):
+        ids = pd.to_numeric(pd.Series(ids), errors='coerce').to_numpy(dtype=float)
+        codes = np.full(len(ids), self._unknown_code, dtype=np.int64)
+        if len(self._sorted_ids):
+            positions = np.searchsorted(self._sorted_ids, ids).clip(0, len(self._sorted_ids) - 1)
+            found = self._sorted_ids[positions] == ids
+            codes[found] = self._codes_by_id[positions[found]]
+        return pd.Categorical.from_codes(codes, dtype=self.dtype)
+
+    def encode(self, labels):
+        """IDs for a column of labels, as floats with NaN where a label isn't in the map."""
+        codes = self.as_categorical(labels).codes
+        ids = self._ids_by_code[codes]
+        ids[codes < 0] = np.nan
+        return ids
+
+    def encode_value(self, label):
+        return self.inverse_map.get(label)
+
+    def is_valid(self, label):
+        return label in self.inverse_map
+
+    @property
+    def dtype(self):
+        return pd.CategoricalDtype(self.categories)
+
+    def as_categorical(self, labels):
+        labels = labels.array if isinstance(labels, pd.Series) else labels
+        if isinstance(labels, pd.Categorical) and labels.dtype == self.dtype:
+            return labels
+        return pd.Categorical(np.asarray(labels, dtype=object), dtype=self.dtype)
+
+
+class ColumnCodecs:
+    """Every mapped PLAY field's codec, by label column. Used on load, edit and save."""
+
+    def __init__(self, codecs):
+        self.codecs = {codec.label_column: codec for codec in codecs}
+
+    @classmethod
+    def from_config(cls, config_data):
+        """Builds the codecs from the maps and header_map of a loaded config.json."""
+        header_map = config_data.get("header_map", {})
+        codecs = []
+        for label_column, field, map_name, unknown_label in CODEC_SPECS:
+            value_map = config_data.get(map_name, {})
+            if map_name in INVERTED_MAPS:
+                id_to_label = {int(v): k for k, v in value_map.items()}
+            else:
+                id_to_label = {int(k): v for k, v in value_map.items()}
+            if id_to_label:
+                codecs.append(ColumnCodec(label_column, header_map.get(field, field), id_to_label, unknown_label))
+        return cls(codecs)
+
+    def __contains__(self, label_column):
+        return label_column in self.codecs
+
+    def __getitem__(self, label_column):
+        return self.codecs[label_column]
+
+    @property
+    def display_only_columns(self):
+        """Label columns that sit next to their ID column and aren't saved themselves."""
+        return [column for column, codec in self.codecs.items() if not codec.in_place]
+
+    def decode_frame(self, df):
+        """Adds or replaces the label column of every mapped field in df, whose columns have readable names."""
+        for column, codec in self.codecs.items():
+            if codec.id_column in df.columns:
+                df[column] = codec.decode(df[codec.id_column])
+        return df
+
+    def encode_frame(self, df):
+        """Writes every label column back to its ID column and drops the display-only ones.
+
+        Labels that aren't in the map keep the ID a separate ID column already has.
+        """
+        for column, codec in self.codecs.items():
+            if column not in df.columns:
+                continue
+            ids = codec.encode(df[column])
+            if codec.in_place:
+                df[column] = ids
+            elif codec.id_column in df.columns:
+                df[codec.id_column] = np.where(np.isnan(ids), pd.to_numeric(df[codec.id_column], errors='coerce'), ids)
+        return df.drop(columns=self.display_only_columns, errors='ignore')
+
+    def assign(self, df, rows, column, values):
+        """Sets df.loc[rows, column], keeping a separate ID column in step with mapped labels.
+
+        A label that isn't in the map is added as a category rather than refused; like an unmapped
+        ID on load it has no ID, so saving leaves the field's existing ID alone.
+        """
+        rows = pd.Index(np.atleast_1d(rows))
+        codec = self.codecs.get(column)
+        if codec is None or not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df.loc[rows, column] = values
+            return
+
+        values = np.broadcast_to(np.asarray(values, dtype=object), (len(rows),))
+        new_labels = pd.Index(values).dropna().unique().difference(df[column].cat.categories)
+        if len(new_labels):
+            df[column] = df[column].cat.add_categories(new_labels)
+        df.loc[rows, column] = values
+
+        if not codec.in_place and codec.id_column in df.columns:
+            ids = codec.encode(values)
+            known = ~np.isnan(ids)
+            if known.any():
+                df.loc[rows[known], codec.id_column] = ids[known].astype(np.int64)
+
+    def value_maps(self):
+        """{label column: (inverse_map, ID column or None)}: the valid labels of each mapped column, with
+        the ID column to update alongside it."""
+        return {
+            column: (codec.inverse_map, None if codec.in_place else codec.id_column)
+            for column, codec in self.codecs.items()
+        }
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+
+# DCHT fields: the team and depth chart position of a slot, its order within that position, and the player in it.
+# TDB2 keys are six-bit text, so always upper case.
+DCHT_TEAM = 'TGID'
+DCHT_POSITION = 'PPOS'
+DCHT_DEPTH = 'DDEP'
+DCHT_PLAYER = 'PGID'
+
+# Candidates for a slot, best first: players at the slot's position, then the rest of its position group
+TIER_POSITION = 0
+TIER_GROUP = 1
+
+# Sorts after every real depth, for players who aren't in a slot of the position yet
+NOT_IN_SLOT = np.iinfo(np.int64).max
+
+
+class DepthChartRebuild:
+    """The rebuilt DCHT table and the slots that changed, so the result can be previewed before it is applied."""
+
+    def __init__(self, depth_chart, changes):
+        self.depth_chart = depth_chart
+        self.changes = changes
+
+    @property
+    def has_changes(self):
+        return not self.changes.empty
+
+
+def rebuild_depth_charts(players, depth_chart, position_groups):
+    """Refills every team's depth chart with its best players by OVR.
+
+    players has one row per player with PGID, TGID, PPOS and Overall columns. position_groups maps each
+    player position ID to its position group; slots at other depth chart positions (returners, special
+    teams and so on) are left as they are. Within a (team, position) the slots keep their order and are
+    filled best first, ties going to the player already higher on the chart. Slots the team has no
+    player for are left as they are. depth_chart itself isn't modified.
+
+    Raises KeyError if depth_chart lacks one of the DCHT fields, DDEP included: without it the slot
+    order isn't known.
+    """
+    depth_chart = depth_chart.copy()
+    slots = pd.DataFrame({
+        DCHT_TEAM: pd.to_numeric(depth_chart[DCHT_TEAM], errors='coerce'),
+        DCHT_POSITION: pd.to_numeric(depth_chart[DCHT_POSITION], errors='coerce'),
+        DCHT_DEPTH: pd.to_numeric(depth_chart[DCHT_DEPTH], errors='coerce'),
+        DCHT_PLAYER: pd.to_numeric(depth_chart[DCHT_PLAYER], errors='coerce'),
+    }, index=depth_chart.index)
+    slots = slots[slots[DCHT_POSITION].isin(position_groups.keys()) & slots[DCHT_TEAM].notna()]
+
+    # Slot order within each (team, position), falling back to table order for equal depths
+    slots['row'] = np.arange(len(slots))
+    slots = slots.sort_values([DCHT_TEAM, DCHT_POSITION, DCHT_DEPTH, 'row'])
+    slots['slot_rank'] = slots.groupby([DCHT_TEAM, DCHT_POSITION]).cumcount()
+
+    roster = pd.DataFrame({
+        DCHT_PLAYER: pd.to_numeric(players[DCHT_PLAYER], errors='coerce'),
+        DCHT_TEAM: pd.to_numeric(players[DCHT_TEAM], errors='coerce'),
+        'player_position': pd.to_numeric(players[DCHT_POSITION], errors='coerce'),
+        'Overall': pd.to_numeric(players['Overall'], errors='coerce').fillna(0),
+    }).dropna(subset=[DCHT_PLAYER, DCHT_TEAM, 'player_position'])
+    roster['player_group'] = roster['player_position'].map(position_groups)
+
+    # Every player on a team is a candidate for each of the team's positions in their group
+    groups = slots[[DCHT_TEAM, DCHT_POSITION]].drop_duplicates()
+    groups['slot_group'] = groups[DCHT_POSITION].map(position_groups)
+    candidates = groups.merge(roster, on=DCHT_TEAM)
+    candidates = candidates[candidates['player_group'] == candidates['slot_group']].copy()
+    candidates['tier'] = np.where(candidates['player_position'] == candidates[DCHT_POSITION], TIER_POSITION, TIER_GROUP)
+
+    # Where the player is on the chart now, so ties don't reshuffle it
+    current = slots[[DCHT_TEAM, DCHT_POSITION, DCHT_PLAYER, 'slot_rank']].drop_duplicates([DCHT_TEAM, DCHT_POSITION, DCHT_PLAYER])
+    candidates = candidates.merge(current.rename(columns={'slot_rank': 'current_rank'}),
+                                  on=[DCHT_TEAM, DCHT_POSITION, DCHT_PLAYER], how='left')
+    candidates['current_rank'] = candidates['current_rank'].fillna(NOT_IN_SLOT)
+
+    candidates = candidates.sort_values([DCHT_TEAM, DCHT_POSITION, 'tier', 'Overall', 'current_rank', DCHT_PLAYER],
+                                        ascending=[True, True, True, False, True, True])
+    candidates['slot_rank'] = candidates.groupby([DCHT_TEAM, DCHT_POSITION]).cumcount()
+
+    assigned = slots.reset_index().merge(
+        candidates[[DCHT_TEAM, DCHT_POSITION, 'slot_rank', DCHT_PLAYER]].rename(columns={DCHT_PLAYER: 'new_player'}),
+        on=[DCHT_TEAM, DCHT_POSITION, 'slot_rank'], how='inner'
+    ).set_index(slots.index.name or 'index').rename_axis(depth_chart.index.name)
+
+    changed = assigned[assigned['new_player'] != assigned[DCHT_PLAYER]]
+    if not changed.empty:
+        new_players = changed['new_player'].astype(depth_chart[DCHT_PLAYER].dtype, errors='ignore')
+        depth_chart.loc[changed.index, DCHT_PLAYER] = new_players.values
+
+    changes = pd.DataFrame({
+        DCHT_TEAM: changed[DCHT_TEAM].astype(int),
+        DCHT_POSITION: changed[DCHT_POSITION].astype(int),
+        'depth': changed['slot_rank'] + 1,
+        'old_player': changed[DCHT_PLAYER],
+        'new_player': changed['new_player'],
+    }, index=changed.index).sort_values([DCHT_TEAM, DCHT_POSITION, 'depth'])
+
+    return DepthChartRebuild(depth_chart, changes)
+
+
+def starting_player_ids(depth_chart):
+    """PGIDs of the players in the first slot of each team's depth chart positions. Raises KeyError
+    if depth_chart lacks one of the DCHT fields."""
+    depth = pd.to_numeric(depth_chart[DCHT_DEPTH], errors='coerce')
+    first_slots = depth == depth.groupby([depth_chart[DCHT_TEAM], depth_chart[DCHT_POSITION]]).transform('min')
+    return set(depth_chart.loc[first_slots, DCHT_PLAYER])
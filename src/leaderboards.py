@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+
+POSITION_COLUMN = 'PositionName'
+# The position key of the leaderboard over every player
+ALL_POSITIONS = None
+
+
+class Leaderboards:
+    """Top-N players per position for any numeric column, cached until that column or a position changes.
+
+    A leaderboard picks its N leaders out of the position's rows with argpartition, so only those N are
+    sorted. It's cached by (position, column, lowest); an edit to a player's value drops just the boards
+    of that column for the player's position and for all positions, and a position change drops the
+    boards of the two positions involved.
+    """
+
+    def __init__(self, model, position_column=POSITION_COLUMN):
+        self.model = model
+        self.position_column = position_column
+        # Own copy, so an edit can still tell which position the player was in
+        self._positions = model[position_column].astype(object).to_numpy(copy=True)
+        self._position_rows = {}
+        self._values = {}
+        self._cache = {}
+
+    def rating_columns(self):
+        """The columns a leaderboard can rank by."""
+        return [col for col in self.model.columns
+                if pd.api.types.is_numeric_dtype(self.model[col].dtype) and not pd.api.types.is_bool_dtype(self.model[col].dtype)]
+
+    def positions(self):
+        return sorted(position for position in set(self._positions) if isinstance(position, str))
+
+    def top(self, position, column, n=20, lowest=False):
+        """Model index labels of the n players at position (ALL_POSITIONS for everyone) with the highest
+        values in column, best first. lowest=True ranks the lowest values first, e.g. the youngest by Age.
+        Players with no value in the column aren't ranked."""
+        key = (position, column, lowest)
+        cached = self._cache.get(key)
+        if cached is None or (cached[0] < n and len(cached[1]) == cached[0]):
+            cached = (n, self._leaders(position, column, n, lowest))
+            self._cache[key] = cached
+        return self.model.index[cached[1][:n]]
+
+    def apply_changes(self, changes):
+        """Drops the boards that {index: {column: value}} edits could have changed."""
+        rows = self.model.index.get_indexer(list(changes))
+        for row, row_changes in zip(rows, changes.values()):
+            if row < 0:
+                continue
+            for column, value in row_changes.items():
+                if column == self.position_column:
+                    self._move_player(row, value)
+                elif column in self._values or any(key[1] == column for key in self._cache):
+                    self._update_value(row, column, value)
+
+    def invalidate(self):
+        """Forgets every board, e.g. after the model gains or loses players."""
+        self._positions = self.model[self.position_column].astype(object).to_numpy(copy=True)
+        self._position_rows.clear()
+        self._values.clear()
+        self._cache.clear()
+
+    def _leaders(self, position, column, n, lowest):
+        if column not in self._values:
+            self._values[column] = pd.to_numeric(self.model[column], errors='coerce').to_numpy(dtype=float, copy=True)
+        rows = self._rows_at(position)
+        values = self._values[column][rows]
+        rows, values = rows[~np.isnan(values)], values[~np.isnan(values)]
+        if not lowest:
+            values = -values
+
+        if n < len(rows):
+            # Everyone up to the n-th best value, so players tied with it are ranked in roster order
+            cutoff = values[np.argpartition(values, n - 1)[n - 1]]
+            leaders = np.flatnonzero(values <= cutoff)
+        else:
+            leaders = np.arange(len(rows))
+        leaders = leaders[np.lexsort((rows[leaders], values[leaders]))][:n]
+        return rows[leaders]
+
+    def _rows_at(self, position):
+        if position is ALL_POSITIONS:
+            return np.arange(len(self._positions))
+        if position not in self._position_rows:
+            self._position_rows[position] = np.flatnonzero(self._positions == position)
+        return self._position_rows[position]
+
+    def _move_player(self, row, position):
+        old_position = self._positions[row]
+        if old_position == position:
+            return
+        self._positions[row] = position
+        for changed in (old_position, position):
+            self._position_rows.pop(changed, None)
+            self._drop(lambda key: key[0] == changed)
+
+    def _update_value(self, row, column, value):
+        if column in self._values:
+            value = pd.to_numeric(value, errors='coerce')
+            self._values[column][row] = np.nan if pd.isna(value) else value
+        position = self._positions[row]
+        self._drop(lambda key: key[1] == column and key[0] in (position, ALL_POSITIONS))
+
+    def _drop(self, matches):
+        for key in [key for key in self._cache if matches(key)]:
+            del self._cache[key]
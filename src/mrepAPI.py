@@ -8,14 +8,28 @@ from PyQt6.QtWidgets import (
     QListWidgetItem, QLineEdit, QLabel, QTabWidget, QScrollArea, QFormLayout,  # noqa: F401
     QFileDialog, QMessageBox, QDialog, QDialogButtonBox, QTableWidget, QTableWidgetItem,
     QComboBox, QSpinBox, QCheckBox, QGroupBox, QStatusBar, QProgressBar, QDateEdit, QHeaderView, QStackedWidget,
-    QGraphicsOpacityEffect
+    QGraphicsOpacityEffect, QPlainTextEdit
 )
 from PyQt6.QtGui import QFont, QPixmap
-from PyQt6.QtCore import Qt, QDate, QObject, QThread, pyqtSignal, QTimer, QPropertyAnimation
+from PyQt6.QtCore import Qt, QDate, QObject, QThread, pyqtSignal, QTimer, QPropertyAnimation, QSize
 from PIL import Image, ImageQt
 from rating_calculator import RatingCalculator
+from pipeline_profiler import PipelineProfiler
+from depth_chart import rebuild_depth_charts, starting_player_ids, DCHT_PLAYER, DCHT_TEAM, DCHT_POSITION
+from team_aggregates import TeamAggregates
+from roster_diff import diff_rosters
+from roster_validator import RosterValidator, default_rules
+from roster_spreadsheet import export_roster, iter_spreadsheet_chunks, plan_import, FILE_FILTER
+from bulk_edit import BulkEdit, BulkEditError, load_rule_file, run_bulk_edits
+from column_codecs import ColumnCodecs
+from autosave_journal import AutosaveJournal, read_journal, discard_journal
+from roster_projection import RosterProjection, INJURY_FIELDS
+from range_index import RosterRangeIndex, Condition, FilterError, OPERATORS
+from leaderboards import Leaderboards, ALL_POSITIONS
+from thumbnail_cache import ThumbnailCache, THUMBNAIL_SIZE
 import subprocess
 import json
+import time
 from datetime import datetime, timedelta
 
 def get_resource_path(relative_path):
@@ -35,6 +49,8 @@ NODE_EXECUTABLE_PATH = get_resource_path(os.path.join('node', 'node.exe'))
 
 
 IMAGES_FOLDER = "" # folder containing player images
+THUMBNAIL_COLUMN = 4 # logical column of the portrait thumbnails in the player list; shown first
+BULK_PROGRESS_INTERVAL_MS = 100 # minimum time between progress updates from bulk operations
 
 class ArchetypeCalculator:
     def __init__(self, filepath, header_map, position_group_map, all_archetypes_map):
@@ -71,6 +87,9 @@ class ArchetypeCalculator:
         except Exception as e:
             QMessageBox.critical(None, "Archetype File Error", f"Failed to parse archetype breakdown file: {e}")
 
+    def required_columns(self):
+        return ["PositionName", "Archetype"] + list(self.short_to_readable_map.values())
+
     def calculate_best_archetype(self, player_data: pd.Series) -> str | None:
         player_position = player_data.get("PositionName")
         if not player_position: return None
@@ -143,6 +162,9 @@ class OverallCalculator:
         except Exception as e:
             QMessageBox.critical(None, "Archetype File Error", f"Failed to parse OVR calculation data: {e}")
 
+    def required_columns(self):
+        return ["PositionName", "Archetype", "Overall"] + list(self.short_to_readable_map.values())
+
     def calculate_overall(self, player_data: pd.Series) -> int | None:
         player_position = player_data.get("PositionName")
         player_archetype = player_data.get("Archetype")
@@ -211,6 +233,14 @@ class SettingsDialog(QDialog):
         path_layout.addWidget(browse_button)
 
         form_layout.addRow("Player Images Folder:", path_layout)
+
+        self.track_memory_checkbox = QCheckBox("Record memory usage per load/save stage (slower)")
+        self.track_memory_checkbox.setChecked(bool(self.settings.get("track_memory", False)))
+        form_layout.addRow(self.track_memory_checkbox)
+
+        self.show_thumbnails_checkbox = QCheckBox("Show portrait thumbnails in the player list")
+        self.show_thumbnails_checkbox.setChecked(bool(self.settings.get("show_thumbnails", False)))
+        form_layout.addRow(self.show_thumbnails_checkbox)
         layout.addLayout(form_layout)
 
         # Save and Cancel Buttons
@@ -226,15 +256,20 @@ class SettingsDialog(QDialog):
 
     def on_save(self):
         self.settings["images_folder"] = self.image_path_edit.text()
+        self.settings["track_memory"] = self.track_memory_checkbox.isChecked()
+        self.settings["show_thumbnails"] = self.show_thumbnails_checkbox.isChecked()
         self.accept()
 
     def get_settings(self):
         return self.settings
 
 class ProgressDialog(QDialog):
-    def __init__(self, title, parent=None):
+    cancel_requested = pyqtSignal()
+
+    def __init__(self, title, parent=None, cancellable=False):
         super().__init__(parent)
         self.setWindowTitle(title)
+        self.cancellable = cancellable
         
         # Prevent user from closing the dialog with the 'X' button
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowType.WindowCloseButtonHint)
@@ -259,10 +294,591 @@ class ProgressDialog(QDialog):
         layout.addWidget(self.message_label)
         layout.addWidget(self.progress_bar)
 
-    def update_progress(self, value, message):
+        if cancellable:
+            self.cancel_button = QPushButton("Cancel")
+            self.cancel_button.clicked.connect(self.reject)
+            layout.addWidget(self.cancel_button, alignment=Qt.AlignmentFlag.AlignRight)
+
+    def update_progress(self, value, message, process_events=True):
         self.progress_bar.setValue(value)
         self.message_label.setText(message)
-        QApplication.processEvents()
+        if process_events:
+            QApplication.processEvents()
+
+    def reject(self):
+        # Cancellable operations are stopped by their worker, which then closes the dialog
+        if self.cancellable:
+            self.cancel_button.setEnabled(False)
+            self.message_label.setText("Cancelling...")
+            self.cancel_requested.emit()
+        else:
+            super().reject()
+
+class PipelineProfileDialog(QDialog):
+    def __init__(self, profilers, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Load/Save Profile")
+        self.resize(700, 450)
+
+        layout = QVBoxLayout(self)
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(6)
+        self.table.setHorizontalHeaderLabels(["Operation", "Source", "Stage", "Time (s)", "Peak / Heap (MB)", "RSS (MB)"])
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+
+        rows = [(profiler, stage) for profiler in profilers for stage in profiler.stages]
+        self.table.setRowCount(len(rows))
+        for row, (profiler, stage) in enumerate(rows):
+            memory = stage.get('peak_mb', stage.get('current_mb'))
+            self.table.setItem(row, 0, QTableWidgetItem(profiler.name))
+            self.table.setItem(row, 1, QTableWidgetItem(stage['source']))
+            self.table.setItem(row, 2, QTableWidgetItem(stage['stage']))
+            self.table.setItem(row, 3, QTableWidgetItem(f"{stage['seconds']:.3f}"))
+            self.table.setItem(row, 4, QTableWidgetItem(f"{memory:.1f}" if memory is not None else "-"))
+            self.table.setItem(row, 5, QTableWidgetItem(f"{stage['rss_mb']:.1f}" if stage.get('rss_mb') is not None else "-"))
+
+        self.table.resizeColumnsToContents()
+        self.table.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.table)
+
+        if not any(stage.get('peak_mb') is not None for profiler in profilers for stage in profiler.stages):
+            hint = QLabel("Python memory is only recorded when 'Record memory usage' is enabled in File > Settings.")
+            hint.setWordWrap(True)
+            layout.addWidget(hint)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+class DepthChartRebuildDialog(QDialog):
+    def __init__(self, rows, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Rebuild Depth Charts")
+        self.resize(750, 550)
+
+        layout = QVBoxLayout(self)
+
+        info_label = QLabel(f"Rebuilding would change {len(rows)} depth chart slots. "
+                            "Nothing is changed until you click Apply.")
+        info_label.setWordWrap(True)
+        layout.addWidget(info_label)
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(5)
+        self.table.setHorizontalHeaderLabels(["Team", "Position", "Depth", "Current Player", "New Player"])
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+
+        self.table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(str(value)))
+
+        self.table.resizeColumnsToContents()
+        self.table.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.table)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Apply | QDialogButtonBox.StandardButton.Cancel)
+        buttons.button(QDialogButtonBox.StandardButton.Apply).clicked.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+class RosterDiffDialog(QDialog):
+    def __init__(self, diff, title, column_names, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.resize(800, 600)
+
+        layout = QVBoxLayout(self)
+
+        summary = (f"{len(diff.changes)} changed fields across {diff.changes['player'].nunique()} players. "
+                   f"{len(diff.added)} players added, {len(diff.removed)} removed.")
+        if diff.name_matched:
+            summary += (f" {diff.name_matched} players were matched by name and position because their IDs "
+                        "were missing or not unique.")
+        summary_label = QLabel(summary)
+        summary_label.setWordWrap(True)
+        layout.addWidget(summary_label)
+
+        rows = [(diff.label(player), column_names.get(column, column), old, new)
+                for player, cells in diff.by_player().items() for column, old, new in cells]
+        rows += [(diff.label(player), "(added)", "", "") for player in diff.added.index]
+        rows += [(diff.label(player), "(removed)", "", "") for player in diff.removed.index]
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(4)
+        self.table.setHorizontalHeaderLabels(["Player", "Field", "Old Value", "New Value"])
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(str(value)))
+        self.table.resizeColumnsToContents()
+        self.table.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.table)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+class ValidationReportDialog(QDialog):
+    def __init__(self, report, model, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Roster Validation")
+        self.resize(800, 600)
+
+        layout = QVBoxLayout(self)
+
+        summary_label = QLabel(f"{report.total} problems found by {len(report.violations)} rules "
+                               f"(checked in {report.seconds * 1000:.0f} ms). Hover over a rule for details.")
+        summary_label.setWordWrap(True)
+        layout.addWidget(summary_label)
+
+        rows = [(rule, index) for rule, indices in report.violations.items() for index in indices]
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(4)
+        self.table.setHorizontalHeaderLabels(["Rule", "Player", "Position", "Team"])
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setRowCount(len(rows))
+        for row, (rule, index) in enumerate(rows):
+            player = model.loc[index]
+            rule_item = QTableWidgetItem(rule)
+            rule_item.setToolTip(report.descriptions.get(rule, ""))
+            self.table.setItem(row, 0, rule_item)
+            self.table.setItem(row, 1, QTableWidgetItem(f"{player.get('First Name', '')} {player.get('Last Name', '')}"))
+            self.table.setItem(row, 2, QTableWidgetItem(str(player.get('PositionName', ''))))
+            self.table.setItem(row, 3, QTableWidgetItem(str(player.get('TeamName', ''))))
+        self.table.resizeColumnsToContents()
+        self.table.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.table)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+class SpreadsheetImportDialog(QDialog):
+    def __init__(self, plan, model, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Import Spreadsheet")
+        self.resize(800, 600)
+
+        layout = QVBoxLayout(self)
+
+        summary = (f"{len(plan.changes)} fields will change for {plan.changes['index'].nunique()} players. "
+                   "Nothing is changed until you click Apply.")
+        if not plan.rejected.empty:
+            summary += f"\n{len(plan.rejected)} values are invalid for their field and will be skipped."
+        if plan.unknown_players:
+            summary += f"\n{len(plan.unknown_players)} rows match no player ID in the roster and will be skipped."
+        if plan.unknown_columns:
+            summary += f"\nColumns not in the roster were ignored: {', '.join(map(str, plan.unknown_columns))}"
+        summary_label = QLabel(summary)
+        summary_label.setWordWrap(True)
+        layout.addWidget(summary_label)
+
+        counts = plan.column_counts()
+        counts_label = QLabel("Changes per field: " + ", ".join(f"{column} ({count})" for column, count in counts.items()))
+        counts_label.setWordWrap(True)
+        layout.addWidget(counts_label)
+
+        rows = [(index, column, old, new, "") for index, column, old, new in plan.changes.itertuples(index=False)]
+        rows += [(index, column, value, "", "Invalid value, skipped") for index, column, value in plan.rejected.itertuples(index=False)]
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(5)
+        self.table.setHorizontalHeaderLabels(["Player", "Field", "Current Value", "New Value", "Note"])
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setRowCount(len(rows))
+        for row, (index, column, old, new, note) in enumerate(rows):
+            name = f"{model.at[index, 'First Name']} {model.at[index, 'Last Name']}"
+            for col, value in enumerate((name, column, old, new, note)):
+                self.table.setItem(row, col, QTableWidgetItem(str(value)))
+        self.table.resizeColumnsToContents()
+        self.table.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.table)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Apply | QDialogButtonBox.StandardButton.Cancel)
+        buttons.button(QDialogButtonBox.StandardButton.Apply).clicked.connect(self.accept)
+        buttons.button(QDialogButtonBox.StandardButton.Apply).setEnabled(not plan.is_empty)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+class BulkEditDialog(QDialog):
+    def __init__(self, model, value_maps, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Bulk Edit")
+        self.resize(800, 650)
+        self.model = model
+        self.value_maps = value_maps
+        self.rule_edits = None
+        self.result = None
+
+        layout = QVBoxLayout(self)
+
+        help_label = QLabel("Filter and values are expressions over column names, e.g. "
+                            "PositionName == 'WR' and Age < 25. Put names with spaces in backticks: `Throw Power`. "
+                            "Functions: MIN, MAX, CLIP, ABS, ROUND, IF.")
+        help_label.setWordWrap(True)
+        layout.addWidget(help_label)
+
+        form_layout = QFormLayout()
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Leave empty to edit every player")
+        self.assignments_edit = QPlainTextEdit()
+        self.assignments_edit.setPlaceholderText("Speed = MIN(Speed + 2, 99)\n`Throw Power` = CLIP(`Throw Power`, 0, 95)")
+        self.assignments_edit.setMaximumHeight(100)
+        form_layout.addRow("Filter:", self.filter_edit)
+        form_layout.addRow("Set (one per line):", self.assignments_edit)
+        layout.addLayout(form_layout)
+
+        rule_layout = QHBoxLayout()
+        self.rule_file_label = QLabel("")
+        self.load_rules_button = QPushButton("Load Rule File...")
+        self.preview_button = QPushButton("Preview")
+        rule_layout.addWidget(self.rule_file_label, 1)
+        rule_layout.addWidget(self.load_rules_button)
+        rule_layout.addWidget(self.preview_button)
+        layout.addLayout(rule_layout)
+
+        self.recalculate_overall_checkbox = QCheckBox("Recalculate OVR for changed players")
+        self.recalculate_overall_checkbox.setChecked(True)
+        layout.addWidget(self.recalculate_overall_checkbox)
+
+        self.summary_label = QLabel("Click Preview to see which fields will change.")
+        self.summary_label.setWordWrap(True)
+        layout.addWidget(self.summary_label)
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(4)
+        self.table.setHorizontalHeaderLabels(["Player", "Field", "Current Value", "New Value"])
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Apply | QDialogButtonBox.StandardButton.Cancel)
+        self.apply_button = buttons.button(QDialogButtonBox.StandardButton.Apply)
+        self.apply_button.clicked.connect(self.accept)
+        self.apply_button.setEnabled(False)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+        self.filter_edit.textChanged.connect(self._clear_preview)
+        self.assignments_edit.textChanged.connect(self._clear_preview)
+        self.load_rules_button.clicked.connect(self.load_rules)
+        self.preview_button.clicked.connect(self.preview)
+
+    def load_rules(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Load Bulk Edit Rules", "", "JSON Files (*.json)")
+        if not path:
+            return
+        try:
+            self.rule_edits = load_rule_file(path)
+        except (BulkEditError, ValueError, OSError) as e:
+            QMessageBox.critical(self, "Invalid Rule File", str(e))
+            return
+
+        self.rule_file_label.setText(f"{os.path.basename(path)}: {len(self.rule_edits)} edits")
+        self.filter_edit.setEnabled(False)
+        self.assignments_edit.setEnabled(False)
+        self.preview()
+
+    def preview(self):
+        try:
+            edits = self.rule_edits or [BulkEdit.from_text("Edit", self.filter_edit.text(), self.assignments_edit.toPlainText())]
+            if not any(edit.assignments for edit in edits):
+                raise BulkEditError("Enter at least one 'Column = expression' line.")
+            result = run_bulk_edits(self.model, edits, self.value_maps)
+        except BulkEditError as e:
+            self._clear_preview()
+            self.summary_label.setText(str(e))
+            return
+
+        self.result = result
+        matched = ", ".join(f"{name}: {count} players" for name, count in result.matched.items())
+        self.summary_label.setText(f"Matched {matched}. {len(result.changes)} fields will change for "
+                                   f"{len(result.touched_rows)} players. Nothing is changed until you click Apply.")
+
+        self.table.setRowCount(len(result.changes))
+        for row, (index, column, old, new) in enumerate(result.changes.itertuples(index=False)):
+            name = f"{self.model.at[index, 'First Name']} {self.model.at[index, 'Last Name']}"
+            for col, value in enumerate((name, column, old, new)):
+                self.table.setItem(row, col, QTableWidgetItem(str(value)))
+        self.table.resizeColumnsToContents()
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.apply_button.setEnabled(not result.is_empty)
+
+    def _clear_preview(self):
+        self.result = None
+        self.table.setRowCount(0)
+        self.apply_button.setEnabled(False)
+
+class AdvancedFilterDialog(QDialog):
+    """Builds a list of column conditions, e.g. Speed >= 90 and Age <= 24, with a live count of the players they match."""
+
+    def __init__(self, range_index, conditions, match_all, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Advanced Filter")
+        self.resize(700, 450)
+        self.range_index = range_index
+        self.columns = sorted(col for col in range_index.df.columns if col != 'UnmappedData')
+        self.conditions = list(conditions)
+        self.match_all = match_all
+
+        layout = QVBoxLayout(self)
+
+        help_label = QLabel("Number columns take >=, <=, >, < and between (e.g. 80, 90). "
+                            "in and not in take a comma separated list, e.g. WR_Slot, WR_DeepThreat.")
+        help_label.setWordWrap(True)
+        layout.addWidget(help_label)
+
+        match_layout = QHBoxLayout()
+        self.match_combo = QComboBox()
+        self.match_combo.addItems(["all conditions", "any condition"])
+        self.match_combo.setCurrentIndex(0 if match_all else 1)
+        match_layout.addWidget(QLabel("Show players matching"))
+        match_layout.addWidget(self.match_combo)
+        match_layout.addStretch()
+        layout.addLayout(match_layout)
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(3)
+        self.table.setHorizontalHeaderLabels(["Column", "Operator", "Value"])
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+
+        row_buttons_layout = QHBoxLayout()
+        self.add_button = QPushButton("Add Condition")
+        self.remove_button = QPushButton("Remove Condition")
+        row_buttons_layout.addWidget(self.add_button)
+        row_buttons_layout.addWidget(self.remove_button)
+        row_buttons_layout.addStretch()
+        layout.addLayout(row_buttons_layout)
+
+        self.count_label = QLabel("")
+        self.count_label.setWordWrap(True)
+        layout.addWidget(self.count_label)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Apply | QDialogButtonBox.StandardButton.Reset |
+                                   QDialogButtonBox.StandardButton.Cancel)
+        self.apply_button = buttons.button(QDialogButtonBox.StandardButton.Apply)
+        self.apply_button.clicked.connect(self.accept)
+        buttons.button(QDialogButtonBox.StandardButton.Reset).setText("Clear All")
+        buttons.button(QDialogButtonBox.StandardButton.Reset).clicked.connect(self.clear_conditions)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+        self.add_button.clicked.connect(lambda: self.add_condition())
+        self.remove_button.clicked.connect(self.remove_condition)
+        self.match_combo.currentIndexChanged.connect(self.update_count)
+
+        for condition in conditions:
+            self.add_condition(condition)
+        if not conditions:
+            self.add_condition()
+        self.update_count()
+
+    def add_condition(self, condition=None):
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+
+        column_combo = QComboBox()
+        column_combo.setEditable(True)
+        column_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        column_combo.addItems(self.columns)
+        operator_combo = QComboBox()
+        operator_combo.addItems(OPERATORS)
+        value_edit = QLineEdit()
+
+        if condition is not None:
+            column_combo.setCurrentText(condition.column)
+            operator_combo.setCurrentText(condition.operator)
+            value_edit.setText(condition.value_text())
+        else:
+            column_combo.setCurrentText("Overall" if "Overall" in self.columns else self.columns[0])
+            value_edit.setPlaceholderText("e.g. 90")
+
+        column_combo.currentTextChanged.connect(self.update_count)
+        operator_combo.currentTextChanged.connect(self.update_count)
+        value_edit.textChanged.connect(self.update_count)
+        self.table.setCellWidget(row, 0, column_combo)
+        self.table.setCellWidget(row, 1, operator_combo)
+        self.table.setCellWidget(row, 2, value_edit)
+        self.update_count()
+
+    def remove_condition(self):
+        row = self.table.currentRow()
+        if row < 0:
+            row = self.table.rowCount() - 1
+        if row >= 0:
+            self.table.removeRow(row)
+            self.update_count()
+
+    def clear_conditions(self):
+        self.table.setRowCount(0)
+        self.update_count()
+
+    def read_conditions(self):
+        """The conditions as entered. Rows with no value are left out, so a new row doesn't filter anything yet."""
+        conditions = []
+        for row in range(self.table.rowCount()):
+            column = self.table.cellWidget(row, 0).currentText().strip()
+            operator = self.table.cellWidget(row, 1).currentText()
+            text = self.table.cellWidget(row, 2).text()
+            if not text.strip():
+                continue
+            if column not in self.range_index.df.columns:
+                raise FilterError(f"There is no column named '{column}'.")
+            conditions.append(Condition.from_text(column, operator, text, self.range_index.is_numeric(column)))
+        return conditions
+
+    def update_count(self):
+        match_all = self.match_combo.currentIndex() == 0
+        try:
+            conditions = self.read_conditions()
+            matched = int(self.range_index.mask(conditions, match_all).sum())
+        except FilterError as e:
+            self.count_label.setText(str(e))
+            self.apply_button.setEnabled(False)
+            return
+
+        self.conditions = conditions
+        self.match_all = match_all
+        self.count_label.setText(f"{matched} of {len(self.range_index.df)} players match.")
+        self.apply_button.setEnabled(True)
+
+class TeamSummaryDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Team Summary")
+        self.resize(1100, 700)
+
+        layout = QVBoxLayout(self)
+
+        self.table = QTableWidget()
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSortingEnabled(True)
+        layout.addWidget(self.table)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def refresh(self, summary):
+        self.table.setSortingEnabled(False)
+        self.table.clear()
+        self.table.setColumnCount(len(summary.columns) + 1)
+        self.table.setHorizontalHeaderLabels(["Team"] + [str(col) for col in summary.columns])
+        self.table.setRowCount(len(summary))
+
+        for row, (team, values) in enumerate(summary.iterrows()):
+            self.table.setItem(row, 0, QTableWidgetItem(str(team)))
+            for column, value in enumerate(values, start=1):
+                text = "-" if pd.isna(value) else (f"{value:g}" if isinstance(value, float) else str(value))
+                self.table.setItem(row, column, NumericTableWidgetItem(text))
+
+        self.table.resizeColumnsToContents()
+        self.table.setSortingEnabled(True)
+
+class LeaderboardDialog(QDialog):
+    """Top players per position for any rating. Double-clicking a player opens them in the editor."""
+
+    player_activated = pyqtSignal(object)
+
+    def __init__(self, leaderboards, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Leaderboards")
+        self.resize(700, 650)
+        self.leaderboards = leaderboards
+
+        layout = QVBoxLayout(self)
+
+        controls_layout = QHBoxLayout()
+        self.position_combo = QComboBox()
+        self.rating_combo = QComboBox()
+        self.rating_combo.setEditable(True)
+        self.rating_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self.count_spinbox = QSpinBox()
+        self.count_spinbox.setRange(1, 500)
+        self.count_spinbox.setValue(20)
+        self.lowest_checkbox = QCheckBox("Lowest first")
+        controls_layout.addWidget(QLabel("Position:"))
+        controls_layout.addWidget(self.position_combo)
+        controls_layout.addWidget(QLabel("Rating:"))
+        controls_layout.addWidget(self.rating_combo, 1)
+        controls_layout.addWidget(QLabel("Top:"))
+        controls_layout.addWidget(self.count_spinbox)
+        controls_layout.addWidget(self.lowest_checkbox)
+        layout.addLayout(controls_layout)
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(5)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+        self.set_choices()
+        self.position_combo.currentIndexChanged.connect(self.refresh)
+        self.rating_combo.currentTextChanged.connect(self.refresh)
+        self.count_spinbox.valueChanged.connect(self.refresh)
+        self.lowest_checkbox.toggled.connect(self.refresh)
+        self.table.cellDoubleClicked.connect(self._activate_row)
+
+    def set_choices(self):
+        """Fills the position and rating lists from the roster, keeping the current choices where they still exist."""
+        position, rating = self.position_combo.currentText(), self.rating_combo.currentText() or "Overall"
+        for combo in (self.position_combo, self.rating_combo):
+            combo.blockSignals(True)
+            combo.clear()
+        self.position_combo.addItem("All Positions")
+        self.position_combo.addItems(self.leaderboards.positions())
+        self.rating_combo.addItems(sorted(self.leaderboards.rating_columns()))
+        self.position_combo.setCurrentText(position)
+        self.rating_combo.setCurrentText(rating)
+        for combo in (self.position_combo, self.rating_combo):
+            combo.blockSignals(False)
+
+    def refresh(self):
+        rating = self.rating_combo.currentText()
+        if rating not in self.leaderboards.model.columns:
+            self.table.setRowCount(0)
+            return
+        position = self.position_combo.currentText()
+        position = ALL_POSITIONS if position == "All Positions" else position
+        leaders = self.leaderboards.top(position, rating, self.count_spinbox.value(), self.lowest_checkbox.isChecked())
+
+        model = self.leaderboards.model
+        self.table.setHorizontalHeaderLabels(["Rank", "Name", "Team", "Position", rating])
+        self.table.setRowCount(len(leaders))
+        for row, index in enumerate(leaders):
+            player = model.loc[index]
+            value = player[rating]
+            values = (row + 1, f"{player.get('First Name', '')} {player.get('Last Name', '')}",
+                      player.get('TeamName', ''), player.get('PositionName', ''),
+                      f"{value:g}" if isinstance(value, float) else value)
+            for column, text in enumerate(values):
+                item = QTableWidgetItem(str(text))
+                item.setData(Qt.ItemDataRole.UserRole, index)
+                self.table.setItem(row, column, item)
+        self.table.resizeColumnsToContents()
+        self.table.horizontalHeader().setStretchLastSection(True)
+
+    def _activate_row(self, row, column):
+        item = self.table.item(row, 0)
+        if item is not None:
+            self.player_activated.emit(item.data(Qt.ItemDataRole.UserRole))
 
 class PortraitCopierDialog(QDialog):
     def __init__(self, destination_df, data_manager, parent=None):
@@ -334,6 +950,7 @@ class PortraitCopierDialog(QDialog):
         QApplication.processEvents()
         
         changes = []
+        copied = {}
         for index, player in self.destination_df.iterrows():
             key = f"{player.get('First Name', '')}_{player.get('Last Name', '')}_{player.get('PositionName', '')}"
             
@@ -343,6 +960,7 @@ class PortraitCopierDialog(QDialog):
                 
                 if pd.notna(new_portrait_id) and new_portrait_id != old_portrait_id:
                     self.destination_df.at[index, 'Portrait ID'] = new_portrait_id
+                    copied[index] = {'Portrait ID': new_portrait_id}
                     changes.append({
                         "name": f"{player.get('First Name', '')} {player.get('Last Name', '')}",
                         "pos": player.get('PositionName', ''),
@@ -355,6 +973,7 @@ class PortraitCopierDialog(QDialog):
         if changes:
             self.status_label.setText(f"Success! Copied {len(changes)} new Portrait IDs. Please save your roster to keep these changes.")
             self.parent().player_editor.mark_dirty()
+            self.parent().on_cells_changed(copied)
         else:
             self.status_label.setText("Process complete. No matching players with different Portrait IDs were found.")
 
@@ -371,28 +990,39 @@ class RosterWorker(QObject):
     save_finished = pyqtSignal(bool, str)
     error = pyqtSignal(str)
     progress_updated = pyqtSignal(int)
+    profile_ready = pyqtSignal(object)
 
     def __init__(self, data_manager):
         super().__init__()
         self.data_manager = data_manager
+        self.track_memory = False
 
-    def load_roster(self, path):
+    def load_roster(self, path, projection=None):
+        profiler = PipelineProfiler("Load roster", self.track_memory)
+        profiler.start()
         try:
-            # Reading the file with Node.js
+            # Reading the file with Node.js, limited to the tables and fields in the projection
             self.progress_updated.emit(10)
-            command = [NODE_EXECUTABLE_PATH, NODE_SCRIPT_PATH, 'read', path]
-            result = subprocess.run(command, capture_output=True, text=True, check=True, shell=True)
+            with profiler.stage("node read"):
+                command = [NODE_EXECUTABLE_PATH, NODE_SCRIPT_PATH, 'read', path, '--profile']
+                if projection is not None:
+                    command += projection.node_args()
+                result = subprocess.run(command, capture_output=True, text=True, check=True, shell=True)
+            profiler.add_node_report(result.stderr)
             
             # Parsing the huge JSON string from Node.js
             self.progress_updated.emit(50)
-            all_data = json.loads(result.stdout)
+            with profiler.stage("json parse"):
+                all_data = json.loads(result.stdout)
             
             # Creating the initial pandas DataFrames
             self.progress_updated.emit(60)
-            dataframes = {}
-            for table_name, records in all_data.items():
-                if records:
-                    dataframes[table_name] = pd.DataFrame.from_records(records)
+            with profiler.stage("build dataframes"):
+                dataframes = {}
+                for table_name, records in all_data.items():
+                    if records:
+                        dataframes[table_name] = pd.DataFrame.from_records(records)
+                del all_data
 
             if 'play' not in dataframes:
                 self.load_finished.emit(None)
@@ -402,115 +1032,118 @@ class RosterWorker(QObject):
 
             # Merging and cleaning the data
             self.progress_updated.emit(70)
-            if 'injy' in dataframes:
-                injy_df = dataframes['injy']
-                injury_columns_to_merge = ['PGID', 'INIR', 'INJL', 'INJS', 'INJT', 'INSI', 'INTW']
-                filtered_injy_df = injy_df[injury_columns_to_merge].copy()
-                roster_df = pd.merge(roster_df, filtered_injy_df, on='PGID', how='left')
-            
-            roster_df = roster_df.loc[:,~roster_df.columns.duplicated()]
+            with profiler.stage("merge injuries"):
+                if 'injy' in dataframes:
+                    injy_df = dataframes['injy']
+                    filtered_injy_df = injy_df[INJURY_FIELDS].copy()
+                    roster_df = pd.merge(roster_df, filtered_injy_df, on='PGID', how='left')
+                
+                roster_df = roster_df.loc[:,~roster_df.columns.duplicated()]
 
             # Mapping IDs to readable text (can be slow)
             self.progress_updated.emit(80)
-            
-            # Unmapped data calculation
-            raw_columns = set(roster_df.columns)
-            mapped_cryptic_columns = set(self.data_manager.header_map.keys())
-            unmapped_columns = list(raw_columns - mapped_cryptic_columns)
-            if unmapped_columns:
-                unmapped_data_col = roster_df[unmapped_columns].to_dict('records')
-
-            # Create new display columns
-            if 'PPOS' in roster_df.columns:
-                roster_df['PositionName'] = pd.to_numeric(roster_df['PPOS'], errors='coerce').astype('Int64').map(self.data_manager.position_map).fillna("Unknown")
-            if 'TGID' in roster_df.columns:
-                roster_df['TeamName'] = pd.to_numeric(roster_df['TGID'], errors='coerce').astype('Int64').map(self.data_manager.team_map).fillna("Unknown")
-            if 'PCOL' in roster_df.columns:
-                roster_df['CollegeName'] = pd.to_numeric(roster_df['PCOL'], errors='coerce').astype('Int64').map(self.data_manager.college_map).fillna("Unknown")
-
-            # Rename cryptic columns
-            roster_df.rename(columns=self.data_manager.header_map, inplace=True)
-
-            # Map remaining ID columns
-            map_configs = {
-                'XP Rate/TraitDevelopment': self.data_manager.dev_trait_map,
-                'Home State': self.data_manager.state_map,
-                'Archetype': self.data_manager.archetype_map,
-                'Career Phase': self.data_manager.career_phase_map,
-                'QB Style': self.data_manager.throw_style_map
-            }
-            for col, value_map in map_configs.items():
-                if col in roster_df.columns and value_map:
-                    roster_df[col] = pd.to_numeric(roster_df[col], errors='coerce').astype('Int64').map(value_map).fillna("Unknown")
-            
-            if 'DRAFTTEAM' in roster_df.columns and self.data_manager.team_map:
-                roster_df['DRAFTTEAM'] = pd.to_numeric(roster_df['DRAFTTEAM'], errors='coerce').astype('Int64').map(self.data_manager.team_map).fillna("None")
-
-            if 'unmapped_data_col' in locals():
-                roster_df['UnmappedData'] = unmapped_data_col
-            
-            dataframes['play'] = roster_df
+            with profiler.stage("map columns"):
+                dataframes['play'] = self.data_manager.map_play_table(roster_df)
             
             self.progress_updated.emit(100)
+            self.profile_ready.emit(profiler)
             self.load_finished.emit(dataframes)
 
         except Exception as e:
             self.error.emit(f"An unexpected error occurred during loading: {e}")
+        finally:
+            profiler.stop()
 
     def save_roster(self, dfs_to_save, original_path, new_path):
+        profiler = PipelineProfiler("Save roster", self.track_memory)
+        profiler.start()
         try:
             # Prepare the data for saving
             self.progress_updated.emit(10)
-            
-            df_play = dfs_to_save['play'].copy()
-
-            REVERSE_MAP_CONFIG = {
-                'QB Style': ('PQBS', self.data_manager.inverse_throw_style_map),
-                'XP Rate/TraitDevelopment': ('PROL', self.data_manager.inverse_dev_trait_map),
-                'Home State': ('PHSN', self.data_manager.inverse_state_map),
-                'Archetype': ('PLTY', self.data_manager.inverse_archetype_map),
-                'Career Phase': ('PCPH', self.data_manager.inverse_career_phase_map),
-                'DRAFTTEAM': ('PLDT', self.data_manager.inverse_team_map)
-            }
-            for readable_col, (cryptic_col, inverse_map) in REVERSE_MAP_CONFIG.items():
-                if readable_col in df_play.columns:
-                    df_play[cryptic_col] = df_play[readable_col].map(inverse_map)
-            
-            display_only_columns = list(REVERSE_MAP_CONFIG.keys()) + ['PositionName', 'TeamName', 'CollegeName', 'UnmappedData']
-            df_play.drop(columns=display_only_columns, inplace=True, errors='ignore')
-
-            inverse_header_map = {v: k for k, v in self.data_manager.header_map.items()}
-            df_play.rename(columns=inverse_header_map, inplace=True)
-            df_play = df_play.loc[:,~df_play.columns.duplicated()]
-            
-            dfs_to_save['play'] = df_play
+            # dfs_to_save is a snapshot taken for this save, so its tables are changed in place
+            with profiler.stage("prepare play table"):
+                dfs_to_save['play'] = self.data_manager.to_raw_play_table(dfs_to_save['play'], copy=False)
 
             # Convert all tables to JSON
             self.progress_updated.emit(40)
-            records_to_save = {}
-            for table_name, df in dfs_to_save.items():
-                df_copy = df.copy()
-                for col in df_copy.select_dtypes(include=np.number).columns:
-                    df_copy[col] = df_copy[col].replace([np.inf, -np.inf], np.nan).fillna(0).astype(int)
-                df_copy = df_copy.where(pd.notna(df_copy), None)
-                records_to_save[table_name] = df_copy.to_dict('records')
-
-            json_to_pass = json.dumps(records_to_save, allow_nan=False)
+            with profiler.stage("convert to records"):
+                records_to_save = {}
+                for table_name, df in dfs_to_save.items():
+                    for col in df.select_dtypes(include=np.number).columns:
+                        df[col] = df[col].replace([np.inf, -np.inf], np.nan).fillna(0).astype(int)
+                    df = df.where(pd.notna(df), None)
+                    records_to_save[table_name] = df.to_dict('records')
+
+            with profiler.stage("json encode"):
+                json_to_pass = json.dumps(records_to_save, allow_nan=False)
+                del records_to_save
             
             # Writing the file with Node.js
             self.progress_updated.emit(60)
-            command = [NODE_EXECUTABLE_PATH, NODE_SCRIPT_PATH, 'write', original_path, new_path]
-            result = subprocess.run(command, input=json_to_pass, capture_output=True, text=True, check=True, shell=True)
+            with profiler.stage("node write"):
+                command = [NODE_EXECUTABLE_PATH, NODE_SCRIPT_PATH, 'write', original_path, new_path, '--profile']
+                result = subprocess.run(command, input=json_to_pass, capture_output=True, text=True, check=True, shell=True)
+            profiler.add_node_report(result.stderr)
             
             self.progress_updated.emit(100)
+            self.profile_ready.emit(profiler)
             self.save_finished.emit(True, "Save successful.")
             
         except Exception as e:
             self.error.emit(f"An unexpected error occurred during saving: {e}")
+        finally:
+            profiler.stop()
+
+class BulkOperationWorker(QObject):
+    """Runs a per-player function over a snapshot of the roster on a worker thread.
+
+    Results are collected as {index: {column: value}} and only handed back once the
+    whole snapshot has been processed, so the caller can commit them in one step.
+    """
+    progress_updated = pyqtSignal(int, str)
+    finished = pyqtSignal(object, bool)
+    error = pyqtSignal(str)
+
+    def __init__(self, snapshot, row_function, progress_interval_ms=BULK_PROGRESS_INTERVAL_MS):
+        super().__init__()
+        self.snapshot = snapshot
+        self.row_function = row_function
+        self.progress_interval = progress_interval_ms / 1000
+        self._cancel_requested = False
+
+    def cancel(self):
+        # Called directly from the GUI thread; the run loop checks the flag between players
+        self._cancel_requested = True
+
+    def run(self):
+        try:
+            rows = self.snapshot.to_dict('index')
+            total = len(rows)
+            results = {}
+            last_report = 0.0
+
+            for processed, (index, player_data) in enumerate(rows.items(), start=1):
+                if self._cancel_requested:
+                    self.finished.emit({}, True)
+                    return
+
+                changes = self.row_function(player_data)
+                if changes:
+                    results[index] = changes
+
+                now = time.monotonic()
+                if now - last_report >= self.progress_interval or processed == total:
+                    last_report = now
+                    self.progress_updated.emit(int((processed / total) * 100), f"Processing {processed}/{total}...")
+
+            self.finished.emit(results, False)
+        except Exception as e:
+            self.error.emit(f"An unexpected error occurred during the bulk operation: {e}")
 
 class DataManager:
     def __init__(self):
         self.header_map = {}
+        self.codecs = ColumnCodecs([])
         self.position_map = {}
         self.team_map = {}
         self.college_map = {}
@@ -593,6 +1226,8 @@ class DataManager:
             self.inverse_career_phase_map = {v: k for k, v in self.career_phase_map.items()}
             self.inverse_throw_style_map = {v: k for k, v in self.throw_style_map.items()}
 
+            self.codecs = ColumnCodecs.from_config(config_data)
+
         except FileNotFoundError:
             QMessageBox.critical(None, "Config Error", f"config.json not found in {CONFIG_DIR}. The application cannot start.")
         except json.JSONDecodeError:
@@ -600,9 +1235,38 @@ class DataManager:
         except Exception as e:
             QMessageBox.critical(None, "Config Error", f"An unexpected error occurred while parsing config.json: {e}")
 
+    def map_play_table(self, roster_df):
+        """Turns a PLAY table into the display table: readable column names and mapped IDs as labels.
+
+        Fields header_map doesn't know are kept per player, as a dict in the UnmappedData column.
+        """
+        unmapped_columns = [col for col in roster_df.columns if col not in self.header_map]
+        unmapped_data = roster_df[unmapped_columns].to_dict('records') if unmapped_columns else None
+
+        roster_df.rename(columns=self.header_map, inplace=True)
+
+        # Mapped IDs become categorical labels; PositionName, TeamName and CollegeName sit next to their IDs
+        self.codecs.decode_frame(roster_df)
+
+        if unmapped_data is not None:
+            roster_df['UnmappedData'] = unmapped_data
+        return roster_df
+
+    def to_raw_play_table(self, roster_df, copy=True):
+        """Turns the display table back into PLAY fields: readable values mapped to IDs and cryptic column names.
+
+        copy=False reuses roster_df's columns, for a table nothing else holds on to.
+        """
+        df_play = self.codecs.encode_frame(roster_df.copy() if copy else roster_df)
+        df_play.drop(columns=['UnmappedData'], inplace=True, errors='ignore')
+
+        inverse_header_map = {v: k for k, v in self.header_map.items()}
+        df_play.rename(columns=inverse_header_map, inplace=True)
+        return df_play.loc[:,~df_play.columns.duplicated()]
+
     def _load_raw_player_data(self, path):
         try:
-            command = [NODE_EXECUTABLE_PATH, NODE_SCRIPT_PATH, 'read', path]
+            command = [NODE_EXECUTABLE_PATH, NODE_SCRIPT_PATH, 'read', path] + RosterProjection.full(['PLAY']).node_args()
             result = subprocess.run(command, capture_output=True, text=True, check=True, shell=True)
             
             all_data = json.loads(result.stdout)
@@ -646,7 +1310,11 @@ class ChangesConfirmationDialog(QDialog):
 
 class PlayerEditorWidget(QWidget):
     is_dirty_changed = pyqtSignal(bool)
+    # {index: {column: value}} for the cells apply_changes wrote, same shape as the bulk tools' results
+    cells_changed = pyqtSignal(object)
     show_unmapped_requested = pyqtSignal()
+    # The Advanced tab was opened while the fields it shows haven't been read yet
+    remaining_fields_requested = pyqtSignal()
 
     def __init__(self, calculator, data_manager):
         super().__init__()
@@ -659,9 +1327,12 @@ class PlayerEditorWidget(QWidget):
         self.labels = {}
         self.original_player_data = {}
         self._is_dirty = False
+        # Fields typed into the editor that aren't in the model yet; is_dirty also covers committed edits
+        self.has_uncommitted_edits = False
         self.trait_attributes = set()
         self.current_animation = None
         self.tab_buttons = {}
+        self.remaining_fields_pending = False
 
         # Create the main layout and the main stack widget
         self.main_layout = QHBoxLayout(self)
@@ -748,6 +1419,8 @@ class PlayerEditorWidget(QWidget):
 
     @is_dirty.setter
     def is_dirty(self, value):
+        if not value:
+            self.has_uncommitted_edits = False
         if self._is_dirty != value:
             self._is_dirty = value
             self.is_dirty_changed.emit(value)
@@ -824,8 +1497,9 @@ class PlayerEditorWidget(QWidget):
             self._create_tab(tab_title, groups)
         
         categorized_attrs = self.get_categorized_attributes()
-        advanced_attrs = [col for col in self.model.columns if col not in categorized_attrs]
-        if advanced_attrs:
+        # UnmappedData holds a dict per player and has its own dialog; a text editor would overwrite it with a string
+        advanced_attrs = [col for col in self.model.columns if col not in categorized_attrs and col != 'UnmappedData']
+        if advanced_attrs or self.remaining_fields_pending:
             self._create_tab("Advanced", {"Uncategorized": advanced_attrs})
             
         self.tab_button_layout.addStretch()
@@ -834,6 +1508,11 @@ class PlayerEditorWidget(QWidget):
         if self.current_animation and self.current_animation.state() == QPropertyAnimation.State.Running:
             return
 
+        if self.remaining_fields_pending and clicked_button.text() == "Advanced":
+            clicked_button.setChecked(False)
+            self.remaining_fields_requested.emit()
+            return
+
         target_index = self.tab_buttons.get(clicked_button)
         if target_index is None or self.stacked_widget_for_pages.currentIndex() == target_index:
             clicked_button.setChecked(True)
@@ -867,6 +1546,13 @@ class PlayerEditorWidget(QWidget):
         self.current_animation = self.fade_out
         self.fade_out.start()
 
+    def show_tab(self, title):
+        """Switches straight to a tab, without the fade."""
+        for button, index in self.tab_buttons.items():
+            if button.text() == title:
+                self.stacked_widget_for_pages.setCurrentIndex(index)
+            button.setChecked(button.text() == title)
+
     def load_ui_structure(self):
         try:
             path = os.path.join(CONFIG_DIR, 'ui_layout.json')
@@ -1002,6 +1688,7 @@ class PlayerEditorWidget(QWidget):
 
     def _on_field_changed(self, attr):
         self.mark_dirty() # Keep main window title update logic
+        self.has_uncommitted_edits = True
 
         editor = self.editors.get(attr)
         label = self.labels.get(attr)
@@ -1119,6 +1806,7 @@ class PlayerEditorWidget(QWidget):
          
     def apply_changes(self):
         if self.player_index is not None and self.model is not None:
+            mapped_values = {}
             for attr, editor in self.editors.items():
                 if not editor.isEnabled():
                     continue
@@ -1136,38 +1824,47 @@ class PlayerEditorWidget(QWidget):
                 elif attr == 'Weight':
                     new_value = editor.value() - 160
                 
-                elif attr == 'Archetype':
-                    self.model.loc[self.player_index, 'Archetype'] = new_value
-                    if new_value in self.data_manager.inverse_archetype_map:
-                        self.model.loc[self.player_index, 'PLTY'] = self.data_manager.inverse_archetype_map[new_value]
-                elif attr == 'XP Rate/TraitDevelopment':
-                    self.model.loc[self.player_index, 'XP Rate/TraitDevelopment'] = new_value
-                    if new_value in self.data_manager.inverse_dev_trait_map:
-                        self.model.loc[self.player_index, 'PROL'] = self.data_manager.inverse_dev_trait_map[new_value]
-                elif attr == 'Home State':
-                    self.model.loc[self.player_index, 'Home State'] = new_value
-                    if new_value in self.data_manager.inverse_state_map:
-                        self.model.loc[self.player_index, 'PHSN'] = self.data_manager.inverse_state_map[new_value]
-                elif attr == 'PositionName':
-                    self.model.loc[self.player_index, 'PositionName'] = new_value
-                    if new_value in self.data_manager.inverse_position_map:
-                        self.model.loc[self.player_index, 'PPOS'] = self.data_manager.inverse_position_map[new_value]
-                elif attr == 'TeamName':
-                    self.model.loc[self.player_index, 'TeamName'] = new_value
-                    if new_value in self.data_manager.inverse_team_map:
-                        self.model.loc[self.player_index, 'TGID'] = self.data_manager.inverse_team_map[new_value]
-                elif attr == 'Career Phase':
-                    self.model.loc[self.player_index, 'Career Phase'] = new_value
-                    if new_value in self.data_manager.inverse_career_phase_map:
-                        self.model.loc[self.player_index, 'PCPH'] = self.data_manager.inverse_career_phase_map[new_value]
+                elif attr in self.data_manager.codecs:
+                    mapped_values[attr] = new_value
                 else:
                     self.model.loc[self.player_index, attr] = new_value
-            
+
+            self._apply_mapped_values(mapped_values)
             self.is_dirty = False
-            self.original_player_data = self.model.loc[self.player_index].to_dict()
+            new_player_data = self.model.loc[self.player_index].to_dict()
+            changed_cells = {attr: value for attr, value in new_player_data.items()
+                             if attr not in self.original_player_data or value != self.original_player_data[attr]}
+            self.original_player_data = new_player_data
+            if changed_cells:
+                self.cells_changed.emit({self.player_index: changed_cells})
             self._reset_all_label_styles()
             return True
         return False
+
+    def _apply_mapped_values(self, mapped_values):
+        # Runs after the ID spin boxes are written, so a changed label sets its ID. An ID that was
+        # edited by itself sets the label instead, or saving would write the old label's ID back.
+        codecs = self.data_manager.codecs
+        for column, label in mapped_values.items():
+            codec = codecs[column]
+            if not codec.in_place and codec.id_column in self.editors and label == self.original_player_data.get(column):
+                new_id = self.model.at[self.player_index, codec.id_column]
+                if new_id != self.original_player_data.get(codec.id_column):
+                    label = codec.decode([new_id])[0]
+            codecs.assign(self.model, self.player_index, column, label)
+
+            # Keep the pair of editors showing what was stored, for the next apply
+            for attr in {column, codec.id_column}:
+                editor = self.editors.get(attr)
+                if editor is None:
+                    continue
+                value = self.model.at[self.player_index, attr]
+                editor.blockSignals(True)
+                if isinstance(editor, QSpinBox):
+                    editor.setValue(int(value))
+                elif isinstance(editor, QComboBox):
+                    editor.setCurrentText(str(value))
+                editor.blockSignals(False)
         
     def _load_player_image(self, portrait_id):
         target_label = self.header_portrait
@@ -1193,6 +1890,11 @@ class PlayerEditorWidget(QWidget):
             target_label.setText("Error")
 
 class RosterEditor(QMainWindow):
+    # (tables, original path, new path); queued to the roster worker so a save runs on its thread
+    save_requested = pyqtSignal(object, str, str)
+    # (cache, portrait ID, PIL image or None); emitted from the thumbnail pool threads
+    thumbnail_ready = pyqtSignal(object, str, object)
+
     def __init__(self):
         super().__init__()
         self.progress_dialog = None
@@ -1207,7 +1909,30 @@ class RosterEditor(QMainWindow):
         self.model = None
         self.team_df = None
         self.depthchart_df = None
+        self.team_aggregates = None
+        self.team_summary_dialog = None
+        # Sorted numeric columns for the advanced filter, kept in step with edits
+        self.range_index = None
+        self.advanced_conditions = []
+        self.advanced_match_all = True
+        # Cached top-N lists per (position, rating)
+        self.leaderboards = None
+        self.leaderboard_dialog = None
+        # Portrait thumbnails for the player list, by portrait ID; None for a portrait that couldn't be loaded
+        self.thumbnail_cache = None
+        self.thumbnail_pixmaps = {}
+        self.journal = None
+        self._save_path = None
+        # True while the PLAY fields the load left out haven't been read from the roster file yet
+        self.remaining_fields_pending = False
+        self.load_projection = None
+        # Edits committed while a save is writing its snapshot, as (table, changes); None when no save is running
+        self._edits_during_save = None
         self.filtered_model_indices = None
+        self.last_profiles = {}
+        self._bulk_thread = None
+        self._bulk_worker = None
+        self._bulk_on_complete = None
         
         self.sort_column = 2 # Default to the 'Overall' column (index 2)
         self.sort_order = Qt.SortOrder.DescendingOrder
@@ -1229,9 +1954,16 @@ class RosterEditor(QMainWindow):
             self.data_manager.header_map,
             self.data_manager.position_group_map
         )
+        rating_columns = ['Overall'] + list(self.overall_calculator.short_to_readable_map.values())
+        self.roster_validator = RosterValidator(default_rules(self.data_manager, rating_columns))
         
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
+        self.save_progress_bar = QProgressBar()
+        self.save_progress_bar.setRange(0, 100)
+        self.save_progress_bar.setMaximumWidth(200)
+        self.save_progress_bar.hide()
+        self.status_bar.addPermanentWidget(self.save_progress_bar)
 
         self.worker_thread = QThread()
         self.roster_worker = RosterWorker(self.data_manager)
@@ -1240,6 +1972,7 @@ class RosterEditor(QMainWindow):
         # Build UI and connect all signals
         self.setup_ui()
         self.connect_signals()
+        self._apply_thumbnail_settings()
 
         self.worker_thread.start()
 
@@ -1262,15 +1995,22 @@ class RosterEditor(QMainWindow):
         self.search_box = QLineEdit()
         self.position_filter = QComboBox()
         self.team_filter = QComboBox()
+        self.advanced_filter_button = QPushButton("Advanced Filter...")
         self.reset_filters_button = QPushButton("Reset Filters")
         filter_layout.addRow(QLabel("Search:"), self.search_box)
         filter_layout.addRow(QLabel("Position:"), self.position_filter)
         filter_layout.addRow(QLabel("Team:"), self.team_filter)
+        filter_layout.addRow(self.advanced_filter_button)
         filter_layout.addRow(self.reset_filters_button)
         left_layout.addWidget(filter_group_box)
         self.player_list = QTableWidget()
-        self.player_list.setColumnCount(4)
-        self.player_list.setHorizontalHeaderLabels(["Name", "Position", "Overall", "Age"])
+        self.player_list.setColumnCount(5)
+        self.player_list.setHorizontalHeaderLabels(["Name", "Position", "Overall", "Age", ""])
+        self.default_row_height = self.player_list.verticalHeader().defaultSectionSize()
+        # Thumbnails are loaded for the rows in view once scrolling settles
+        self.thumbnail_timer = QTimer(self)
+        self.thumbnail_timer.setSingleShot(True)
+        self.thumbnail_timer.setInterval(50)
         self.player_list.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         self.player_list.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.player_list.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
@@ -1278,11 +2018,20 @@ class RosterEditor(QMainWindow):
         menu_bar = self.menuBar()
         file_menu = menu_bar.addMenu("File")
         self.settings_action = file_menu.addAction("Settings...")
+        file_menu.addSeparator()
+        self.export_spreadsheet_action = file_menu.addAction("Export Players to Spreadsheet...")
+        self.export_spreadsheet_action.setEnabled(False)
+        self.import_spreadsheet_action = file_menu.addAction("Import Players from Spreadsheet...")
+        self.import_spreadsheet_action.setEnabled(False)
         self.player_list.setSortingEnabled(True)
 
         header = self.player_list.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(THUMBNAIL_COLUMN, QHeaderView.ResizeMode.Fixed)
+        header.resizeSection(THUMBNAIL_COLUMN, THUMBNAIL_SIZE + 8)
+        header.moveSection(THUMBNAIL_COLUMN, 0)
+        self.player_list.setIconSize(QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
 
         menu_bar = self.menuBar()
         tools_menu = menu_bar.addMenu("Tools")
@@ -1291,12 +2040,26 @@ class RosterEditor(QMainWindow):
         self.regen_all_archetypes_action = tools_menu.addAction("Regenerate All Archetypes")
         tools_menu.addSeparator()
         self.recalc_all_ovrs_action = tools_menu.addAction("Recalculate All Overalls")
+        self.rebuild_depth_charts_action = tools_menu.addAction("Rebuild Depth Charts...")
+        self.team_summary_action = tools_menu.addAction("Team Summary...")
+        self.team_summary_action.setEnabled(False)
+        self.leaderboards_action = tools_menu.addAction("Leaderboards...")
+        self.leaderboards_action.setEnabled(False)
+        tools_menu.addSeparator()
+        self.diff_source_action = tools_menu.addAction("Compare With Source File...")
+        self.diff_source_action.setEnabled(False)
+        self.diff_files_action = tools_menu.addAction("Compare Two Roster Files...")
+        self.validate_roster_action = tools_menu.addAction("Validate Roster...")
+        self.validate_roster_action.setEnabled(False)
+        self.bulk_edit_action = tools_menu.addAction("Bulk Edit...")
+        self.bulk_edit_action.setEnabled(False)
         tools_menu.addSeparator()
         self.remove_all_injuries_action = tools_menu.addAction("Remove All Injuries")
         self.remove_all_injuries_action.setEnabled(False)
         tools_menu.addSeparator()
         self.debug_save_action = tools_menu.addAction("Debug Save Process")
         self.debug_save_action.setEnabled(False)
+        self.show_profile_action = tools_menu.addAction("Show Load/Save Profile...")
         tools_menu.addSeparator()
         self.copy_portraits_action = tools_menu.addAction("Copy Portrait IDs from Roster...")
         self.copy_portraits_action.setEnabled(False)
@@ -1304,6 +2067,7 @@ class RosterEditor(QMainWindow):
         self.convert_archetypes_action.setEnabled(False)
         self.regen_all_archetypes_action.setEnabled(False) # Disabled until roster is loaded
         self.recalc_all_ovrs_action.setEnabled(False)
+        self.rebuild_depth_charts_action.setEnabled(False)
         self.fix_invalid_archetypes_action.setEnabled(False)
 
         self.recalc_ovr_button = QPushButton("Recalculate OVR")
@@ -1337,34 +2101,66 @@ class RosterEditor(QMainWindow):
         self.load_button.clicked.connect(self.load_roster_file)
         self.save_button.clicked.connect(self.save_roster_file)
         self.player_list.cellClicked.connect(self.on_player_selected)
+        self.player_list.verticalScrollBar().valueChanged.connect(lambda: self.thumbnail_timer.start())
+        self.player_list.horizontalHeader().sortIndicatorChanged.connect(lambda: self.thumbnail_timer.start())
+        self.thumbnail_timer.timeout.connect(self._load_visible_thumbnails)
+        self.thumbnail_ready.connect(self._on_thumbnail_ready)
         self.settings_action.triggered.connect(self.open_settings_dialog)
+        self.export_spreadsheet_action.triggered.connect(self.export_spreadsheet)
+        self.import_spreadsheet_action.triggered.connect(self.import_spreadsheet)
         self.search_box.textChanged.connect(self.apply_filters)
         self.position_filter.currentIndexChanged.connect(self.apply_filters)
         self.team_filter.currentIndexChanged.connect(self.apply_filters)
+        self.advanced_filter_button.clicked.connect(self.open_advanced_filter)
         self.reset_filters_button.clicked.connect(self.reset_filters)
         self.show_unmapped_button.clicked.connect(self.show_unmapped_player_data)
         self.regen_archetype_button.clicked.connect(self.regenerate_player_archetype)
         self.regen_all_archetypes_action.triggered.connect(self.regenerate_all_archetypes)
         self.recalc_ovr_button.clicked.connect(self.recalculate_player_overall)
         self.recalc_all_ovrs_action.triggered.connect(self.recalculate_all_overalls)
+        self.rebuild_depth_charts_action.triggered.connect(self.rebuild_depth_charts)
+        self.team_summary_action.triggered.connect(self.show_team_summary)
+        self.leaderboards_action.triggered.connect(self.show_leaderboards)
+        self.diff_source_action.triggered.connect(self.diff_against_source)
+        self.diff_files_action.triggered.connect(self.diff_roster_files)
+        self.validate_roster_action.triggered.connect(self.validate_roster)
+        self.bulk_edit_action.triggered.connect(self.bulk_edit)
         self.convert_archetypes_action.triggered.connect(self.convert_old_archetypes)
         self.remove_all_injuries_action.triggered.connect(self.remove_all_injuries)
         self.debug_player_button.clicked.connect(self.debug_player_archetype)
         self.fix_invalid_archetypes_action.triggered.connect(self.fix_logically_invalid_archetypes)
         self.debug_save_action.triggered.connect(self.diagnose_save_process)
+        self.show_profile_action.triggered.connect(self.show_pipeline_profile)
         self.copy_portraits_action.triggered.connect(self.open_portrait_copier)
 
+        self.save_requested.connect(self.roster_worker.save_roster)
         self.roster_worker.load_finished.connect(self.on_load_finished)
         self.roster_worker.save_finished.connect(self.on_save_finished)
         self.roster_worker.error.connect(self.on_worker_error)
         self.roster_worker.progress_updated.connect(self.update_progress_bar)
+        self.roster_worker.profile_ready.connect(self.on_profile_ready)
         self.player_editor.is_dirty_changed.connect(self.set_window_dirty_status)
+        self.player_editor.cells_changed.connect(self.on_cells_changed)
+        self.player_editor.remaining_fields_requested.connect(self.show_advanced_fields)
 
     def update_progress_bar(self, value):
-        if self.progress_dialog:
+        if self.is_saving:
+            self.save_progress_bar.setValue(value)
+        elif self.progress_dialog:
             message = f"Processing... ({value}%)"
             self.progress_dialog.update_progress(value, message)
 
+    def on_profile_ready(self, profiler):
+        self.last_profiles[profiler.name] = profiler
+
+    def show_pipeline_profile(self):
+        if not self.last_profiles:
+            QMessageBox.information(self, "No Profile", "Load or save a roster first to record a profile.")
+            return
+
+        dialog = PipelineProfileDialog(list(self.last_profiles.values()), self)
+        dialog.exec()
+
     def load_settings(self):
         try:
             with open('settings.json', 'r') as f:
@@ -1384,6 +2180,7 @@ class RosterEditor(QMainWindow):
         if dialog.exec():
             self.settings = dialog.get_settings()
             self.save_settings()
+            self._apply_thumbnail_settings()
             QMessageBox.information(self, "Settings Saved", 
                                     "Settings have been saved. Please re-select a player to see image changes.")
 
@@ -1391,6 +2188,8 @@ class RosterEditor(QMainWindow):
         if self.player_editor.player_index is None or self.model is None:
             QMessageBox.warning(self, "No Player Selected", "Please select a player from the list first.")
             return
+        if not self._load_remaining_fields():
+            return
 
         if 'UnmappedData' not in self.model.columns:
             QMessageBox.information(self, "No Unmapped Data", "No unmapped data was found in this roster file.")
@@ -1423,37 +2222,26 @@ class RosterEditor(QMainWindow):
         if reply == QMessageBox.StandardButton.No:
             return
 
-        self.progress_dialog = ProgressDialog("Converting Old Archetypes...", self)
-        self.progress_dialog.show()
-        
-        changes_made = 0
-        processed_count = 0
         inverse_archetype_map = self.data_manager.inverse_archetype_map
 
-        for index, player in players_to_convert.iterrows():
-            processed_count += 1
-            progress = int((processed_count / num_to_convert) * 100)
-            self.progress_dialog.update_progress(progress, f"Processing {processed_count}/{num_to_convert}...")
-
-            current_archetype = player['Archetype']
-            new_archetype = conversion_map.get(current_archetype)
-            
+        def convert_player(player):
+            new_archetype = conversion_map.get(player['Archetype'])
             if new_archetype:
                 new_id = inverse_archetype_map.get(new_archetype)
                 if new_id is not None:
-                    self.model.at[index, 'Archetype'] = new_archetype
-                    self.model.at[index, 'PLTY'] = new_id
-                    changes_made += 1
+                    return {'Archetype': new_archetype}
+            return None
 
-        self.progress_dialog.close()
-        self.progress_dialog = None
+        def on_complete(changes_made):
+            self.status_bar.showMessage(f"Conversion complete. {changes_made} players were updated.", 5000)
+            
+            if changes_made > 0:
+                self.player_editor.mark_dirty()
+                if self.player_editor.player_index is not None:
+                    self.player_editor.load_player(self.player_editor.player_index)
 
-        self.status_bar.showMessage(f"Conversion complete. {changes_made} players were updated.", 5000)
-        
-        if changes_made > 0:
-            self.player_editor.mark_dirty()
-            if self.player_editor.player_index is not None:
-                self.player_editor.load_player(self.player_editor.player_index)
+        self._run_bulk_operation("Converting Old Archetypes...", ['Archetype'], convert_player, on_complete,
+                                 rows=players_to_convert.index)
 
     def regenerate_player_archetype(self):
         if self.player_editor.player_index is None or self.model is None:
@@ -1501,34 +2289,26 @@ class RosterEditor(QMainWindow):
         if reply == QMessageBox.StandardButton.No:
             return
 
-        num_players = len(self.model)
-        self.progress_dialog = ProgressDialog("Regenerating All Archetypes...", self)
-        self.progress_dialog.show()
-        QApplication.processEvents() # Force UI update
-
-        changes_made = 0
-        processed_count = 0
-        for index, player_data in self.model.iterrows():
-            processed_count += 1
-            progress = int((processed_count / num_players) * 100)
-            self.progress_dialog.update_progress(progress, f"Processing {processed_count}/{num_players}...")
+        inverse_archetype_map = self.data_manager.inverse_archetype_map
 
+        def regenerate_player(player_data):
             new_archetype = self.archetype_calculator.calculate_best_archetype(player_data)
             if new_archetype and new_archetype != player_data.get("Archetype"):
-                new_id = self.data_manager.inverse_archetype_map.get(new_archetype)
+                new_id = inverse_archetype_map.get(new_archetype)
                 if new_id is not None:
-                    self.model.at[index, 'Archetype'] = new_archetype
-                    self.model.at[index, 'PLTY'] = new_id
-                    changes_made += 1
-        
-        self.progress_dialog.close()
-        self.progress_dialog = None
-        self.status_bar.showMessage(f"Archetype regeneration complete. {changes_made} players were updated.", 5000)
-        
-        if changes_made > 0:
-            self.player_editor.mark_dirty()
-            if self.player_editor.player_index is not None:
-                self.player_editor.load_player(self.player_editor.player_index)
+                    return {'Archetype': new_archetype}
+            return None
+
+        def on_complete(changes_made):
+            self.status_bar.showMessage(f"Archetype regeneration complete. {changes_made} players were updated.", 5000)
+            
+            if changes_made > 0:
+                self.player_editor.mark_dirty()
+                if self.player_editor.player_index is not None:
+                    self.player_editor.load_player(self.player_editor.player_index)
+
+        self._run_bulk_operation("Regenerating All Archetypes...", self.archetype_calculator.required_columns(),
+                                 regenerate_player, on_complete)
 
     def recalculate_player_overall(self):
         if self.player_editor.player_index is None or self.model is None:
@@ -1557,6 +2337,7 @@ class RosterEditor(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             self.model.at[player_index, 'Overall'] = new_ovr
+            self.on_cells_changed({player_index: {'Overall': new_ovr}})
             self.player_editor.mark_dirty()
             # Refresh the player list to show the new OVR
             self.refresh_player_list()
@@ -1574,37 +2355,482 @@ class RosterEditor(QMainWindow):
         if reply == QMessageBox.StandardButton.No:
             return
 
-        num_players = len(self.model)
-        self.progress_dialog = ProgressDialog("Recalculating All Overalls...", self)
-        self.progress_dialog.show()
+        def on_complete(changes_made):
+            self.status_bar.showMessage(f"OVR recalculation complete. {changes_made} players were updated.", 5000)
+            
+            if changes_made > 0:
+                self.player_editor.mark_dirty()
+                self.refresh_player_list()
+                if self.player_editor.player_index is not None:
+                    try:
+                        row_index = list(self.filtered_model_indices).index(self.player_editor.player_index)
+                        self.player_list.selectRow(row_index)
+                    except ValueError:
+                        pass
 
-        changes_made = 0
-        processed_count = 0
-        for index, player_data in self.model.iterrows():
-            processed_count += 1
-            progress = int((processed_count / num_players) * 100)
-            self.progress_dialog.update_progress(progress, f"Processing {processed_count}/{num_players}...")
+        self._run_bulk_operation("Recalculating All Overalls...", self.overall_calculator.required_columns(),
+                                 self._recalculate_overall_row, on_complete)
 
-            new_ovr = self.overall_calculator.calculate_overall(player_data)
-            if new_ovr is not None and new_ovr != player_data.get("Overall"):
-                self.model.at[index, 'Overall'] = new_ovr
-                changes_made += 1
-        
+    def _recalculate_overall_row(self, player_data):
+        new_ovr = self.overall_calculator.calculate_overall(player_data)
+        if new_ovr is not None and new_ovr != player_data.get("Overall"):
+            return {'Overall': new_ovr}
+        return None
 
-        self.progress_dialog.close()
-        self.progress_dialog = None
-        
-        self.status_bar.showMessage(f"OVR recalculation complete. {changes_made} players were updated.", 5000)
-        
-        if changes_made > 0:
+    def rebuild_depth_charts(self):
+        if self.model is None or self.depthchart_df is None:
+            QMessageBox.warning(self, "No Depth Charts", "The loaded roster has no depth chart table.")
+            return
+
+        data_manager = self.data_manager
+        position_groups = {
+            position_id: data_manager.position_group_map.get(name, name)
+            for position_id, name in data_manager.position_map.items()
+        }
+        players = pd.DataFrame({
+            DCHT_PLAYER: self.model['Player ID'],
+            DCHT_TEAM: data_manager.codecs['TeamName'].encode(self.model['TeamName']),
+            DCHT_POSITION: data_manager.codecs['PositionName'].encode(self.model['PositionName']),
+            'Overall': self.model['Overall'],
+        })
+
+        try:
+            rebuild = rebuild_depth_charts(players, self.depthchart_df, position_groups)
+        except KeyError as e:
+            QMessageBox.critical(self, "Depth Chart Error",
+                                 f"The depth chart table is missing the field {e}, so its slot order isn't known.")
+            return
+
+        if not rebuild.has_changes:
+            QMessageBox.information(self, "No Changes", "Every depth chart already lists each team's best players.")
+            return
+
+        names = self.model['First Name'].str.cat(self.model['Last Name'], sep=' ')
+        player_names = dict(zip(pd.to_numeric(self.model['Player ID'], errors='coerce'), names))
+        rows = [
+            (
+                data_manager.team_map.get(change[DCHT_TEAM], change[DCHT_TEAM]),
+                data_manager.position_map.get(change[DCHT_POSITION], change[DCHT_POSITION]),
+                change['depth'],
+                player_names.get(change['old_player'], change['old_player']),
+                player_names.get(change['new_player'], change['new_player']),
+            )
+            for change in rebuild.changes.to_dict('records')
+        ]
+
+        dialog = DepthChartRebuildDialog(rows, self)
+        if dialog.exec():
+            self.depthchart_df = rebuild.depth_chart
+            self._record_edits({index: {DCHT_PLAYER: player} for index, player in rebuild.changes['new_player'].items()}, table='dcht')
+            if self.team_aggregates is not None:
+                self.team_aggregates.set_starters(self._starter_indices())
+                self._refresh_team_summary()
             self.player_editor.mark_dirty()
-            self.refresh_player_list()
-            if self.player_editor.player_index is not None:
-                try:
-                    row_index = list(self.filtered_model_indices).index(self.player_editor.player_index)
-                    self.player_list.selectRow(row_index)
-                except ValueError:
-                    pass
+            self.status_bar.showMessage(f"Depth charts rebuilt. {len(rows)} slots were updated.", 5000)
+
+    def _starter_indices(self):
+        if self.depthchart_df is None:
+            return []
+        try:
+            starter_ids = starting_player_ids(self.depthchart_df)
+        except KeyError:
+            return []
+        return self.model.index[pd.to_numeric(self.model['Player ID'], errors='coerce').isin(starter_ids)]
+
+    def on_cells_changed(self, changes):
+        """Autosaves {index: {column: value}} edits to the model and keeps the team totals in step with them."""
+        self._record_edits(changes)
+        if self.range_index is not None:
+            self.range_index.apply_changes(changes)
+        if self.leaderboards is not None:
+            self.leaderboards.apply_changes(changes)
+            self._refresh_leaderboards()
+        if self.thumbnail_cache is not None and any('Portrait ID' in row for row in changes.values()):
+            self.thumbnail_timer.start()
+        if self.team_aggregates is None:
+            return
+        self.team_aggregates.apply_changes(changes)
+        self._refresh_team_summary()
+
+    def _record_edits(self, changes, table='play'):
+        """Journals committed edits, and remembers them if a save is running, since its snapshot doesn't have them."""
+        if self._edits_during_save is not None:
+            self._edits_during_save.append((table, changes))
+        if self.journal is not None:
+            self.journal.append(changes, table=table)
+
+    def _start_autosave(self):
+        """Offers to replay the journal a crash or an unsaved exit left for this roster, then starts a new one.
+
+        Returns a note for the status bar about what was recovered, or an empty string.
+        """
+        recovered = read_journal(self.roster_file_path)
+        note = ""
+        if recovered is not None and not recovered.is_empty:
+            note = self._recover_autosave(recovered)
+        elif recovered is not None:
+            discard_journal(self.roster_file_path)
+
+        try:
+            self.journal = AutosaveJournal(self.roster_file_path)
+        except OSError as e:
+            self.journal = None
+            note += f" Autosave is off: {e}."
+        return note
+
+    def _recover_autosave(self, recovered):
+        last_edit = datetime.fromtimestamp(recovered.last_edit).strftime('%Y-%m-%d %H:%M')
+        message = (f"Found {recovered.cell_count} unsaved field edits for this roster, last made {last_edit}.\n\n"
+                   "Do you want to recover them?")
+        if not recovered.matches_roster:
+            message += ("\n\nThe roster file has changed since these edits were made, so they may not "
+                        "line up with the right players any more.")
+        reply = QMessageBox.question(self, "Recover Unsaved Edits", message,
+                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if reply != QMessageBox.StandardButton.Yes:
+            discard_journal(self.roster_file_path)
+            return ""
+
+        start = time.perf_counter()
+        journal_columns = {column for row in recovered.changes('play').values() for column in row}
+        if not journal_columns.issubset(self.model.columns):
+            self._load_remaining_fields()
+        play_changes = {
+            index: {column: value for column, value in row.items() if column in self.model.columns}
+            for index, row in recovered.changes('play').items() if index in self.model.index
+        }
+        changes_made = self._commit_bulk_results(play_changes)
+
+        depth_changes = recovered.changes('dcht')
+        if depth_changes and self.depthchart_df is not None:
+            for index, row in depth_changes.items():
+                for column, value in row.items():
+                    self.depthchart_df.at[index, column] = value
+
+        self.player_editor.mark_dirty()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        return f" Recovered unsaved edits for {changes_made} players in {elapsed_ms:.0f} ms."
+
+    def _load_projection(self):
+        """The tables and PLAY fields read on load: everything ui_layout.json lays out, the calculators'
+        ratings and the player list and filter columns. The rest are read when something needs them."""
+        columns = set(self.player_editor.get_categorized_attributes())
+        columns.update(self.overall_calculator.required_columns())
+        columns.update(self.archetype_calculator.required_columns())
+        columns.update(['First Name', 'Last Name', 'PositionName', 'TeamName', 'Overall', 'Age', 'Portrait ID'])
+        return RosterProjection.for_columns(columns, self.data_manager.header_map, self.data_manager.codecs)
+
+    def _load_remaining_fields(self):
+        """Adds the PLAY fields the load left out to the model, the first time something needs the whole table.
+
+        Returns False if they couldn't be read.
+        """
+        if not self.remaining_fields_pending:
+            return True
+
+        self.status_bar.showMessage("Reading the remaining player fields...")
+        QApplication.processEvents()
+        play = self.data_manager._load_raw_player_data(self.roster_file_path)
+        self.status_bar.clearMessage()
+        # Records line up with players by position, the same way they're written back on save
+        if play is None or len(play) != len(self.model):
+            QMessageBox.critical(self, "Error", "Could not read the remaining player fields from the roster file.")
+            return False
+
+        remaining = self.data_manager.map_play_table(play).set_axis(self.model.index)
+        new_columns = [col for col in remaining.columns if col not in self.model.columns]
+        if new_columns:
+            self.model[new_columns] = remaining[new_columns]
+        if 'UnmappedData' in remaining.columns and 'UnmappedData' not in new_columns:
+            # The load only had the injury fields to put in UnmappedData; add the PLAY fields it left out
+            self.model['UnmappedData'] = [
+                {**(loaded if isinstance(loaded, dict) else {}), **read}
+                for loaded, read in zip(self.model['UnmappedData'], remaining['UnmappedData'])
+            ]
+        self.remaining_fields_pending = False
+        self.player_editor.remaining_fields_pending = False
+        return True
+
+    def show_advanced_fields(self):
+        self.player_editor.apply_changes()
+        if not self._load_remaining_fields():
+            return
+
+        player_index = self.player_editor.player_index
+        self.player_editor.set_model(self.model)
+        if player_index is not None:
+            self.player_editor.load_player(player_index)
+        self.player_editor.show_tab("Advanced")
+
+    def _close_journal(self, delete=False):
+        # Unsaved edits stay in the journal to be offered again the next time this roster is opened
+        if self.journal is not None:
+            self.journal.close(delete=delete or not self.journal.has_unsaved_edits)
+            self.journal = None
+
+    def show_team_summary(self):
+        if self.team_aggregates is None:
+            return
+
+        if self.team_summary_dialog is None:
+            self.team_summary_dialog = TeamSummaryDialog(self)
+        self.team_summary_dialog.refresh(self.team_aggregates.summary())
+        self.team_summary_dialog.show()
+        self.team_summary_dialog.raise_()
+
+    def _refresh_team_summary(self):
+        if self.team_summary_dialog is not None and self.team_summary_dialog.isVisible():
+            self.team_summary_dialog.refresh(self.team_aggregates.summary())
+
+    def show_leaderboards(self):
+        if self.leaderboards is None:
+            return
+
+        if self.leaderboard_dialog is None:
+            self.leaderboard_dialog = LeaderboardDialog(self.leaderboards, self)
+            self.leaderboard_dialog.player_activated.connect(self.show_player)
+        else:
+            # The lazy read of the remaining fields can add rating columns
+            self.leaderboard_dialog.set_choices()
+        self.leaderboard_dialog.refresh()
+        self.leaderboard_dialog.show()
+        self.leaderboard_dialog.raise_()
+
+    def _refresh_leaderboards(self):
+        if self.leaderboard_dialog is not None and self.leaderboard_dialog.isVisible():
+            self.leaderboard_dialog.refresh()
+
+    def show_player(self, player_index):
+        """Selects a player in the list and opens them in the editor, clearing the filters if they hide them."""
+        if player_index not in self.filtered_model_indices:
+            self.reset_filters()
+        for row in range(self.player_list.rowCount()):
+            item = self.player_list.item(row, 0)
+            if item is not None and item.data(Qt.ItemDataRole.UserRole) == player_index:
+                self.player_list.selectRow(row)
+                self.player_list.scrollToItem(item)
+                self.on_player_selected(row, 0)
+                break
+
+    def export_spreadsheet(self):
+        if self.model is None:
+            return
+
+        path, _ = QFileDialog.getSaveFileName(self, "Export Players", "", FILE_FILTER)
+        if not path:
+            return
+
+        self.player_editor.apply_changes()
+        if not self._load_remaining_fields():
+            return
+        try:
+            export_roster(self.model, path)
+        except (ValueError, OSError) as e:
+            QMessageBox.critical(self, "Export Failed", str(e))
+            return
+        self.status_bar.showMessage(f"Exported {len(self.model)} players to '{os.path.basename(path)}'.", 5000)
+
+    def import_spreadsheet(self):
+        if self.model is None:
+            return
+
+        path, _ = QFileDialog.getOpenFileName(self, "Import Players", "", FILE_FILTER)
+        if not path:
+            return
+
+        self.player_editor.apply_changes()
+        if not self._load_remaining_fields():
+            return
+        self.status_bar.showMessage(f"Reading '{os.path.basename(path)}'...")
+        QApplication.processEvents()
+        try:
+            plan = plan_import(self.model, iter_spreadsheet_chunks(path), self.data_manager.codecs.value_maps())
+        except (ValueError, OSError) as e:
+            self.status_bar.clearMessage()
+            QMessageBox.critical(self, "Import Failed", str(e))
+            return
+        self.status_bar.clearMessage()
+
+        if plan.is_empty and plan.rejected.empty:
+            QMessageBox.information(self, "No Changes", "The spreadsheet matches the loaded roster.")
+            return
+
+        dialog = SpreadsheetImportDialog(plan, self.model, self)
+        if not dialog.exec():
+            return
+
+        changes_made = self._commit_bulk_results(plan.to_results())
+        self.player_editor.mark_dirty()
+        self.refresh_player_list()
+        self.status_bar.showMessage(f"Import complete. {changes_made} players were updated.", 5000)
+
+    def bulk_edit(self):
+        if self.model is None:
+            return
+
+        self.player_editor.apply_changes()
+        # Expressions can use any column, not just the ones read on load
+        if not self._load_remaining_fields():
+            return
+        dialog = BulkEditDialog(self.model, self.data_manager.codecs.value_maps(), self)
+        if not dialog.exec() or dialog.result is None:
+            return
+
+        result = dialog.result
+        changes_made = self._commit_bulk_results(result.to_results())
+        self.player_editor.mark_dirty()
+        self.refresh_player_list()
+        if self.player_editor.player_index is not None:
+            self.player_editor.load_player(self.player_editor.player_index)
+        message = f"Bulk edit complete. {changes_made} players were updated."
+
+        if not dialog.recalculate_overall_checkbox.isChecked() or 'Overall' in result.changes['column'].values:
+            self.status_bar.showMessage(message, 5000)
+            return
+
+        def on_complete(overalls_changed):
+            self.status_bar.showMessage(f"{message} {overalls_changed} OVRs were recalculated.", 5000)
+            if overalls_changed > 0:
+                self.refresh_player_list()
+                if self.player_editor.player_index is not None:
+                    self.player_editor.load_player(self.player_editor.player_index)
+
+        # Only the players the edit touched can have a different OVR now
+        self._run_bulk_operation("Recalculating Overalls...", self.overall_calculator.required_columns(),
+                                 self._recalculate_overall_row, on_complete, rows=result.touched_rows)
+
+    def validate_roster(self):
+        if self.model is None:
+            return
+
+        report = self.roster_validator.validate(self.model)
+        if report.is_empty:
+            QMessageBox.information(self, "Roster Validation", f"No problems found ({report.seconds * 1000:.0f} ms).")
+            return
+
+        dialog = ValidationReportDialog(report, self.model, self)
+        dialog.exec()
+
+    def diff_against_source(self):
+        if self.model is None or self.roster_file_path is None:
+            return
+
+        source_df = self._load_play_table_for_diff(self.roster_file_path)
+        if source_df is None:
+            return
+
+        diff = diff_rosters(source_df, self.data_manager.to_raw_play_table(self.model))
+        self._show_roster_diff(diff, f"Changes Since {os.path.basename(self.roster_file_path)}")
+
+    def diff_roster_files(self):
+        old_path, _ = QFileDialog.getOpenFileName(self, "Select Original Roster", "", "All Files (*)")
+        if not old_path:
+            return
+        new_path, _ = QFileDialog.getOpenFileName(self, "Select Changed Roster", "", "All Files (*)")
+        if not new_path:
+            return
+
+        old_df = self._load_play_table_for_diff(old_path)
+        new_df = self._load_play_table_for_diff(new_path) if old_df is not None else None
+        if new_df is None:
+            return
+
+        diff = diff_rosters(old_df, new_df)
+        self._show_roster_diff(diff, f"{os.path.basename(old_path)} vs {os.path.basename(new_path)}")
+
+    def _load_play_table_for_diff(self, path):
+        self.status_bar.showMessage(f"Reading '{os.path.basename(path)}'...")
+        QApplication.processEvents()
+        df = self.data_manager._load_raw_player_data(path)
+        self.status_bar.clearMessage()
+        if df is None:
+            QMessageBox.critical(self, "Error", f"Could not load player data from '{os.path.basename(path)}'.")
+        return df
+
+    def _show_roster_diff(self, diff, title):
+        if diff.is_empty:
+            QMessageBox.information(self, "No Differences", "The rosters have the same player data.")
+            return
+
+        dialog = RosterDiffDialog(diff, title, self.data_manager.header_map, self)
+        dialog.exec()
+
+    def _run_bulk_operation(self, title, columns, row_function, on_complete, rows=None):
+        """Runs row_function over a snapshot of the given columns on a worker thread.
+
+        on_complete(changes_made) is called on the GUI thread after the results have been
+        committed to the model. Cancelling discards every result, leaving the model untouched.
+        """
+        if self._bulk_thread is not None:
+            QMessageBox.warning(self, "Operation In Progress", "Please wait for the current operation to finish.")
+            return
+
+        snapshot_columns = [col for col in dict.fromkeys(columns) if col in self.model.columns]
+        snapshot = self.model.loc[rows if rows is not None else self.model.index, snapshot_columns].copy()
+
+        self.progress_dialog = ProgressDialog(title, self, cancellable=True)
+        self._bulk_on_complete = on_complete
+        self._bulk_thread = QThread(self)
+        self._bulk_worker = BulkOperationWorker(snapshot, row_function)
+        self._bulk_worker.moveToThread(self._bulk_thread)
+
+        self._bulk_thread.started.connect(self._bulk_worker.run)
+        self._bulk_worker.progress_updated.connect(self._on_bulk_progress)
+        self._bulk_worker.finished.connect(self._on_bulk_operation_finished)
+        self._bulk_worker.error.connect(self._on_bulk_operation_error)
+        # Connected through a lambda so the flag is set immediately instead of queueing behind run()
+        worker = self._bulk_worker
+        self.progress_dialog.cancel_requested.connect(lambda: worker.cancel())
+
+        self.progress_dialog.show()
+        self._bulk_thread.start()
+
+    def _on_bulk_progress(self, value, message):
+        if self.progress_dialog:
+            self.progress_dialog.update_progress(value, message, process_events=False)
+
+    def _finish_bulk_thread(self):
+        self._bulk_thread.quit()
+        self._bulk_thread.wait()
+        self._bulk_worker.deleteLater()
+        self._bulk_thread.deleteLater()
+        self._bulk_thread = None
+        self._bulk_worker = None
+
+        if self.progress_dialog:
+            self.progress_dialog.close()
+            self.progress_dialog = None
+
+    def _on_bulk_operation_finished(self, results, cancelled):
+        on_complete = self._bulk_on_complete
+        self._bulk_on_complete = None
+        self._finish_bulk_thread()
+
+        if cancelled:
+            self.status_bar.showMessage("Operation cancelled. No changes were made.", 5000)
+            return
+
+        changes_made = self._commit_bulk_results(results)
+        on_complete(changes_made)
+
+    def _on_bulk_operation_error(self, message):
+        self._bulk_on_complete = None
+        self._finish_bulk_thread()
+        QMessageBox.critical(self, "Operation Error", message)
+        self.status_bar.showMessage("An error occurred.", 5000)
+
+    def _commit_bulk_results(self, results):
+        """Writes {index: {column: value}} results into the model, one assignment per column."""
+        if not results:
+            return 0
+
+        updates = pd.DataFrame.from_dict(results, orient='index')
+        for column in updates.columns:
+            values = updates[column].dropna()
+            if not values.empty:
+                self.data_manager.codecs.assign(self.model, values.index, column, values.values)
+        self.on_cells_changed(results)
+        return len(results)
 
     def debug_calculator_data(self):
         if self.player_editor.player_index is None or self.model is None:
@@ -1639,13 +2865,16 @@ class RosterEditor(QMainWindow):
     def load_roster_file(self):
         path, _ = QFileDialog.getOpenFileName(self, "Open Madden Roster", "", "All Files (*)")
         if path:
+            self._close_journal()
             self.roster_file_path = path
             self.status_bar.showMessage("Loading roster, please wait...")
             self.progress_dialog = ProgressDialog("Loading Roster...", self)
             self.progress_dialog.show()
             self.load_button.setEnabled(False)
             self.save_button.setEnabled(False)
-            self.roster_worker.load_roster(self.roster_file_path)
+            self.roster_worker.track_memory = bool(self.settings.get("track_memory", False))
+            self.load_projection = self._load_projection()
+            self.roster_worker.load_roster(self.roster_file_path, self.load_projection)
 
     def on_load_finished(self, dfs):
         QTimer.singleShot(0, lambda: self._process_load_finished(dfs))
@@ -1666,6 +2895,26 @@ class RosterEditor(QMainWindow):
             self.depthchart_df = dfs.get('dcht')
 
             self.model['Overall'] = pd.to_numeric(self.model['Overall'], errors='coerce').fillna(0)
+            self.remaining_fields_pending = self.load_projection is not None and self.load_projection.is_partial('PLAY')
+            self.player_editor.remaining_fields_pending = self.remaining_fields_pending
+            # Replayed before the team totals are built, so they're computed once from the recovered roster
+            self.team_aggregates = None
+            self.range_index = None
+            self.leaderboards = None
+            recovery = self._start_autosave()
+            self.range_index = RosterRangeIndex(self.model)
+            if 'PositionName' in self.model.columns:
+                self.leaderboards = Leaderboards(self.model)
+            if self.leaderboard_dialog is not None:
+                self.leaderboard_dialog.close()
+                self.leaderboard_dialog = None
+            self.advanced_conditions = []
+            self._update_advanced_filter_button()
+            if {'TeamName', 'PositionName'}.issubset(self.model.columns):
+                self.team_aggregates = TeamAggregates(self.model, self._starter_indices())
+                self._refresh_team_summary()
+            else:
+                self.team_aggregates = None
             self.player_editor.set_settings(self.settings)
             self.player_editor.set_model(self.model)
             self.populate_filters()
@@ -1673,13 +2922,25 @@ class RosterEditor(QMainWindow):
             self.save_button.setEnabled(True)
             self.regen_all_archetypes_action.setEnabled(True)
             self.recalc_all_ovrs_action.setEnabled(True)
+            self.rebuild_depth_charts_action.setEnabled(self.depthchart_df is not None)
+            self.team_summary_action.setEnabled(self.team_aggregates is not None)
+            self.leaderboards_action.setEnabled(self.leaderboards is not None)
+            self.diff_source_action.setEnabled(True)
+            self.validate_roster_action.setEnabled(True)
+            self.bulk_edit_action.setEnabled(True)
+            self.export_spreadsheet_action.setEnabled(True)
+            self.import_spreadsheet_action.setEnabled(True)
             self.convert_archetypes_action.setEnabled(True)
             self.remove_all_injuries_action.setEnabled(True)
             self.fix_invalid_archetypes_action.setEnabled(True)
             self.debug_save_action.setEnabled(True)
             self.copy_portraits_action.setEnabled(True)
             
-            self.status_bar.showMessage(f"Roster '{filename}' loaded.", 5000)
+            load_profile = self.last_profiles.get("Load roster")
+            load_time = f" in {load_profile.total_seconds:.1f}s" if load_profile else ""
+            report = self.roster_validator.validate(self.model)
+            issues = "" if report.is_empty else f" {report.total} problems found, see Tools > Validate Roster."
+            self.status_bar.showMessage(f"Roster '{filename}' loaded{load_time}.{recovery}{issues}", 10000)
         else:
             self.base_title = "Madden Roster Editor"
             self.setWindowTitle(self.base_title)
@@ -1692,39 +2953,87 @@ class RosterEditor(QMainWindow):
         path, _ = QFileDialog.getSaveFileName(self, "Save Madden Roster", "", "All Files (*)")
         if path:
             self.player_editor.apply_changes()
+
+            report = self.roster_validator.validate(self.model)
+            if not report.is_empty:
+                reply = QMessageBox.question(self, "Roster Problems Found",
+                                             f"The roster has {report.total} problems:\n\n{report.format_summary()}\n\n"
+                                             "Use Tools > Validate Roster to see the players. Save anyway?",
+                                             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+                if reply == QMessageBox.StandardButton.No:
+                    return
             
-            dataframes_to_save = {'play': self.model}
-            if self.team_df is not None:
-                dataframes_to_save['team'] = self.team_df
-            if self.depthchart_df is not None:
-                dataframes_to_save['dcht'] = self.depthchart_df
-            
-            self.status_bar.showMessage(f"Saving roster to '{os.path.basename(path)}'...")
-            self.progress_dialog = ProgressDialog("Saving Roster...", self)
-            self.progress_dialog.show()
+            dataframes_to_save = self._snapshot_tables()
+
+            # The worker writes the snapshot on its own thread; editing carries on against the model
+            self.status_bar.showMessage(f"Saving roster to '{os.path.basename(path)}'. You can keep editing.")
+            self.save_progress_bar.setValue(0)
+            self.save_progress_bar.show()
             self.load_button.setEnabled(False)
             self.save_button.setEnabled(False)
+            self._save_path = path
+            self._edits_during_save = []
             
-            self.roster_worker.save_roster(dataframes_to_save, self.roster_file_path, path)
+            self.roster_worker.track_memory = bool(self.settings.get("track_memory", False))
+            self.save_requested.emit(dataframes_to_save, self.roster_file_path, path)
+
+    def _snapshot_tables(self):
+        """Copies the tables a save writes, so the save has its own that later edits can't reach."""
+        tables = {'play': self.model.copy()}
+        if self.team_df is not None:
+            tables['team'] = self.team_df.copy()
+        if self.depthchart_df is not None:
+            tables['dcht'] = self.depthchart_df.copy()
+        return tables
+
+    @property
+    def is_saving(self):
+        return self._edits_during_save is not None
+
+    def _end_save(self):
+        """Re-enables loading and saving, and returns the edits committed while the save ran."""
+        edits = self._edits_during_save or []
+        self._edits_during_save = None
+        self.save_progress_bar.hide()
+        self.save_button.setEnabled(True)
+        self.load_button.setEnabled(True)
+        return edits
 
     def on_save_finished(self, success, message):
         QTimer.singleShot(0, lambda: self._process_save_finished(success, message))
 
     def _process_save_finished(self, success, message):
-        if self.progress_dialog:
-            self.progress_dialog.close()
-        self.save_button.setEnabled(True)
-        self.load_button.setEnabled(True)
+        edits_during_save = self._end_save()
         self.regen_archetype_button.setEnabled(True)
         if success:
-            self.player_editor.is_dirty = False
-            self.status_bar.showMessage("Roster saved successfully.", 5000)
+            if self.journal is not None and os.path.abspath(self._save_path) == os.path.abspath(self.roster_file_path):
+                self.journal.reset()
+                # The file doesn't have what was edited while it was being written
+                for table, changes in edits_during_save:
+                    self.journal.append(changes, table=table)
+            elif self.journal is not None and not edits_during_save:
+                self.journal.mark_saved()
+            save_profile = self.last_profiles.get("Save roster")
+            save_time = f" in {save_profile.total_seconds:.1f}s" if save_profile else ""
+            if edits_during_save:
+                self.player_editor.mark_dirty()
+                self.status_bar.showMessage(f"Roster saved{save_time}. Edits made during the save are not in it yet.", 5000)
+            else:
+                # Bulk tools, imports and the like leave the flag set with nothing for apply_changes() to clear
+                if not self.player_editor.has_uncommitted_edits:
+                    self.player_editor.is_dirty = False
+                self.status_bar.showMessage(f"Roster saved successfully{save_time}.", 5000)
         else:
+            self.player_editor.mark_dirty()
             QMessageBox.critical(self, "Error", message)
             self.status_bar.showMessage("Failed to save roster.", 5000)
 
     def on_worker_error(self, message):
-        if self.progress_dialog:
+        if self.is_saving:
+            # Any progress dialog open now belongs to something else the user started during the save
+            self._end_save()
+            self.player_editor.mark_dirty()
+        elif self.progress_dialog:
             self.progress_dialog.close()
         self.save_button.setEnabled(True)
         self.load_button.setEnabled(True)
@@ -1775,10 +3084,14 @@ class RosterEditor(QMainWindow):
             ]
 
             changes_made = 0
+            cleared = {}
             for col in injury_columns_to_zero:
                 if col in self.model.columns:
+                    for index in self.model.index[self.model[col].fillna(0) != 0]:
+                        cleared.setdefault(index, {})[col] = 0
                     self.model.loc[:, col] = 0
                     changes_made += 1
+            self.on_cells_changed(cleared)
 
             if changes_made > 0:
                 self.player_editor.mark_dirty()  # Mark that there are unsaved changes
@@ -1830,59 +3143,51 @@ class RosterEditor(QMainWindow):
             self.status_bar.showMessage("Operation cancelled.", 5000)
             return
 
-        self.progress_dialog = ProgressDialog("Fixing Invalid Archetypes...", self)
-        self.progress_dialog.show()
-
-        changes_made = 0
-        processed_count = 0
         inverse_archetype_map = self.data_manager.inverse_archetype_map
+        # Only touched by the worker thread while it runs, and read back in on_complete
         failure_reasons = {'calculation_failed': [], 'id_not_found': []}
 
-        for index in players_to_fix:
-            processed_count += 1
-            progress = int((processed_count / len(players_to_fix)) * 100)
-            self.progress_dialog.update_progress(progress, f"Processing {processed_count}/{len(players_to_fix)}...")
-            player_data = self.model.loc[index]
+        def fix_player(player_data):
             new_archetype = self.archetype_calculator.calculate_best_archetype(player_data)
 
             if not new_archetype:
                 pos_group = position_group_map.get(player_data['PositionName'], player_data['PositionName'])
                 if pos_group not in failure_reasons['calculation_failed']:
                     failure_reasons['calculation_failed'].append(pos_group)
-                continue
+                return None
 
             new_id = inverse_archetype_map.get(new_archetype)
             if not new_id:
                 if new_archetype not in failure_reasons['id_not_found']:
                     failure_reasons['id_not_found'].append(new_archetype)
-                continue
+                return None
             
-            self.model.at[index, 'Archetype'] = new_archetype
-            self.model.at[index, 'PLTY'] = new_id
-            changes_made += 1
+            return {'Archetype': new_archetype}
 
-        self.progress_dialog.close()
-        self.progress_dialog = None
-        self.status_bar.showMessage(f"Fix complete. {changes_made} players were updated.", 5000)
-        
-        # Show a detailed final report
-        report = f"Operation complete.\n\nSuccessfully updated: {changes_made} players.\nFailed to update: {len(players_to_fix) - changes_made} players."
-        if failure_reasons['calculation_failed']:
-            missing_groups = ", ".join(failure_reasons['calculation_failed'])
-            report += f"\n\nReason: Could not calculate new archetypes for some position groups.\n"
-            report += f"ACTION: Open 'archetype_breakdown.xlsx' and ensure the following groups have entries in the 'Weights' sheet: {missing_groups}"
-        
-        if failure_reasons['id_not_found']:
-            missing_archs = ", ".join(failure_reasons['id_not_found'])
-            report += f"\n\nReason: Some calculated archetypes are not in the master list.\n"
-            report += f"ACTION: The following archetypes exist in your .xlsx file but are missing from 'PLTYLookup.json': {missing_archs}"
+        def on_complete(changes_made):
+            self.status_bar.showMessage(f"Fix complete. {changes_made} players were updated.", 5000)
+            
+            # Show a detailed final report
+            report = f"Operation complete.\n\nSuccessfully updated: {changes_made} players.\nFailed to update: {len(players_to_fix) - changes_made} players."
+            if failure_reasons['calculation_failed']:
+                missing_groups = ", ".join(failure_reasons['calculation_failed'])
+                report += f"\n\nReason: Could not calculate new archetypes for some position groups.\n"
+                report += f"ACTION: Open 'archetype_breakdown.xlsx' and ensure the following groups have entries in the 'Weights' sheet: {missing_groups}"
+            
+            if failure_reasons['id_not_found']:
+                missing_archs = ", ".join(failure_reasons['id_not_found'])
+                report += f"\n\nReason: Some calculated archetypes are not in the master list.\n"
+                report += f"ACTION: The following archetypes exist in your .xlsx file but are missing from 'PLTYLookup.json': {missing_archs}"
 
-        QMessageBox.information(self, "Fix Report", report)
+            QMessageBox.information(self, "Fix Report", report)
 
-        if changes_made > 0:
-            self.player_editor.mark_dirty()
-            if self.player_editor.player_index is not None:
-                self.player_editor.load_player(self.player_editor.player_index)
+            if changes_made > 0:
+                self.player_editor.mark_dirty()
+                if self.player_editor.player_index is not None:
+                    self.player_editor.load_player(self.player_editor.player_index)
+
+        self._run_bulk_operation("Fixing Invalid Archetypes...", self.archetype_calculator.required_columns(),
+                                 fix_player, on_complete, rows=players_to_fix)
 
     def apply_filters(self):
         if self.model is None:
@@ -1904,6 +3209,9 @@ class RosterEditor(QMainWindow):
         if selected_team != "All Teams":
             mask &= (self.model['TeamName'] == selected_team)
 
+        if self.advanced_conditions:
+            mask &= self.range_index.mask(self.advanced_conditions, self.advanced_match_all)
+
         self.filtered_model_indices = self.model.index[mask]
         self.refresh_player_list()
 
@@ -1943,9 +3251,59 @@ class RosterEditor(QMainWindow):
                 self.player_list.setItem(i, 1, pos_item)
                 self.player_list.setItem(i, 2, overall_item)
                 self.player_list.setItem(i, 3, age_item)
+                self.player_list.setItem(i, THUMBNAIL_COLUMN, QTableWidgetItem())
 
         self.player_list.setSortingEnabled(True)
         self.player_list.sortByColumn(self.sort_column, self.sort_order)
+        self.thumbnail_timer.start()
+
+    def _apply_thumbnail_settings(self):
+        """Shows or hides the thumbnail column and points the thumbnail cache at the current images folder."""
+        images_folder = self.settings.get("images_folder")
+        show = bool(self.settings.get("show_thumbnails", False)) and bool(images_folder) and os.path.isdir(images_folder)
+        if self.thumbnail_cache is not None and (not show or self.thumbnail_cache.images_folder != images_folder):
+            self.thumbnail_cache.shutdown()
+            self.thumbnail_cache = None
+            self.thumbnail_pixmaps.clear()
+        if show and self.thumbnail_cache is None:
+            self.thumbnail_cache = ThumbnailCache(images_folder)
+
+        self.player_list.setColumnHidden(THUMBNAIL_COLUMN, not show)
+        self.player_list.verticalHeader().setDefaultSectionSize(THUMBNAIL_SIZE + 4 if show else self.default_row_height)
+        self.thumbnail_timer.start()
+
+    def _load_visible_thumbnails(self):
+        """Sets the thumbnails of the rows in view and queues the ones that aren't loaded yet."""
+        if self.thumbnail_cache is None or self.model is None or 'Portrait ID' not in self.model.columns:
+            return
+        first_row = self.player_list.rowAt(0)
+        if first_row < 0:
+            return
+        last_row = self.player_list.rowAt(self.player_list.viewport().height() - 1)
+        if last_row < 0:
+            last_row = self.player_list.rowCount() - 1
+
+        visible = set()
+        for row in range(first_row, last_row + 1):
+            name_item = self.player_list.item(row, 0)
+            thumbnail_item = self.player_list.item(row, THUMBNAIL_COLUMN)
+            if name_item is None or thumbnail_item is None:
+                continue
+            portrait_id = self.model.at[name_item.data(Qt.ItemDataRole.UserRole), 'Portrait ID']
+            portrait_id = str(portrait_id) if pd.notna(portrait_id) else None
+            if portrait_id is not None and portrait_id not in self.thumbnail_pixmaps:
+                visible.add(portrait_id)
+                cache = self.thumbnail_cache
+                cache.submit(portrait_id, lambda loaded_id, image: self.thumbnail_ready.emit(cache, loaded_id, image))
+            thumbnail_item.setData(Qt.ItemDataRole.DecorationRole, self.thumbnail_pixmaps.get(portrait_id))
+        # Rows scrolled past don't hold up the ones in view
+        self.thumbnail_cache.cancel_except(visible)
+
+    def _on_thumbnail_ready(self, cache, portrait_id, image):
+        if cache is not self.thumbnail_cache:
+            return
+        self.thumbnail_pixmaps[portrait_id] = QPixmap.fromImage(ImageQt.ImageQt(image)) if image is not None else None
+        self.thumbnail_timer.start()
 
     def on_player_selected(self, row, column):
         item = self.player_list.item(row, 0)
@@ -2108,6 +3466,8 @@ class RosterEditor(QMainWindow):
         if self.model is None:
             QMessageBox.warning(self, "No Roster Loaded", "Please load a roster first.")
             return
+        if not self._load_remaining_fields():
+            return
 
         # 1. Get all columns that were successfully loaded into the DataFrame.
         all_loaded_columns = set(self.model.columns)
@@ -2144,9 +3504,34 @@ class RosterEditor(QMainWindow):
         dialog.exec()
 
     def reset_filters(self):
+        had_advanced_conditions = bool(self.advanced_conditions)
+        self.advanced_conditions = []
+        self._update_advanced_filter_button()
         self.search_box.clear()
         self.position_filter.setCurrentIndex(0)
         self.team_filter.setCurrentIndex(0)
+        if had_advanced_conditions:
+            self.apply_filters()
+
+    def open_advanced_filter(self):
+        if self.model is None:
+            return
+        # Any PLAY field can be filtered on, not just the ones the layout shows
+        if not self._load_remaining_fields():
+            return
+
+        dialog = AdvancedFilterDialog(self.range_index, self.advanced_conditions, self.advanced_match_all, self)
+        if dialog.exec():
+            self.advanced_conditions = dialog.conditions
+            self.advanced_match_all = dialog.match_all
+            self._update_advanced_filter_button()
+            self.apply_filters()
+
+    def _update_advanced_filter_button(self):
+        count = len(self.advanced_conditions)
+        self.advanced_filter_button.setText(f"Advanced Filter ({count} active)..." if count else "Advanced Filter...")
+        joiner = " and " if self.advanced_match_all else " or "
+        self.advanced_filter_button.setToolTip(joiner.join(condition.describe() for condition in self.advanced_conditions))
 
     def set_window_dirty_status(self, is_dirty):
         title = self.base_title
@@ -2156,6 +3541,11 @@ class RosterEditor(QMainWindow):
             self.setWindowTitle(title)
 
     def closeEvent(self, event):
+        if self.is_saving:
+            QMessageBox.information(self, "Save In Progress", "Please wait for the roster to finish saving before exiting.")
+            event.ignore()
+            return
+
         if self.player_editor.is_dirty:
             reply = QMessageBox.question(self, 'Unsaved Changes',
                                        'You have unsaved changes. Do you want to save them before exiting?',
@@ -2169,6 +3559,19 @@ class RosterEditor(QMainWindow):
                 event.ignore()
         else:
             event.accept()
+
+        if not event.isAccepted():
+            return
+
+        if self._bulk_thread is not None:
+            self._bulk_worker.cancel()
+            self._bulk_thread.quit()
+            self._bulk_thread.wait()
+
+        # Closing means the edits were saved or deliberately discarded
+        self._close_journal(delete=True)
+        if self.thumbnail_cache is not None:
+            self.thumbnail_cache.shutdown()
         
         self.worker_thread.quit()
         self.worker_thread.wait()
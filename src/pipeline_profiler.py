@@ -0,0 +1,90 @@
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# roster_io.js writes its per-stage measurements to stderr on a line starting with this prefix
+NODE_PROFILE_PREFIX = "MREP_PROFILE "
+
+
+class PipelineProfiler:
+    """Records elapsed time and memory for each stage of a roster load or save."""
+
+    def __init__(self, name, track_memory=False):
+        self.name = name
+        self.track_memory = track_memory
+        self.stages = []
+        self._owns_tracing = False
+
+    def start(self):
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+
+    def stop(self):
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    @contextmanager
+    def stage(self, stage_name):
+        tracing = self.track_memory and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = {
+                'source': 'python',
+                'stage': stage_name,
+                'seconds': time.perf_counter() - start,
+            }
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                entry['current_mb'] = current / (1024 * 1024)
+                entry['peak_mb'] = peak / (1024 * 1024)
+            self.stages.append(entry)
+
+    def add_node_report(self, stderr_text):
+        """Pulls the stage measurements roster_io.js printed to stderr into this profile."""
+        if not stderr_text:
+            return
+        for line in stderr_text.splitlines():
+            if not line.startswith(NODE_PROFILE_PREFIX):
+                continue
+            try:
+                node_stages = json.loads(line[len(NODE_PROFILE_PREFIX):])
+            except json.JSONDecodeError:
+                continue
+            for node_stage in node_stages:
+                self.stages.append({
+                    'source': 'node',
+                    'stage': node_stage.get('stage', '?'),
+                    'seconds': node_stage.get('seconds', 0.0),
+                    'current_mb': node_stage.get('heapUsedMb'),
+                    'rss_mb': node_stage.get('rssMb'),
+                })
+
+    @property
+    def total_seconds(self):
+        # Node stages run inside the Python 'node' stage, so only count the Python side
+        return sum(stage['seconds'] for stage in self.stages if stage['source'] == 'python')
+
+    @property
+    def peak_mb(self):
+        peaks = [stage['peak_mb'] for stage in self.stages if stage.get('peak_mb') is not None]
+        return max(peaks) if peaks else None
+
+    def format_report(self):
+        lines = [f"{self.name} ({self.total_seconds:.2f}s total)"]
+        for stage in self.stages:
+            line = f"  [{stage['source']}] {stage['stage']}: {stage['seconds']:.3f}s"
+            if stage.get('peak_mb') is not None:
+                line += f", peak {stage['peak_mb']:.1f} MB"
+            if stage.get('current_mb') is not None:
+                line += f", heap {stage['current_mb']:.1f} MB"
+            if stage.get('rss_mb') is not None:
+                line += f", rss {stage['rss_mb']:.1f} MB"
+            lines.append(line)
+        return "\n".join(lines)
@@ -0,0 +1,184 @@
+import numpy as np
+import pandas as pd
+
+RANGE_OPERATORS = ['>=', '<=', '>', '<', 'between']
+OPERATORS = RANGE_OPERATORS + ['==', '!=', 'in', 'not in', 'contains']
+# Operators whose value is a comma separated list
+LIST_OPERATORS = ['between', 'in', 'not in']
+
+
+class FilterError(ValueError):
+    pass
+
+
+class Condition:
+    """One predicate of an advanced filter, e.g. Condition('Speed', '>=', 90),
+    Condition('Age', 'between', (21, 24)) or Condition('Archetype', 'in', ['WR_Slot', 'WR_DeepThreat'])."""
+
+    def __init__(self, column, operator, value):
+        if operator not in OPERATORS:
+            raise FilterError(f"'{operator}' isn't a filter operator.")
+        self.column = column
+        self.operator = operator
+        self.value = value
+
+    @classmethod
+    def from_text(cls, column, operator, text, numeric):
+        """Builds a condition from what was typed for it. List operators take comma separated values."""
+        text = text.strip()
+        if not text:
+            raise FilterError(f"{column} {operator}: enter a value.")
+
+        if operator in LIST_OPERATORS:
+            values = [part.strip() for part in text.split(',') if part.strip()]
+        else:
+            values = [text]
+        if numeric and operator != 'contains':
+            try:
+                values = [float(value) for value in values]
+            except ValueError:
+                raise FilterError(f"{column} is a number column; '{text}' isn't a number.")
+
+        if operator == 'between':
+            if len(values) != 2:
+                raise FilterError(f"{column} between: enter the low and high value, e.g. '80, 90'.")
+            return cls(column, operator, (min(values), max(values)))
+        if operator in LIST_OPERATORS:
+            return cls(column, operator, values)
+        return cls(column, operator, values[0])
+
+    def value_text(self):
+        """The value as from_text() reads it back."""
+        if self.operator in LIST_OPERATORS:
+            return ", ".join(map(_format_value, self.value))
+        return _format_value(self.value)
+
+    def describe(self):
+        value = self.value
+        if self.operator == 'between':
+            value = f"{_format_value(value[0])} and {_format_value(value[1])}"
+        elif self.operator in LIST_OPERATORS:
+            value = "(" + ", ".join(map(_format_value, value)) + ")"
+        else:
+            value = _format_value(value)
+        return f"{self.column} {self.operator} {value}"
+
+
+class SortedColumn:
+    """The rows of one numeric column in value order, so a range is found with two binary searches."""
+
+    def __init__(self, values):
+        values = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=float)
+        self.order = np.argsort(values, kind='stable')
+        sorted_values = values[self.order]
+        # argsort puts NaN last; no range includes it
+        self.sorted_values = sorted_values[:np.count_nonzero(~np.isnan(sorted_values))]
+
+    def rows_between(self, low=-np.inf, high=np.inf, include_low=True, include_high=True):
+        """Row positions whose value is in the range, in value order."""
+        start = np.searchsorted(self.sorted_values, low, side='left' if include_low else 'right')
+        end = np.searchsorted(self.sorted_values, high, side='right' if include_high else 'left')
+        return self.order[start:max(start, end)]
+
+
+class RosterRangeIndex:
+    """Answers advanced filters over a table from sorted copies of its numeric columns.
+
+    A column is sorted the first time a condition uses it and kept until it's edited, so range
+    conditions cost two binary searches instead of a scan. Each condition becomes a boolean
+    mask over the rows, and the masks are combined with & or |.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self._sorted = {}
+
+    def invalidate(self, columns=None):
+        """Drops the sorted copies of columns, or of every column."""
+        if columns is None:
+            self._sorted.clear()
+            return
+        for column in columns:
+            self._sorted.pop(column, None)
+
+    def apply_changes(self, changes):
+        """Invalidates the columns touched by {index: {column: value}} edits."""
+        self.invalidate({column for row in changes.values() for column in row})
+
+    def sorted_column(self, column):
+        if column not in self._sorted:
+            self._sorted[column] = SortedColumn(self.df[column])
+        return self._sorted[column]
+
+    def is_numeric(self, column):
+        dtype = self.df[column].dtype
+        return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+    def mask(self, conditions, match_all=True):
+        """A boolean array over the rows of df that match all (or any) of the conditions."""
+        if not conditions:
+            return np.ones(len(self.df), dtype=bool)
+        masks = (self._condition_mask(condition) for condition in conditions)
+        result = next(masks)
+        for mask in masks:
+            result = result & mask if match_all else result | mask
+        return result
+
+    def matching_index(self, conditions, match_all=True):
+        return self.df.index[self.mask(conditions, match_all)]
+
+    def _condition_mask(self, condition):
+        if condition.column not in self.df.columns:
+            raise FilterError(f"There is no column named '{condition.column}'.")
+        if self.is_numeric(condition.column) and condition.operator != 'contains':
+            return self._numeric_mask(condition)
+        return self._value_mask(condition)
+
+    def _numeric_mask(self, condition):
+        column = self.sorted_column(condition.column)
+        operator, value = condition.operator, condition.value
+        if operator in ('in', 'not in'):
+            rows = np.concatenate([column.rows_between(v, v) for v in value]) if value else np.empty(0, dtype=np.intp)
+        elif operator in ('==', '!='):
+            rows = column.rows_between(value, value)
+        elif operator == 'between':
+            rows = column.rows_between(value[0], value[1])
+        elif operator == '>=':
+            rows = column.rows_between(low=value)
+        elif operator == '>':
+            rows = column.rows_between(low=value, include_low=False)
+        elif operator == '<=':
+            rows = column.rows_between(high=value)
+        else:
+            rows = column.rows_between(high=value, include_high=False)
+
+        mask = np.zeros(len(self.df), dtype=bool)
+        mask[rows] = True
+        if operator in ('!=', 'not in'):
+            # Missing values aren't "not equal" to anything, just as they aren't in any range
+            mask[column.order[len(column.sorted_values):]] = True
+            mask = ~mask
+        return mask
+
+    def _value_mask(self, condition):
+        series = self.df[condition.column]
+        operator, value = condition.operator, condition.value
+        if operator in RANGE_OPERATORS:
+            raise FilterError(f"{condition.column} isn't a number column, so it can't be compared with '{operator}'.")
+        if operator == 'contains':
+            matches = series.astype(str).str.contains(str(value), case=False, regex=False) & series.notna()
+        elif operator in ('in', 'not in'):
+            matches = series.isin(value)
+        else:
+            matches = series == value
+        matches = matches.fillna(False).to_numpy(dtype=bool)
+        if operator in ('!=', 'not in'):
+            # As with numbers, a missing value isn't "not equal" to anything
+            return ~matches & series.notna().to_numpy()
+        return matches
+
+
+def _format_value(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
@@ -0,0 +1,440 @@
+import argparse
+import datetime
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from roster_diff import load_play_table
+
+# PLAY fields kept for every player in every snapshot. All of them fit in 0-99.
+RATING_FIELDS = [
+    'POVR', 'PLPO', 'PAGE', 'PSPD', 'PACC', 'PAGI', 'PSTR', 'PAWR', 'PJMP', 'PSTA', 'PTGH', 'PINJ', 'PYCF',
+    'PCAR', 'PBCV', 'PBKT', 'PELU', 'PLTR', 'PLSA', 'PLSM', 'PLJM',
+    'PCTH', 'PLCI', 'PLSC', 'PLRL', 'SRRN', 'PMRR', 'PDRR',
+    'PTHP', 'PTHA', 'PTAS', 'PTAM', 'PTAD', 'PTOR', 'PTUP', 'PPLA', 'PBSK',
+    'PRBK', 'PRBS', 'PRBF', 'PPBK', 'PPBS', 'PPBF', 'PLBK', 'PLIB',
+    'PTAK', 'PLHT', 'PLPU', 'PLPR', 'PBSG', 'PLPM', 'PFMS', 'PLMC', 'PLZC', 'PLPE',
+    'PKPR', 'PKAC', 'PKRT',
+]
+NAME_FIELDS = ['PFNA', 'PLNA']
+POSITION_FIELD = 'PPOS'
+ID_FIELD = 'PGID'
+
+# Ratings are stored as uint8; this marks a field the roster didn't have or a value outside 0-254
+MISSING_RATING = 255
+DATE_FORMAT = '%Y-%m-%d'
+INDEX_FILE = 'index.json'
+# A YYYY-MM-DD date anywhere in a roster's file name, e.g. ROSTER-2026-09-14.ros
+FILE_NAME_DATE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+SNAPSHOT_ARRAYS = ['pgid', 'first_names', 'last_names', 'positions', 'ratings']
+
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'config', 'config.json')
+
+
+class RatingSnapshot:
+    """The ratings of every player in one roster, as stored in a history partition.
+
+    ratings is a players x fields uint8 matrix, with MISSING_RATING where a value is missing.
+    Rows are sorted by pgid so two snapshots can be aligned with a single merge.
+    """
+
+    def __init__(self, date, fields, arrays):
+        self.date = date
+        self.fields = list(fields)
+        self._arrays = arrays
+
+    @property
+    def pgid(self):
+        return self._arrays['pgid']
+
+    @property
+    def first_names(self):
+        return self._arrays['first_names']
+
+    @property
+    def last_names(self):
+        return self._arrays['last_names']
+
+    @property
+    def positions(self):
+        return self._arrays['positions']
+
+    @property
+    def ratings(self):
+        return self._arrays['ratings']
+
+    @classmethod
+    def from_play_table(cls, date, play):
+        """Takes the ratings out of a raw PLAY table, keyed by PGID."""
+        if ID_FIELD not in play.columns:
+            raise ValueError(f"The PLAY table has no {ID_FIELD} column to key players on.")
+        pgid = pd.to_numeric(play[ID_FIELD], errors='coerce')
+        play = play[pgid.notna()]
+        pgid = pgid[pgid.notna()].astype(np.int64)
+        # A PGID seen twice in one roster can't be told apart over time; the first player keeps it
+        first = ~pgid.duplicated().to_numpy()
+        play, pgid = play[first], pgid[first]
+
+        fields = [field for field in RATING_FIELDS if field in play.columns]
+        values = play[fields].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        valid = ~np.isnan(values) & (values >= 0) & (values < MISSING_RATING)
+        ratings = np.where(valid, values, MISSING_RATING).astype(np.uint8)
+
+        order = np.argsort(pgid.to_numpy(), kind='stable')
+        names = [play[field].fillna('').astype(str).to_numpy()[order] if field in play.columns
+                 else np.full(len(play), '', dtype=object) for field in NAME_FIELDS]
+        positions = pd.to_numeric(play.get(POSITION_FIELD, pd.Series(-1, index=play.index)), errors='coerce')
+        return cls(date, fields, {
+            'pgid': pgid.to_numpy()[order],
+            'first_names': names[0].astype(str),
+            'last_names': names[1].astype(str),
+            'positions': positions.fillna(-1).to_numpy(dtype=np.int16)[order],
+            'ratings': ratings[order],
+        })
+
+    @classmethod
+    def load(cls, directory, date, fields):
+        return cls(date, fields, _PartitionArrays(directory))
+
+    def save(self, directory):
+        """Writes one .npy file per array into directory, replacing what was there."""
+        temp_directory = directory + '.tmp'
+        shutil.rmtree(temp_directory, ignore_errors=True)
+        os.makedirs(temp_directory)
+        for name in SNAPSHOT_ARRAYS:
+            np.save(os.path.join(temp_directory, name + '.npy'), np.ascontiguousarray(self._arrays[name]))
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(temp_directory, directory)
+
+    def __len__(self):
+        return len(self.pgid)
+
+    def column(self, field):
+        """One rating for every player as floats, with NaN where it's missing or the snapshot doesn't have it."""
+        if field not in self.fields:
+            return np.full(len(self), np.nan)
+        values = self.ratings[:, self.fields.index(field)].astype(float)
+        values[values == MISSING_RATING] = np.nan
+        return values
+
+    def find(self, pgid):
+        """The row of a player, or None if they aren't in this snapshot."""
+        row = np.searchsorted(self.pgid, pgid)
+        if row < len(self.pgid) and self.pgid[row] == pgid:
+            return row
+        return None
+
+
+class _PartitionArrays(dict):
+    """Opens a partition's arrays the first time they're used, memory-mapped so a query only reads
+    the pages of the rows it looks at."""
+
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+
+    def __missing__(self, name):
+        array = np.load(os.path.join(self.directory, name + '.npy'), mmap_mode='r', allow_pickle=False)
+        self[name] = array
+        return array
+
+
+class RatingHistory:
+    """A directory of roster snapshots, one partition directory of column arrays per snapshot date.
+
+    index.json lists the partitions with the roster each came from, so queries only open the
+    partitions they need and never have to read a roster file again.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._snapshots = {}
+        index_path = os.path.join(directory, INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        else:
+            self.index = {}
+
+    @property
+    def dates(self):
+        return sorted(self.index)
+
+    def snapshot(self, date):
+        if date not in self.index:
+            raise KeyError(f"There is no snapshot for {date}.")
+        if date not in self._snapshots:
+            self._snapshots[date] = RatingSnapshot.load(self._partition_path(date), date, self.index[date]['fields'])
+        return self._snapshots[date]
+
+    def add_snapshot(self, snapshot, source):
+        """Stores a snapshot, replacing any earlier one for the same date."""
+        os.makedirs(self.directory, exist_ok=True)
+        snapshot.save(self._partition_path(snapshot.date))
+        self._snapshots[snapshot.date] = snapshot
+        self.index[snapshot.date] = {'source': os.path.abspath(source), 'players': len(snapshot),
+                                     'fields': snapshot.fields, 'ingested': time.time()}
+        self._write_index()
+
+    def ingest(self, roster_paths, dates=None, node='node', workers=4, replace=False):
+        """Reads each roster and stores its ratings under its date; returns the dates ingested.
+
+        dates defaults to each file's modification date. Two rosters with the same date, or a date
+        the history already has, raise a ValueError before anything is read, unless replace=True
+        lets a roster replace the stored snapshot of its date. Rosters are read in parallel, since
+        every read is a separate Node.js process.
+        """
+        dates = list(dates or [snapshot_date(path) for path in roster_paths])
+        if len(dates) != len(roster_paths):
+            raise ValueError(f"Got {len(dates)} dates for {len(roster_paths)} rosters.")
+        by_date = {}
+        for path, date in zip(roster_paths, dates):
+            by_date.setdefault(date, []).append(os.path.basename(path))
+        repeated = {date: names for date, names in by_date.items() if len(names) > 1}
+        if repeated:
+            raise ValueError("More than one roster has the same date: "
+                             + "; ".join(f"{date} ({', '.join(names)})" for date, names in sorted(repeated.items()))
+                             + ". Give each its own date.")
+        existing = sorted(date for date in by_date if date in self.index)
+        if existing and not replace:
+            raise ValueError(f"The history already has a snapshot for {', '.join(existing)}. "
+                             "Give the rosters other dates, or replace the stored snapshots.")
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            tables = pool.map(lambda path: load_play_table(path, node), roster_paths)
+            for path, date, play in zip(roster_paths, dates, tables):
+                self.add_snapshot(RatingSnapshot.from_play_table(date, play), path)
+        return dates
+
+    def find_players(self, player):
+        """PGIDs matching a PGID or a name, e.g. "Patrick Mahomes" or just "Mahomes", in the latest snapshot that has them."""
+        text = str(player).strip()
+        if text.isdigit():
+            return [int(text)]
+
+        wanted = text.lower()
+        for date in reversed(self.dates):
+            snapshot = self.snapshot(date)
+            full_names = np.char.lower(np.char.add(np.char.add(snapshot.first_names, ' '), snapshot.last_names))
+            matches = (full_names == wanted) | (np.char.lower(snapshot.last_names) == wanted)
+            if matches.any():
+                return snapshot.pgid[matches].tolist()
+        return []
+
+    def player_history(self, pgid, fields=None):
+        """A DataFrame with one row per snapshot the player is in, indexed by date, with their ratings."""
+        fields = fields or RATING_FIELDS
+        rows = {}
+        for date in self.dates:
+            snapshot = self.snapshot(date)
+            row = snapshot.find(pgid)
+            if row is None:
+                continue
+            values = snapshot.ratings[row].astype(float)
+            values[values == MISSING_RATING] = np.nan
+            by_field = dict(zip(snapshot.fields, values))
+            rows[date] = [by_field.get(field, np.nan) for field in fields]
+        return pd.DataFrame.from_dict(rows, orient='index', columns=fields).rename_axis('date')
+
+    def player_name(self, pgid):
+        for date in reversed(self.dates):
+            snapshot = self.snapshot(date)
+            row = snapshot.find(pgid)
+            if row is not None:
+                return f"{snapshot.first_names[row]} {snapshot.last_names[row]}".strip()
+        return str(pgid)
+
+    def top_deltas(self, old_date=None, new_date=None, field='POVR', n=20, fallers=False, positions=None):
+        """The n players whose field changed most between two snapshots, biggest risers first.
+
+        The dates default to the first and last snapshot. fallers=True lists the biggest drops
+        instead. positions limits it to players with those PPOS IDs in the newer snapshot.
+        """
+        dates = self.dates
+        if len(dates) < 2 and (old_date is None or new_date is None):
+            raise ValueError("Comparing ratings needs at least two snapshots.")
+        old = self.snapshot(old_date or dates[0])
+        new = self.snapshot(new_date or dates[-1])
+
+        common, old_rows, new_rows = np.intersect1d(old.pgid, new.pgid, assume_unique=True, return_indices=True)
+        before = old.column(field)[old_rows]
+        after = new.column(field)[new_rows]
+        delta = after - before
+        keep = ~np.isnan(delta)
+        if positions is not None:
+            keep &= np.isin(new.positions[new_rows], list(positions))
+
+        candidates = np.flatnonzero(keep)
+        order = np.argsort(delta[candidates] if fallers else -delta[candidates], kind='stable')[:n]
+        chosen = candidates[order]
+        rows = new_rows[chosen]
+        return pd.DataFrame({
+            'pgid': common[chosen],
+            'name': np.char.strip(np.char.add(np.char.add(new.first_names[rows], ' '), new.last_names[rows])),
+            'position': new.positions[rows],
+            'old': before[chosen].astype(np.int64),
+            'new': after[chosen].astype(np.int64),
+            'delta': delta[chosen].astype(np.int64),
+        })
+
+    def _partition_path(self, date):
+        return os.path.join(self.directory, date)
+
+    def _write_index(self):
+        path = os.path.join(self.directory, INDEX_FILE)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, indent=2, sort_keys=True)
+        os.replace(path + '.tmp', path)
+
+
+def snapshot_date(path):
+    return datetime.date.fromtimestamp(os.path.getmtime(path)).strftime(DATE_FORMAT)
+
+
+def file_name_date(path):
+    """The last YYYY-MM-DD date in the file's name, or None if it has none."""
+    for year, month, day in reversed(FILE_NAME_DATE.findall(os.path.basename(path))):
+        try:
+            return datetime.date(int(year), int(month), int(day)).strftime(DATE_FORMAT)
+        except ValueError:
+            continue
+    return None
+
+
+def load_names(config_path=DEFAULT_CONFIG_PATH):
+    """(header_map, position_map) from config.json, or empty maps if it can't be read."""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}, {}
+    return config.get('header_map', {}), {int(k): v for k, v in config.get('position_map', {}).items()}
+
+
+def _resolve_field(name, header_map):
+    if name in RATING_FIELDS:
+        return name
+    for field, readable in header_map.items():
+        if field in RATING_FIELDS and readable.lower() == name.lower():
+            return field
+    raise ValueError(f"'{name}' isn't a stored rating.")
+
+
+def _parse_date(text):
+    try:
+        return datetime.datetime.strptime(text, DATE_FORMAT).strftime(DATE_FORMAT)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{text}' isn't a date in YYYY-MM-DD form.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keep the ratings of many roster snapshots and query how they change.")
+    parser.add_argument('store', help="directory holding the history")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    ingest = commands.add_parser('ingest', help="add roster files to the history")
+    ingest.add_argument('rosters', nargs='+', help="roster files to read")
+    ingest.add_argument('--date', type=_parse_date,
+                        help="snapshot date (YYYY-MM-DD) for a single roster; defaults to each file's modification date")
+    ingest.add_argument('--date-from-name', action='store_true',
+                        help="take each roster's date from a YYYY-MM-DD in its file name")
+    ingest.add_argument('--replace', action='store_true', help="replace stored snapshots that have the same date")
+    ingest.add_argument('--node', default='node', help="Node.js executable used to read the rosters")
+
+    commands.add_parser('list', help="list the stored snapshots")
+
+    player = commands.add_parser('player', help="show a player's ratings in every snapshot")
+    player.add_argument('player', help="PGID, full name or last name")
+    player.add_argument('--ratings', nargs='*', help="ratings to show, by field or readable name (default: all)")
+
+    risers = commands.add_parser('risers', help="players whose rating changed most between two snapshots")
+    risers.add_argument('--from', dest='old_date', type=_parse_date, help="older snapshot (default: first)")
+    risers.add_argument('--to', dest='new_date', type=_parse_date, help="newer snapshot (default: latest)")
+    risers.add_argument('--rating', default='POVR', help="rating to compare (default: Overall)")
+    risers.add_argument('-n', type=int, default=20, help="number of players to list")
+    risers.add_argument('--fallers', action='store_true', help="list the biggest drops instead")
+    risers.add_argument('--position', nargs='*', help="only players at these positions, e.g. QB WR")
+
+    for command in (player, risers):
+        command.add_argument('--json', action='store_true', help="print the result as JSON")
+    args = parser.parse_args(argv)
+
+    history = RatingHistory(args.store)
+    header_map, position_map = load_names()
+
+    if args.command == 'ingest':
+        if args.date and len(args.rosters) > 1:
+            parser.error("--date can only be given with a single roster")
+        if args.date and args.date_from_name:
+            parser.error("--date and --date-from-name can't be combined")
+        dates = [args.date] if args.date else None
+        if args.date_from_name:
+            dates = [file_name_date(path) for path in args.rosters]
+            undated = [os.path.basename(path) for path, date in zip(args.rosters, dates) if date is None]
+            if undated:
+                parser.error(f"no YYYY-MM-DD date in the name of {', '.join(undated)}")
+        start = time.perf_counter()
+        try:
+            dates = history.ingest(args.rosters, dates, node=args.node, replace=args.replace)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 1
+        for path, date in zip(args.rosters, dates):
+            print(f"{date}: {history.index[date]['players']} players from {os.path.basename(path)}")
+        print(f"Ingested in {time.perf_counter() - start:.3f}s", file=sys.stderr)
+        return 0
+
+    if args.command == 'list':
+        for date in history.dates:
+            entry = history.index[date]
+            print(f"{date}  {entry['players']:>5} players  {entry['source']}")
+        return 0
+
+    start = time.perf_counter()
+    try:
+        if args.command == 'player':
+            fields = [_resolve_field(name, header_map) for name in args.ratings] if args.ratings else None
+            players = history.find_players(args.player)
+            if not players:
+                print(f"No player matches '{args.player}'.", file=sys.stderr)
+                return 1
+            results = {pgid: history.player_history(pgid, fields) for pgid in players}
+        else:
+            field = _resolve_field(args.rating, header_map)
+            positions = None
+            if args.position:
+                by_name = {name.upper(): position_id for position_id, name in position_map.items()}
+                positions = [by_name[name.upper()] for name in args.position if name.upper() in by_name]
+            table = history.top_deltas(args.old_date, args.new_date, field, args.n, args.fallers, positions)
+            table['position'] = table['position'].map(lambda position_id: position_map.get(position_id, position_id))
+    except (KeyError, ValueError) as e:
+        print(e.args[0] if e.args else e, file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    if args.command == 'player':
+        for pgid, frame in results.items():
+            frame = frame.rename(columns=header_map)
+            if args.json:
+                print(json.dumps({'pgid': pgid, 'name': history.player_name(pgid),
+                                  'history': json.loads(frame.to_json(orient='index'))}, indent=2))
+            else:
+                print(f"{history.player_name(pgid)} ({pgid})")
+                print(frame.to_string(float_format='{:.0f}'.format, na_rep='-'))
+    elif args.json:
+        print(table.to_json(orient='records', indent=2))
+    else:
+        print(table.to_string(index=False))
+    print(f"Answered in {elapsed * 1000:.1f}ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Players are matched on their ID, or on name and position when their ID is missing or not unique
+PLAYER_KEY = ['PGID']
+FALLBACK_PLAYER_KEY = ['PFNA', 'PLNA', 'PPOS']
+NAME_COLUMNS = ['PFNA', 'PLNA']
+
+DEFAULT_NODE_SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'roster_io.js')
+
+
+class RosterDiff:
+    """Cell-level differences between two PLAY tables.
+
+    changes holds one row per changed cell (player, column, old, new), grouped by player. added and
+    removed are the rows of players that are only in the new or only in the old table. key_columns
+    are the columns players were matched on, and name_matched counts the players of both tables that
+    were matched on name and position for want of a usable ID.
+    """
+
+    def __init__(self, key_columns, changes, added, removed, labels, name_matched=0):
+        self.key_columns = key_columns
+        self.changes = changes
+        self.added = added
+        self.removed = removed
+        self.labels = labels
+        self.name_matched = name_matched
+
+    @property
+    def is_empty(self):
+        return self.changes.empty and self.added.empty and self.removed.empty
+
+    def by_player(self):
+        """{player: [(column, old, new), ...]} for every player with changed cells."""
+        grouped = {}
+        for player, column, old, new in self.changes[['player', 'column', 'old', 'new']].itertuples(index=False):
+            grouped.setdefault(player, []).append((column, old, new))
+        return grouped
+
+    def label(self, player):
+        return self.labels.get(player, str(player))
+
+    def to_dict(self):
+        return {
+            'key': self.key_columns,
+            'changed': [
+                {'player': _json_value(player), 'label': self.label(player),
+                 'cells': [{'column': column, 'old': _json_value(old), 'new': _json_value(new)} for column, old, new in cells]}
+                for player, cells in self.by_player().items()
+            ],
+            'added': [self.label(player) for player in self.added.index],
+            'removed': [self.label(player) for player in self.removed.index],
+        }
+
+    def format_report(self, column_names=None):
+        column_names = column_names or {}
+        lines = [f"{len(self.changes)} changed cells across {self.changes['player'].nunique()} players, "
+                 f"{len(self.added)} players added, {len(self.removed)} removed"]
+        for player, cells in self.by_player().items():
+            lines.append(f"{self.label(player)}:")
+            for column, old, new in cells:
+                lines.append(f"  {column_names.get(column, column)}: {old} -> {new}")
+        for title, rows in (("Added", self.added), ("Removed", self.removed)):
+            if not rows.empty:
+                lines.append(f"{title}: " + ", ".join(self.label(player) for player in rows.index))
+        return "\n".join(lines)
+
+
+def diff_rosters(old, new, ignore_columns=()):
+    """Aligns two PLAY tables on the player key and compares every shared column at once.
+
+    A player is matched on PGID unless it's missing or repeated in either table; only those players
+    are matched on name and position, so a few bad IDs don't change how everyone else is matched.
+    """
+    ids = _usable_ids(old, new)
+    old_keyed, old_by_name = _index_by_key(old, ids)
+    new_keyed, new_by_name = _index_by_key(new, ids)
+    if not old_by_name and not new_by_name:
+        key_columns = PLAYER_KEY
+    elif not ids:
+        key_columns = FALLBACK_PLAYER_KEY
+    else:
+        key_columns = PLAYER_KEY + FALLBACK_PLAYER_KEY
+
+    common = old_keyed.index.intersection(new_keyed.index, sort=False)
+    columns = [col for col in old_keyed.columns if col in new_keyed.columns and col not in ignore_columns]
+
+    old_values = old_keyed.loc[common, columns].to_numpy(dtype=object)
+    new_values = new_keyed.loc[common, columns].to_numpy(dtype=object)
+
+    # NaN never equals itself, so cells that are missing on both sides are masked out separately
+    old_missing = pd.isna(old_keyed.loc[common, columns]).to_numpy()
+    new_missing = pd.isna(new_keyed.loc[common, columns]).to_numpy()
+    different = (old_values != new_values) & ~(old_missing & new_missing)
+
+    rows, cols = np.nonzero(different)
+    changes = pd.DataFrame({
+        'player': common[rows],
+        'column': np.asarray(columns, dtype=object)[cols],
+        'old': old_values[rows, cols],
+        'new': new_values[rows, cols],
+    })
+
+    labels = _player_labels(old_keyed).to_dict()
+    labels.update(_player_labels(new_keyed).to_dict())
+
+    return RosterDiff(
+        key_columns,
+        changes,
+        new_keyed.loc[new_keyed.index.difference(old_keyed.index, sort=False)],
+        old_keyed.loc[old_keyed.index.difference(new_keyed.index, sort=False)],
+        labels,
+        old_by_name + new_by_name,
+    )
+
+
+def _usable_ids(old, new):
+    """The PGIDs, as key text, that no more than one player has in each table."""
+    id_column = PLAYER_KEY[0]
+    if id_column not in old.columns or id_column not in new.columns:
+        return set()
+    usable, repeated = set(), set()
+    for table in (old, new):
+        ids = table.loc[table[id_column].notna(), id_column].map(_key_text)
+        usable.update(ids)
+        repeated.update(ids[ids.duplicated()])
+    return usable - repeated
+
+
+def _index_by_key(table, ids):
+    """table indexed by player key, and how many of its players were keyed on name and position."""
+    id_column = PLAYER_KEY[0]
+    if id_column in table.columns:
+        id_keys = table[id_column].map(_key_text)
+        by_id = (table[id_column].notna() & id_keys.isin(ids)).to_numpy()
+    else:
+        id_keys = pd.Series('', index=table.index)
+        by_id = np.zeros(len(table), dtype=bool)
+
+    keys = id_keys.to_numpy(dtype=object)
+    by_name = ~by_id
+    if by_name.any():
+        missing = [col for col in FALLBACK_PLAYER_KEY if col not in table.columns]
+        if missing:
+            raise KeyError(f"PLAY table is missing the key columns {missing}")
+        name_keys = table.loc[by_name, FALLBACK_PLAYER_KEY].apply(lambda column: column.map(_key_text))
+        # Players with the same name and position are matched in table order
+        occurrence = name_keys.groupby(FALLBACK_PLAYER_KEY).cumcount().astype(str)
+        keys[by_name] = name_keys.agg('/'.join, axis=1).str.cat(occurrence, sep='#').to_numpy()
+    return table.set_axis(pd.Index(keys, name='player'), axis=0), int(by_name.sum())
+
+
+def _key_text(value):
+    # IDs can come back as floats when a column has gaps, which mustn't stop them from matching
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _player_labels(table):
+    names = [col for col in NAME_COLUMNS if col in table.columns]
+    if not names:
+        return pd.Series(dtype=object)
+    return table[names].astype(str).agg(' '.join, axis=1)
+
+
+def _json_value(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+def load_play_table(path, node='node', script=DEFAULT_NODE_SCRIPT_PATH):
+    """Reads the PLAY table of a roster file with roster_io.js."""
+    result = subprocess.run([node, script, 'read', path, '--tables', 'PLAY'], capture_output=True, text=True, check=True)
+    return pd.DataFrame.from_records(json.loads(result.stdout).get('play', []))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show the player cells that differ between two roster files.")
+    parser.add_argument('old', help="original roster file")
+    parser.add_argument('new', help="changed roster file")
+    parser.add_argument('--json', action='store_true', help="print the differences as JSON")
+    parser.add_argument('--node', default='node', help="Node.js executable used to read the rosters")
+    parser.add_argument('--ignore', nargs='*', default=[], help="columns to leave out of the comparison")
+    args = parser.parse_args(argv)
+
+    old = load_play_table(args.old, args.node)
+    new = load_play_table(args.new, args.node)
+
+    start = time.perf_counter()
+    diff = diff_rosters(old, new, ignore_columns=args.ignore)
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(diff.to_dict(), indent=2))
+    else:
+        print(diff.format_report())
+        print(f"Compared in {elapsed:.3f}s", file=sys.stderr)
+    return 1 if not diff.is_empty else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+# Tables the editor shows or saves. PSAL and BLOB aren't read at all; a save carries them through untouched.
+EDITOR_TABLES = ['PLAY', 'INJY', 'TEAM', 'DCHT']
+# INJY is only read for the fields that are merged into the player table
+INJURY_FIELDS = ['PGID', 'INIR', 'INJL', 'INJS', 'INJT', 'INSI', 'INTW']
+# Always read, whatever the layout shows: the player key and names
+KEY_FIELDS = ['PGID', 'PFNA', 'PLNA']
+
+
+class RosterProjection:
+    """Which tables roster_io.js reads and, for each one, which fields it serializes.
+
+    fields maps a table name to a list of its fields, or to None for all of them. Fields that
+    aren't serialized are still in the roster file, and a save leaves them as they are.
+    """
+
+    def __init__(self, fields):
+        self.fields = fields
+
+    @classmethod
+    def full(cls, tables=EDITOR_TABLES):
+        return cls({table: None for table in tables})
+
+    @classmethod
+    def for_columns(cls, columns, header_map, codecs):
+        """Reads the PLAY fields behind a set of readable column names, plus every mapped ID field.
+
+        A label column such as PositionName is read through its ID field. TEAM and DCHT are small
+        and saved back whole, so they're always read in full.
+        """
+        inverse_header_map = {readable: field for field, readable in header_map.items()}
+        fields = set(KEY_FIELDS)
+        for column in columns:
+            if column in codecs:
+                column = codecs[column].id_column
+            if column in inverse_header_map:
+                fields.add(inverse_header_map[column])
+        # The codecs and the validator work on the ID fields even when the layout doesn't show them
+        for codec in codecs.codecs.values():
+            fields.add(inverse_header_map.get(codec.id_column, codec.id_column))
+        return cls({'PLAY': sorted(fields), 'INJY': INJURY_FIELDS, 'TEAM': None, 'DCHT': None})
+
+    @property
+    def tables(self):
+        return list(self.fields)
+
+    def is_partial(self, table):
+        """True when only some of the table's fields are read."""
+        return self.fields.get(table) is not None
+
+    def node_args(self):
+        """The options that make 'roster_io.js read' apply this projection."""
+        args = ['--tables', ','.join(self.tables)]
+        for table, fields in self.fields.items():
+            if fields is not None:
+                args += ['--fields', f"{table}={','.join(fields)}"]
+        return args
@@ -0,0 +1,196 @@
+import importlib.util
+import os
+
+import numpy as np
+import pandas as pd
+
+KEY_COLUMN = 'Player ID'
+# Holds a dict per player, which doesn't survive a round trip through a spreadsheet
+EXCLUDED_COLUMNS = ['UnmappedData']
+DEFAULT_CHUNK_ROWS = 1000
+
+FILE_FILTER = "CSV (*.csv);;Excel Workbook (*.xlsx);;Parquet (*.parquet)"
+
+
+def export_roster(df, path):
+    """Writes the mapped PLAY table to a .csv, .xlsx or .parquet file, picked by the file extension."""
+    table = df.drop(columns=EXCLUDED_COLUMNS, errors='ignore')
+    extension = _extension(path)
+    if extension == '.csv':
+        table.to_csv(path, index=False)
+    elif extension == '.xlsx':
+        table.to_excel(path, index=False)
+    else:
+        _require_pyarrow()
+        table.to_parquet(path, index=False)
+
+
+def iter_spreadsheet_chunks(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Yields the rows of an exported roster as DataFrames of up to chunk_rows rows, without loading the whole file."""
+    extension = _extension(path)
+    if extension == '.csv':
+        yield from pd.read_csv(path, chunksize=chunk_rows)
+    elif extension == '.xlsx':
+        yield from _iter_xlsx_chunks(path, chunk_rows)
+    else:
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+
+
+class ImportPlan:
+    """The cells an import would change, plus everything it had to skip.
+
+    changes has one row per changed cell (index, column, old, new). rejected lists values that aren't
+    valid for their column, unknown_players the keys that match no player in the roster and
+    unknown_columns the file's columns the roster doesn't have.
+    """
+
+    def __init__(self, changes, rejected, unknown_players, unknown_columns):
+        self.changes = changes
+        self.rejected = rejected
+        self.unknown_players = unknown_players
+        self.unknown_columns = unknown_columns
+
+    @property
+    def is_empty(self):
+        return self.changes.empty
+
+    def column_counts(self):
+        return self.changes['column'].value_counts()
+
+    def to_results(self):
+        return changes_to_results(self.changes)
+
+
+def changes_to_results(changes):
+    """{index: {column: value}} from a frame of (index, column, old, new) changes, the shape RosterEditor
+    commits bulk results in."""
+    results = {}
+    for index, column, value in changes[['index', 'column', 'new']].itertuples(index=False):
+        results.setdefault(index, {})[column] = value
+    return results
+
+
+def plan_import(model, chunks, value_maps=None):
+    """Works out which cells of model the spreadsheet rows in chunks would change.
+
+    Rows are matched to players on Player ID. Blank cells are left alone. value_maps maps a mapped
+    column to (inverse_map, id_column): its values must be keys of inverse_map, and when id_column is
+    set it's updated with the matching ID too.
+    """
+    value_maps = value_maps or {}
+    positions = pd.Series(model.index, index=pd.to_numeric(model[KEY_COLUMN], errors='coerce'))
+    positions = positions[~positions.index.duplicated()]
+
+    changes, rejected, unknown_players, unknown_columns = [], [], [], set()
+
+    for chunk in chunks:
+        if KEY_COLUMN not in chunk.columns:
+            raise ValueError(f"The file has no '{KEY_COLUMN}' column to match players on.")
+
+        keys = pd.to_numeric(chunk[KEY_COLUMN], errors='coerce')
+        known = keys.isin(positions.index)
+        unknown_players.extend(chunk.loc[~known, KEY_COLUMN].tolist())
+        chunk = chunk[known]
+        if chunk.empty:
+            continue
+
+        indices = positions.loc[keys[known]].to_numpy()
+        unknown_columns.update(col for col in chunk.columns if col not in model.columns)
+        columns = [col for col in chunk.columns
+                   if col in model.columns and col != KEY_COLUMN and col not in EXCLUDED_COLUMNS]
+
+        for column in columns:
+            incoming = chunk[column].reset_index(drop=True)
+            present = incoming.notna().to_numpy()
+            current = model.loc[indices, column].reset_index(drop=True)
+
+            if column in value_maps:
+                inverse_map, id_column = value_maps[column]
+                valid = incoming.isin(inverse_map.keys()).to_numpy()
+            elif pd.api.types.is_numeric_dtype(model[column]):
+                numbers = pd.to_numeric(incoming, errors='coerce')
+                valid = numbers.notna()
+                if pd.api.types.is_integer_dtype(model[column]):
+                    valid &= numbers % 1 == 0
+                valid = valid.to_numpy()
+                incoming = numbers
+                id_column = None
+            else:
+                valid = np.ones(len(incoming), dtype=bool)
+                id_column = None
+
+            bad = present & ~valid
+            if bad.any():
+                rejected.append(pd.DataFrame({'index': indices[bad], 'column': column, 'value': chunk[column].to_numpy()[bad]}))
+
+            changed = present & valid & (incoming != current).to_numpy()
+            if not changed.any():
+                continue
+
+            new_values = incoming.to_numpy()[changed]
+            if pd.api.types.is_integer_dtype(model[column]):
+                new_values = new_values.astype(np.int64)
+            changes.append(pd.DataFrame({
+                'index': indices[changed],
+                'column': column,
+                'old': current.to_numpy()[changed],
+                'new': new_values,
+            }))
+            if id_column is not None and id_column in model.columns:
+                new_ids = incoming[changed].map(inverse_map).to_numpy()
+                changes.append(pd.DataFrame({
+                    'index': indices[changed],
+                    'column': id_column,
+                    'old': model.loc[indices[changed], id_column].to_numpy(),
+                    'new': new_ids,
+                }))
+
+    return ImportPlan(
+        _concat(changes, ['index', 'column', 'old', 'new']),
+        _concat(rejected, ['index', 'column', 'value']),
+        unknown_players,
+        sorted(unknown_columns),
+    )
+
+
+def _concat(frames, columns):
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    # Later rows for the same cell win, as they would if the file was applied row by row
+    return pd.concat(frames, ignore_index=True).drop_duplicates(['index', 'column'], keep='last')
+
+
+def _iter_xlsx_chunks(path, chunk_rows):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= chunk_rows:
+                yield pd.DataFrame(batch, columns=header)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=header)
+    finally:
+        workbook.close()
+
+
+def _extension(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in ('.csv', '.xlsx', '.parquet'):
+        raise ValueError(f"Unsupported file type '{extension}'. Use .csv, .xlsx or .parquet.")
+    return extension
+
+
+def _require_pyarrow():
+    if importlib.util.find_spec('pyarrow') is None:
+        raise ValueError("Parquet files need the 'pyarrow' package. Install it with 'pip install pyarrow'.")
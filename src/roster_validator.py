@@ -0,0 +1,122 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+# The "teams" draft prospects and free agents belong to, where shared jersey numbers are expected
+NON_ROSTER_TEAMS = {'NFL Draft', 'Free Agents'}
+UNKNOWN_VALUE = "Unknown"
+
+RATING_MIN = 0
+RATING_MAX = 99
+
+
+class ValidationRule:
+    """A named check over the whole PLAY table. check(df) returns a boolean mask of the rows that break it."""
+
+    def __init__(self, name, description, check):
+        self.name = name
+        self.description = description
+        self.check = check
+
+
+class ValidationReport:
+    """Rows that broke each rule, by rule name, in the order the rules ran."""
+
+    def __init__(self, violations, descriptions, seconds):
+        self.violations = violations
+        self.descriptions = descriptions
+        self.seconds = seconds
+
+    @property
+    def is_empty(self):
+        return not self.violations
+
+    @property
+    def total(self):
+        return sum(len(rows) for rows in self.violations.values())
+
+    def format_summary(self):
+        return "\n".join(f"{rule}: {len(rows)} players" for rule, rows in self.violations.items())
+
+
+class RosterValidator:
+    def __init__(self, rules):
+        self.rules = rules
+
+    def validate(self, df):
+        start = time.perf_counter()
+        violations = {}
+        for rule in self.rules:
+            mask = rule.check(df)
+            if mask is None:
+                continue
+            rows = df.index[np.asarray(mask, dtype=bool)]
+            if len(rows):
+                violations[rule.name] = rows
+        descriptions = {rule.name: rule.description for rule in self.rules}
+        return ValidationReport(violations, descriptions, time.perf_counter() - start)
+
+
+def default_rules(data_manager, rating_columns):
+    """The standard checks for a loaded roster, using the maps and position groups from data_manager."""
+    position_group_map = data_manager.position_group_map
+
+    def archetype_position(df):
+        if 'Archetype' not in df.columns or 'PositionName' not in df.columns:
+            return None
+        archetype = df['Archetype'].astype(str)
+        group = df['PositionName'].map(position_group_map).fillna(df['PositionName'])
+        has_archetype = df['Archetype'].notna() & (archetype != '') & (archetype != UNKNOWN_VALUE)
+        return has_archetype & (archetype.str.split('_').str[0] != group)
+
+    def rating_bounds(df):
+        columns = [col for col in rating_columns if col in df.columns]
+        if not columns:
+            return None
+        ratings = df[columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        # NaN compares False both ways, so blank ratings don't count as out of range
+        return ((ratings < RATING_MIN) | (ratings > RATING_MAX)).any(axis=1)
+
+    def duplicate_jersey(df):
+        if 'TeamName' not in df.columns or 'Jersey Num.' not in df.columns:
+            return None
+        on_roster = ~df['TeamName'].isin(NON_ROSTER_TEAMS)
+        return on_roster & df[on_roster].duplicated(['TeamName', 'Jersey Num.'], keep=False).reindex(df.index, fill_value=False)
+
+    def duplicate_player_id(df):
+        if 'Player ID' not in df.columns:
+            return None
+        return df['Player ID'].notna() & df['Player ID'].duplicated(keep=False)
+
+    rules = [
+        ValidationRule("Archetype doesn't match position",
+                       "The archetype belongs to a different position group than the player's position.",
+                       archetype_position),
+        ValidationRule(f"Rating outside {RATING_MIN}-{RATING_MAX}",
+                       f"At least one rating is below {RATING_MIN} or above {RATING_MAX}.",
+                       rating_bounds),
+        ValidationRule("Duplicate jersey number",
+                       "Another player on the same team wears the same number.",
+                       duplicate_jersey),
+        ValidationRule("Duplicate player ID",
+                       "Another player has the same PGID.",
+                       duplicate_player_id),
+    ]
+
+    # The load maps IDs that aren't in config.json to "Unknown"
+    for column, source in (('PositionName', 'PPOS'), ('TeamName', 'TGID'), ('CollegeName', 'PCOL'),
+                           ('Archetype', 'PLTY'), ('XP Rate/TraitDevelopment', 'PROL'), ('Home State', 'PHSN'),
+                           ('Career Phase', 'PCPH'), ('QB Style', 'PQBS')):
+        rules.append(ValidationRule(f"Unknown {column}",
+                                    f"The {source} ID isn't in the config.json map for {column}.",
+                                    _unknown_value_check(column)))
+    return rules
+
+
+def _unknown_value_check(column):
+    def check(df):
+        if column not in df.columns:
+            return None
+        return df[column] == UNKNOWN_VALUE
+    return check
@@ -0,0 +1,131 @@
+import pandas as pd
+
+TEAM_COLUMN = 'TeamName'
+POSITION_COLUMN = 'PositionName'
+OVERALL_COLUMN = 'Overall'
+SALARY_COLUMNS = ([f'Salary Year {year}' for year in range(7)] +
+                  [f'Bonus Year {year}' for year in range(7)] +
+                  ['Total Salary'])
+
+PLAYERS = 'Players'
+STARTERS = 'Starters'
+STARTER_OVERALL = 'Starter Overall'
+
+
+class TeamAggregates:
+    """Per-team OVR, roster counts and cap totals, kept up to date one edited cell at a time.
+
+    The totals are built with a single groupby when the roster is loaded. After that each player's
+    team, position and tracked values are remembered by model index, so an edit only moves that
+    player's contribution between the teams involved instead of rescanning the roster.
+    """
+
+    def __init__(self, model, starters=()):
+        self.sum_columns = [OVERALL_COLUMN] + [col for col in SALARY_COLUMNS if col in model.columns]
+
+        # Plain labels, so teams and positions can be added later and groupby only sees the ones in use
+        self._players = pd.DataFrame({TEAM_COLUMN: model[TEAM_COLUMN].astype(object),
+                                      POSITION_COLUMN: model[POSITION_COLUMN].astype(object)})
+        for col in self.sum_columns:
+            self._players[col] = pd.to_numeric(model[col], errors='coerce').fillna(0).astype(float)
+        self._players['is_starter'] = self._players.index.isin(list(starters))
+
+        grouped = self._players.groupby(TEAM_COLUMN)
+        self._totals = grouped[self.sum_columns].sum()
+        self._totals[PLAYERS] = grouped.size()
+        starter_rows = self._players[self._players['is_starter']]
+        self._totals[STARTERS] = starter_rows.groupby(TEAM_COLUMN).size()
+        self._totals[STARTER_OVERALL] = starter_rows.groupby(TEAM_COLUMN)[OVERALL_COLUMN].sum()
+        self._totals = self._totals.fillna(0).astype(float)
+
+        self._position_counts = pd.crosstab(self._players[TEAM_COLUMN], self._players[POSITION_COLUMN])
+
+    @property
+    def tracked_columns(self):
+        return [TEAM_COLUMN, POSITION_COLUMN] + self.sum_columns
+
+    def apply_changes(self, changes):
+        """Updates the totals for {index: {column: value}} edits. Untracked columns are ignored."""
+        tracked = set(self.tracked_columns)
+        for index, row_changes in changes.items():
+            if index not in self._players.index:
+                continue
+            for column, value in row_changes.items():
+                if column in tracked:
+                    self.update_cell(index, column, value)
+
+    def update_cell(self, index, column, value):
+        if column == TEAM_COLUMN:
+            self._move_player(index, value)
+        elif column == POSITION_COLUMN:
+            team = self._players.at[index, TEAM_COLUMN]
+            self._add_position(team, self._players.at[index, POSITION_COLUMN], -1)
+            self._add_position(team, value, 1)
+            self._players.at[index, POSITION_COLUMN] = value
+        else:
+            value = pd.to_numeric(value, errors='coerce')
+            value = 0 if pd.isna(value) else value
+            delta = value - self._players.at[index, column]
+            team = self._players.at[index, TEAM_COLUMN]
+            self._totals.at[team, column] += delta
+            if column == OVERALL_COLUMN and self._players.at[index, 'is_starter']:
+                self._totals.at[team, STARTER_OVERALL] += delta
+            self._players.at[index, column] = value
+
+    def set_starters(self, starters):
+        """Replaces the set of starters, e.g. after the depth charts are rebuilt."""
+        is_starter = self._players.index.isin(list(starters))
+        self._players['is_starter'] = is_starter
+        starter_rows = self._players[is_starter]
+        self._totals[STARTERS] = starter_rows.groupby(TEAM_COLUMN).size().reindex(self._totals.index, fill_value=0)
+        self._totals[STARTER_OVERALL] = (starter_rows.groupby(TEAM_COLUMN)[OVERALL_COLUMN].sum()
+                                         .reindex(self._totals.index, fill_value=0))
+
+    def summary(self):
+        """One row per team with average OVRs, position counts and cap totals."""
+        totals = self._totals[self._totals[PLAYERS] > 0]
+        summary = pd.DataFrame(index=totals.index)
+        summary[PLAYERS] = totals[PLAYERS].astype(int)
+        summary['Avg OVR'] = (totals[OVERALL_COLUMN] / totals[PLAYERS]).round(1)
+        summary['Starter Avg OVR'] = (totals[STARTER_OVERALL] / totals[STARTERS].where(totals[STARTERS] > 0)).round(1)
+        for col in self.sum_columns[1:]:
+            summary[col] = totals[col]
+        counts = self._position_counts.reindex(totals.index, fill_value=0)
+        counts = counts.loc[:, (counts > 0).any()]
+        return summary.join(counts.astype(int)).sort_index()
+
+    def _move_player(self, index, new_team):
+        old_team = self._players.at[index, TEAM_COLUMN]
+        if new_team == old_team:
+            return
+
+        self._ensure_team(new_team)
+        values = self._players.loc[index, self.sum_columns]
+        is_starter = self._players.at[index, 'is_starter']
+        position = self._players.at[index, POSITION_COLUMN]
+
+        for team, sign in ((old_team, -1), (new_team, 1)):
+            for col in self.sum_columns:
+                self._totals.at[team, col] += sign * values[col]
+            self._totals.at[team, PLAYERS] += sign
+            self._add_position(team, position, sign)
+
+        # The player was only a starter on the old team's depth chart
+        if is_starter:
+            self._totals.at[old_team, STARTERS] -= 1
+            self._totals.at[old_team, STARTER_OVERALL] -= values[OVERALL_COLUMN]
+            self._players.at[index, 'is_starter'] = False
+
+        self._players.at[index, TEAM_COLUMN] = new_team
+
+    def _add_position(self, team, position, count):
+        if position not in self._position_counts.columns:
+            self._position_counts[position] = 0
+        self._ensure_team(team)
+        self._position_counts.at[team, position] += count
+
+    def _ensure_team(self, team):
+        if team not in self._totals.index:
+            self._totals.loc[team] = 0
+        if team not in self._position_counts.index:
+            self._position_counts.loc[team] = 0
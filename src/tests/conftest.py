@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pytest
+
+# The app's modules sit flat in src/ and import each other by name, as they do when mrepAPI.py runs
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+
+@pytest.fixture
+def changes_of():
+    """Turns the (index, column, old, new) changes of an import plan or bulk edit result into {(index, column): (old, new)}."""
+    def changes_of(result):
+        return {(index, column): (old, new) for index, column, old, new in result.changes.itertuples(index=False)}
+    return changes_of
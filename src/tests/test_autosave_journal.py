@@ -0,0 +1,125 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from autosave_journal import AutosaveJournal, discard_journal, journal_path, read_journal
+
+
+@pytest.fixture
+def roster_path(tmp_path):
+    path = tmp_path / 'ROSTER.ros'
+    path.write_bytes(b'roster data')
+    return str(path)
+
+
+def write_journal(roster_path, *batches):
+    journal = AutosaveJournal(roster_path)
+    for table, changes in batches:
+        journal.append(changes, table)
+    journal.close()
+    return journal
+
+
+def test_no_journal(roster_path):
+    assert read_journal(roster_path) is None
+
+
+def test_batches_are_merged_with_later_ones_winning(roster_path):
+    write_journal(roster_path,
+                  ('play', {3: {'Speed': 90, 'Age': 25}}),
+                  ('play', {3: {'Speed': 92}, 7: {'Speed': np.int64(60)}}),
+                  ('team', {0: {'Name': 'Bears'}}))
+
+    recovered = read_journal(roster_path)
+    assert recovered.batches == 3
+    assert recovered.matches_roster
+    assert recovered.changes() == {3: {'Speed': 92, 'Age': 25}, 7: {'Speed': 60}}
+    assert recovered.changes('team') == {0: {'Name': 'Bears'}}
+    assert recovered.changes('coach') == {}
+    assert recovered.cell_count == 4
+    assert recovered.last_edit is not None
+
+
+def test_missing_values_are_journalled_as_null(roster_path):
+    write_journal(roster_path, ('play', {1: {'Speed': pd.NA, 'Age': np.nan, 'Signed': pd.NaT, 'Name': None,
+                                             'Rookie': np.bool_(True), 'Height': np.float32(1.5)}}))
+
+    with open(journal_path(roster_path), encoding='utf-8') as f:
+        assert '"Speed": null' in f.read().splitlines()[1]
+    assert read_journal(roster_path).changes() == {1: {'Speed': None, 'Age': None, 'Signed': None, 'Name': None,
+                                                       'Rookie': True, 'Height': 1.5}}
+
+
+def test_values_without_a_json_form_are_refused(roster_path):
+    journal = AutosaveJournal(roster_path)
+    with pytest.raises(TypeError, match="Timestamp value can't be written"):
+        journal.append({1: {'Drafted': pd.Timestamp('2026-04-24')}})
+    assert not journal.has_unsaved_edits
+    journal.close()
+
+    assert read_journal(roster_path).is_empty
+
+
+def test_reading_stops_at_a_half_written_line(roster_path):
+    write_journal(roster_path, ('play', {1: {'Speed': 80}}), ('play', {2: {'Speed': 81}}))
+    with open(journal_path(roster_path), 'a', encoding='utf-8') as f:
+        f.write('{"time": 1, "table": "play", "chan')
+
+    recovered = read_journal(roster_path)
+    assert recovered.batches == 2
+    assert recovered.changes() == {1: {'Speed': 80}, 2: {'Speed': 81}}
+
+
+def test_an_unreadable_header_recovers_nothing(roster_path):
+    with open(journal_path(roster_path), 'w', encoding='utf-8') as f:
+        f.write('not json\n')
+
+    recovered = read_journal(roster_path)
+    assert recovered.is_empty
+    assert not recovered.matches_roster
+
+
+def test_a_changed_roster_no_longer_matches(roster_path):
+    write_journal(roster_path, ('play', {1: {'Speed': 80}}))
+    with open(roster_path, 'ab') as f:
+        f.write(b' saved by another tool')
+
+    recovered = read_journal(roster_path)
+    assert not recovered.matches_roster
+    assert recovered.changes() == {1: {'Speed': 80}}
+
+
+def test_reset_keeps_only_later_edits(roster_path):
+    journal = AutosaveJournal(roster_path)
+    journal.append({1: {'Speed': 80}})
+    journal.reset()
+    assert not journal.has_unsaved_edits
+    journal.append({2: {'Speed': 81}})
+    assert journal.has_unsaved_edits
+    journal.close()
+
+    assert read_journal(roster_path).changes() == {2: {'Speed': 81}}
+
+
+def test_an_existing_journal_is_appended_to(roster_path):
+    write_journal(roster_path, ('play', {1: {'Speed': 80}}))
+    write_journal(roster_path, ('play', {2: {'Speed': 81}}))
+
+    assert read_journal(roster_path).batches == 2
+
+
+def test_empty_batches_are_not_written(roster_path):
+    journal = write_journal(roster_path, ('play', {}))
+    assert not journal.has_unsaved_edits
+    assert read_journal(roster_path).is_empty
+
+
+def test_close_and_discard_remove_the_journal(roster_path):
+    write_journal(roster_path, ('play', {1: {'Speed': 80}}))
+    discard_journal(roster_path)
+    assert not os.path.exists(journal_path(roster_path))
+
+    AutosaveJournal(roster_path).close(delete=True)
+    assert read_journal(roster_path) is None
@@ -0,0 +1,143 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bulk_edit import BulkEdit, BulkEditError, load_rule_file, run_bulk_edits
+
+POSITION_IDS = {'QB': 0, 'WR': 3}
+
+
+def roster():
+    return pd.DataFrame({
+        'PositionName': ['WR', 'QB', 'WR', 'WR'],
+        'PPOS': [3, 0, 3, 3],
+        'Age': [23, 30, 28, 22],
+        'Speed': [90, 70, 85, 98],
+        'Throw Power': [40, 95, 45, 50],
+    })
+
+
+def test_filter_and_assignment(changes_of):
+    edit = BulkEdit('Young WRs', "PositionName == 'WR' and Age < 25", {'Speed': 'MIN(Speed + 2, 99)'})
+
+    result = run_bulk_edits(roster(), [edit])
+    assert result.matched == {'Young WRs': 2}
+    assert changes_of(result) == {(0, 'Speed'): (90, 92), (3, 'Speed'): (98, 99)}
+    assert result.to_results() == {0: {'Speed': 92}, 3: {'Speed': 99}}
+
+
+def test_empty_filter_matches_everyone():
+    result = run_bulk_edits(roster(), [BulkEdit('All', '', {'Age': 'Age + 1'})])
+    assert result.matched == {'All': 4}
+    assert list(result.touched_rows) == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize('filter_text, matched', [
+    ('not True', 0),
+    ('not False', 4),
+    ('not (Age > 25)', 2),
+    ("PositionName not in ['WR']", 1),
+    ('20 < Age < 25', 2),
+    ("Age > 29 or PositionName == 'WR' and Speed > 95", 2),
+])
+def test_filters(filter_text, matched):
+    result = run_bulk_edits(roster(), [BulkEdit('Edit', filter_text, {'Age': 'Age'})])
+    assert result.matched == {'Edit': matched}
+    assert result.is_empty
+
+
+def test_backticked_columns(changes_of):
+    edit = BulkEdit.from_text('Arm', '`Throw Power` < 50', '`Throw Power` = CLIP(`Throw Power` * 2, 0, 95)')
+
+    assert edit.assignments == {'Throw Power': 'CLIP(`Throw Power` * 2, 0, 95)'}
+    assert changes_of(run_bulk_edits(roster(), [edit])) == {(0, 'Throw Power'): (40, 80), (2, 'Throw Power'): (45, 90)}
+
+
+def test_assignments_in_one_edit_see_the_old_values_and_later_edits_see_the_new(changes_of):
+    edits = [
+        BulkEdit('Swap', '', {'Speed': 'Age', 'Age': 'Speed'}),
+        BulkEdit('Fast', 'Speed > 25', {'Throw Power': '0'}),
+    ]
+
+    result = run_bulk_edits(roster(), edits)
+    assert changes_of(result)[(1, 'Speed')] == (70, 30)
+    assert changes_of(result)[(1, 'Age')] == (30, 70)
+    assert result.matched['Fast'] == 2
+
+
+def test_integer_columns_are_rounded(changes_of):
+    result = run_bulk_edits(roster(), [BulkEdit('Slower', '', {'Speed': 'Speed * 0.95'})])
+    assert changes_of(result)[(0, 'Speed')] == (90, 86)
+
+
+def test_mapped_columns_update_their_id_column(changes_of):
+    edit = BulkEdit('Move', 'Speed > 95', {'PositionName': "'QB'"})
+    result = run_bulk_edits(roster(), [edit], {'PositionName': (POSITION_IDS, 'PPOS')})
+    assert changes_of(result) == {(3, 'PositionName'): ('WR', 'QB'), (3, 'PPOS'): (3, 0)}
+
+    with pytest.raises(BulkEditError, match="isn't a valid value for PositionName"):
+        run_bulk_edits(roster(), [BulkEdit('Move', '', {'PositionName': "'K'"})], {'PositionName': (POSITION_IDS, 'PPOS')})
+
+
+@pytest.mark.parametrize('filter_text, assignments, message', [
+    ('', {'Height': '70'}, "no column named 'Height'"),
+    ('Weight > 200', {'Age': '1'}, "refers to 'Weight'"),
+    ('', {'Age': '__import__("os")'}, "calls a function other than"),
+    ('', {'Age': 'Speed.real'}, "uses Attribute"),
+    ('Age >', {'Age': '1'}, "Can't read the expression"),
+])
+def test_invalid_edits(filter_text, assignments, message):
+    with pytest.raises(BulkEditError, match=message):
+        run_bulk_edits(roster(), [BulkEdit('Edit', filter_text, assignments)])
+
+
+def test_from_text_refuses_lines_that_arent_assignments():
+    with pytest.raises(BulkEditError, match="isn't an assignment"):
+        BulkEdit.from_text('Edit', '', 'Speed == 90')
+
+
+def test_blank_values_are_refused_for_integer_columns():
+    model = roster().assign(Speed=[90, np.nan, 85, 98])
+
+    with pytest.raises(BulkEditError, match="Age holds whole numbers.*for 1 players"):
+        run_bulk_edits(model, [BulkEdit('Edit', '', {'Age': 'Speed'})])
+
+
+def test_text_values_are_refused_for_integer_columns():
+    with pytest.raises(BulkEditError, match="Age holds whole numbers, but the expression gives 'x'"):
+        run_bulk_edits(roster(), [BulkEdit('Edit', '', {'Age': "'x'"})])
+
+
+def test_model_is_not_modified():
+    model = roster()
+    run_bulk_edits(model, [BulkEdit('All', '', {'Speed': '99'})])
+    pd.testing.assert_frame_equal(model, roster())
+
+
+def test_load_rule_file(tmp_path, changes_of):
+    path = tmp_path / 'rules.json'
+    path.write_text(json.dumps([
+        {'name': 'Arm', 'filter': "PositionName == 'QB'", 'set': {'`Throw Power`': '99'}},
+        {'set': {'Age': 25}},
+    ]))
+
+    edits = load_rule_file(str(path))
+    assert [edit.name for edit in edits] == ['Arm', 'Edit 2']
+    assert edits[0].assignments == {'Throw Power': '99'}
+    assert changes_of(run_bulk_edits(roster(), edits))[(1, 'Throw Power')] == (95, 99)
+
+
+
+@pytest.mark.parametrize('rules, message', [
+    ({'set': {'Age': '1'}}, "must contain a list of edits"),
+    ([{'filter': 'Age > 1'}], "Edit 1 has no 'set'"),
+    ([{'set': {'Age': '1'}}, 'x'], "Edit 2 isn't an object"),
+    ([{'filter': 5, 'set': {'Age': '1'}}], "Edit 1's 'filter' must be a string"),
+])
+def test_invalid_rule_files(tmp_path, rules, message):
+    path = tmp_path / 'rules.json'
+    path.write_text(json.dumps(rules))
+    with pytest.raises(BulkEditError, match=message):
+        load_rule_file(str(path))
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+from column_codecs import UNKNOWN_LABEL, ColumnCodec, ColumnCodecs
+
+POSITIONS = {0: 'QB', 1: 'HB', 3: 'WR'}
+
+
+def position_codec():
+    return ColumnCodec('PositionName', 'Position ID', POSITIONS)
+
+
+def test_decode_maps_ids_to_labels():
+    decoded = position_codec().decode([3, 0, 1, 3])
+    assert list(decoded) == ['WR', 'QB', 'HB', 'WR']
+    assert list(decoded.categories) == ['QB', 'HB', 'WR', UNKNOWN_LABEL]
+
+
+def test_decode_marks_unmapped_and_missing_ids_unknown():
+    decoded = position_codec().decode([2, 99, -1, None, 'x', 1.0])
+    assert list(decoded) == [UNKNOWN_LABEL] * 5 + ['HB']
+
+
+def test_decode_with_an_empty_map():
+    decoded = ColumnCodec('PositionName', 'PPOS', {}).decode([0, 1])
+    assert list(decoded) == [UNKNOWN_LABEL, UNKNOWN_LABEL]
+
+
+def test_encode_maps_labels_to_ids():
+    ids = position_codec().encode(pd.Series(['WR', 'QB', UNKNOWN_LABEL, 'K', None]))
+    np.testing.assert_array_equal(ids, [3, 0, np.nan, np.nan, np.nan])
+
+
+def test_encode_round_trips_decode():
+    codec = position_codec()
+    ids = [0, 1, 3, 3, 0]
+    np.testing.assert_array_equal(codec.encode(codec.decode(ids)), ids)
+
+
+def test_labels_shared_by_two_ids_encode_to_the_last():
+    codec = ColumnCodec('TeamName', 'TGID', {1: 'Free Agents', 5: 'Bears', 32: 'Free Agents'})
+    assert list(codec.decode([1, 32, 5])) == ['Free Agents', 'Free Agents', 'Bears']
+    np.testing.assert_array_equal(codec.encode(['Free Agents', 'Bears']), [32, 5])
+
+
+def test_single_values():
+    codec = position_codec()
+    assert codec.encode_value('HB') == 1
+    assert codec.encode_value('K') is None
+    assert codec.is_valid('WR') and not codec.is_valid(UNKNOWN_LABEL)
+
+
+def codecs():
+    return ColumnCodecs.from_config({
+        'header_map': {'PPOS': 'Position ID', 'PLTY': 'Archetype'},
+        'position_map': {str(k): v for k, v in POSITIONS.items()},
+        'archetype_map': {'Field General': 1, 'Scrambler': 2},
+    })
+
+
+def test_from_config_reads_plain_and_inverted_maps():
+    built = codecs()
+    assert 'PositionName' in built and 'Archetype' in built and 'TeamName' not in built
+    assert built['Archetype'].in_place
+    assert list(built['Archetype'].decode([2, 1])) == ['Scrambler', 'Field General']
+    assert built.display_only_columns == ['PositionName']
+
+
+def test_frames_round_trip():
+    built = codecs()
+    df = built.decode_frame(pd.DataFrame({'Position ID': [0, 3, 7], 'Archetype': [1, 2, 9]}))
+    assert list(df['PositionName']) == ['QB', 'WR', UNKNOWN_LABEL]
+    assert list(df['Archetype']) == ['Field General', 'Scrambler', UNKNOWN_LABEL]
+
+    df.loc[0, 'PositionName'] = 'HB'
+    encoded = built.encode_frame(df)
+    assert list(encoded.columns) == ['Position ID', 'Archetype']
+    # An unknown label keeps the ID column's value; an in-place one has nothing to fall back on
+    assert list(encoded['Position ID']) == [1, 3, 7]
+    np.testing.assert_array_equal(encoded['Archetype'], [1, 2, np.nan])
+
+
+def test_assign_keeps_the_id_column_in_step():
+    built = codecs()
+    df = built.decode_frame(pd.DataFrame({'Position ID': [0, 3]}))
+
+    built.assign(df, [1], 'PositionName', 'HB')
+    assert list(df['Position ID']) == [0, 1]
+
+    built.assign(df, [0, 1], 'PositionName', 'Long Snapper')
+    assert list(df['PositionName']) == ['Long Snapper', 'Long Snapper']
+    assert list(df['Position ID']) == [0, 1]
+
+
+def test_value_maps():
+    maps = codecs().value_maps()
+    assert maps['PositionName'] == ({'QB': 0, 'HB': 1, 'WR': 3}, 'Position ID')
+    assert maps['Archetype'] == ({'Field General': 1, 'Scrambler': 2}, None)
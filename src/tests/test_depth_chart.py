@@ -0,0 +1,75 @@
+import pandas as pd
+import pytest
+
+from depth_chart import DCHT_DEPTH, rebuild_depth_charts, starting_player_ids
+
+QB, HB, WR, TE, K = 0, 1, 3, 4, 19
+POSITION_GROUPS = {QB: 'QB', HB: 'RB', WR: 'REC', TE: 'REC'}
+
+
+def players(*rows):
+    return pd.DataFrame(rows, columns=['PGID', 'TGID', 'PPOS', 'Overall'])
+
+
+def depth_chart(*rows):
+    return pd.DataFrame(rows, columns=['TGID', 'PPOS', DCHT_DEPTH, 'PGID'])
+
+
+def slots(rebuild, team, position):
+    chart = rebuild.depth_chart
+    chart = chart[(chart['TGID'] == team) & (chart['PPOS'] == position)]
+    return chart.sort_values(DCHT_DEPTH)['PGID'].tolist()
+
+
+def test_slots_are_filled_best_first_in_depth_order_not_row_order():
+    roster = players((1, 0, WR, 70), (2, 0, WR, 90), (3, 0, WR, 80))
+    # Listed deepest first, so row order and depth order disagree
+    chart = depth_chart((0, WR, 2, 1), (0, WR, 1, 3), (0, WR, 0, 2))
+
+    assert not rebuild_depth_charts(roster, chart, POSITION_GROUPS).has_changes
+
+    chart = depth_chart((0, WR, 2, 2), (0, WR, 1, 3), (0, WR, 0, 1))
+    rebuild = rebuild_depth_charts(roster, chart, POSITION_GROUPS)
+    assert slots(rebuild, 0, WR) == [2, 3, 1]
+    assert rebuild.changes[['depth', 'old_player', 'new_player']].values.tolist() == [[1, 1, 2], [3, 2, 1]]
+    assert chart['PGID'].tolist() == [2, 3, 1]
+
+
+def test_ties_keep_the_player_already_higher_on_the_chart():
+    roster = players((1, 0, HB, 80), (2, 0, HB, 80), (3, 0, HB, 80))
+    chart = depth_chart((0, HB, 0, 3), (0, HB, 1, 1))
+
+    assert not rebuild_depth_charts(roster, chart, POSITION_GROUPS).has_changes
+
+
+def test_the_rest_of_the_group_fills_slots_the_position_cant():
+    roster = players((1, 0, WR, 60), (2, 0, TE, 90), (3, 0, QB, 99), (4, 1, TE, 50))
+    chart = depth_chart((0, WR, 0, 1), (0, WR, 1, 0), (0, WR, 2, 0), (0, WR, 3, 0))
+
+    rebuild = rebuild_depth_charts(roster, chart, POSITION_GROUPS)
+    # The team's own WR first, then its TE, and nobody from another group or team
+    assert slots(rebuild, 0, WR) == [1, 2, 0, 0]
+
+
+def test_positions_outside_the_groups_and_other_teams_are_left_alone():
+    roster = players((1, 0, K, 70), (2, 1, QB, 80), (3, 1, QB, 85))
+    chart = depth_chart((0, K, 0, 9), (1, QB, 0, 2))
+
+    rebuild = rebuild_depth_charts(roster, chart, POSITION_GROUPS)
+    assert slots(rebuild, 0, K) == [9]
+    assert slots(rebuild, 1, QB) == [3]
+
+
+def test_a_chart_without_depths_is_refused():
+    chart = depth_chart((0, QB, 0, 1)).drop(columns=[DCHT_DEPTH])
+
+    with pytest.raises(KeyError, match=DCHT_DEPTH):
+        rebuild_depth_charts(players((1, 0, QB, 70)), chart, POSITION_GROUPS)
+    with pytest.raises(KeyError, match=DCHT_DEPTH):
+        starting_player_ids(chart)
+
+
+def test_starters_are_in_the_first_slot_by_depth():
+    chart = depth_chart((0, QB, 1, 1), (0, QB, 0, 2), (0, WR, 0, 3), (0, WR, 1, 4), (1, QB, 0, 5))
+
+    assert starting_player_ids(chart) == {2, 3, 5}
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+
+from leaderboards import ALL_POSITIONS, Leaderboards
+
+
+def roster():
+    return pd.DataFrame({
+        'PositionName': ['WR', 'QB', 'WR', 'WR', 'QB', 'HB'],
+        'Speed': [90, 70, 95, 90, np.nan, 88],
+        'Age': [24, 30, 22, 27, 35, 21],
+        'Name': ['A', 'B', 'C', 'D', 'E', 'F'],
+        'Rookie': [False, False, True, False, False, True],
+    }, index=[100, 101, 102, 103, 104, 105])
+
+
+def test_top_by_position():
+    boards = Leaderboards(roster())
+    assert list(boards.top('WR', 'Speed', n=2)) == [102, 100]
+    assert list(boards.top('QB', 'Speed')) == [101]
+    assert list(boards.top(ALL_POSITIONS, 'Speed', n=3)) == [102, 100, 103]
+
+
+def test_ties_keep_roster_order():
+    boards = Leaderboards(roster())
+    assert list(boards.top('WR', 'Speed')) == [102, 100, 103]
+    assert list(boards.top(ALL_POSITIONS, 'Speed', n=2, lowest=True)) == [101, 105]
+
+
+def test_lowest_first():
+    assert list(Leaderboards(roster()).top(ALL_POSITIONS, 'Age', n=3, lowest=True)) == [105, 102, 100]
+
+
+def test_a_larger_n_after_a_smaller_one_is_recomputed():
+    boards = Leaderboards(roster())
+    assert len(boards.top(ALL_POSITIONS, 'Age', n=2)) == 2
+    assert list(boards.top(ALL_POSITIONS, 'Age', n=4)) == [104, 101, 103, 100]
+
+
+def test_columns_and_positions():
+    boards = Leaderboards(roster())
+    assert boards.rating_columns() == ['Speed', 'Age']
+    assert boards.positions() == ['HB', 'QB', 'WR']
+
+
+def test_value_edits_update_the_boards():
+    model = roster()
+    boards = Leaderboards(model)
+    assert list(boards.top('WR', 'Speed', n=1)) == [102]
+    boards.top('WR', 'Age')
+    age_board = boards._cache[('WR', 'Age', False)]
+
+    model.loc[103, 'Speed'] = 99
+    boards.apply_changes({103: {'Speed': 99}})
+    assert list(boards.top('WR', 'Speed', n=1)) == [103]
+    assert list(boards.top(ALL_POSITIONS, 'Speed', n=1)) == [103]
+    assert boards._cache[('WR', 'Age', False)] is age_board
+
+
+def test_position_edits_move_the_player():
+    model = roster()
+    boards = Leaderboards(model)
+    assert list(boards.top('QB', 'Age')) == [104, 101]
+
+    model.loc[105, 'PositionName'] = 'QB'
+    boards.apply_changes({105: {'PositionName': 'QB'}})
+    assert list(boards.top('QB', 'Age')) == [104, 101, 105]
+    assert list(boards.top('HB', 'Age')) == []
+
+
+def test_unknown_rows_are_ignored_and_invalidate_rereads():
+    model = roster()
+    boards = Leaderboards(model)
+    boards.apply_changes({999: {'Speed': 100}})
+    assert list(boards.top('WR', 'Speed', n=1)) == [102]
+
+    model.loc[100, 'Speed'] = 100
+    boards.invalidate()
+    assert list(boards.top('WR', 'Speed', n=1)) == [100]
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from range_index import Condition, FilterError, RosterRangeIndex
+
+
+def roster():
+    return pd.DataFrame({
+        'Speed': [90, 75, np.nan, 88, 90, 60],
+        'Age': [22, 31, 25, 24, 28, 21],
+        'Archetype': ['WR_DeepThreat', 'QB_Pocket', 'WR_Slot', 'WR_Slot', 'HB_Elusive', None],
+        'Rookie': [True, False, False, False, False, True],
+    }, index=[10, 11, 12, 13, 14, 15])
+
+
+def matching(conditions, match_all=True, df=None):
+    return list(RosterRangeIndex(roster() if df is None else df).matching_index(conditions, match_all))
+
+
+@pytest.mark.parametrize('operator, value, expected', [
+    ('>=', 88, [10, 13, 14]),
+    ('>', 88, [10, 14]),
+    ('<=', 75, [11, 15]),
+    ('<', 75, [15]),
+    ('between', (75, 88), [11, 13]),
+    ('==', 90, [10, 14]),
+    ('!=', 90, [11, 13, 15]),
+    ('in', [60, 75, 61], [11, 15]),
+    ('not in', [60, 75], [10, 13, 14]),
+    ('in', [], []),
+])
+def test_numeric_conditions_skip_missing_values(operator, value, expected):
+    assert matching([Condition('Speed', operator, value)]) == expected
+
+
+@pytest.mark.parametrize('operator, value, expected', [
+    ('==', 'WR_Slot', [12, 13]),
+    ('!=', 'WR_Slot', [10, 11, 14]),
+    ('in', ['QB_Pocket', 'HB_Elusive'], [11, 14]),
+    ('not in', ['QB_Pocket', 'HB_Elusive'], [10, 12, 13]),
+    ('contains', 'wr_', [10, 12, 13]),
+    ('contains', 'no', []),
+])
+def test_value_conditions_skip_missing_values(operator, value, expected):
+    assert matching([Condition('Archetype', operator, value)]) == expected
+
+
+def test_contains_on_a_number_column_matches_the_text():
+    assert matching([Condition('Age', 'contains', '2')]) == [10, 12, 13, 14, 15]
+
+
+def test_conditions_combine_with_all_or_any():
+    conditions = [Condition('Speed', '>=', 88), Condition('Age', '<', 23)]
+    assert matching(conditions) == [10]
+    assert matching(conditions, match_all=False) == [10, 13, 14, 15]
+    assert matching([]) == [10, 11, 12, 13, 14, 15]
+
+
+def test_edits_invalidate_only_their_columns():
+    df = roster()
+    index = RosterRangeIndex(df)
+    assert list(index.matching_index([Condition('Speed', '>', 89)])) == [10, 14]
+    age = index.sorted_column('Age')
+
+    df.loc[11, 'Speed'] = 99
+    index.apply_changes({11: {'Speed': 99}})
+    assert list(index.matching_index([Condition('Speed', '>', 89)])) == [10, 11, 14]
+    assert index.sorted_column('Age') is age
+
+    index.invalidate()
+    assert index.sorted_column('Age') is not age
+
+
+def test_invalid_conditions():
+    with pytest.raises(FilterError, match="isn't a filter operator"):
+        Condition('Speed', '=~', 1)
+    with pytest.raises(FilterError, match="no column named 'Height'"):
+        matching([Condition('Height', '>', 70)])
+    with pytest.raises(FilterError, match="isn't a number column"):
+        matching([Condition('Archetype', '>', 'A')])
+
+
+def test_booleans_are_compared_as_values():
+    assert matching([Condition('Rookie', '==', True)]) == [10, 15]
+
+
+@pytest.mark.parametrize('operator, text, numeric, value', [
+    ('>=', ' 85 ', True, 85.0),
+    ('between', '90, 80', True, (80.0, 90.0)),
+    ('in', 'WR_Slot, , QB_Pocket', False, ['WR_Slot', 'QB_Pocket']),
+    ('contains', '8', True, '8'),
+])
+def test_condition_from_text(operator, text, numeric, value):
+    condition = Condition.from_text('Column', operator, text, numeric)
+    assert condition.value == value
+    assert Condition.from_text('Column', operator, condition.value_text(), numeric).value == value
+
+
+@pytest.mark.parametrize('operator, text, message', [
+    ('>=', '', 'enter a value'),
+    ('>=', 'fast', "isn't a number"),
+    ('between', '80', 'enter the low and high value'),
+])
+def test_condition_from_text_errors(operator, text, message):
+    with pytest.raises(FilterError, match=message):
+        Condition.from_text('Speed', operator, text, True)
+
+
+def test_describe():
+    assert Condition('Age', 'between', (21.0, 24.0)).describe() == "Age between 21 and 24"
+    assert Condition('Archetype', 'in', ['WR_Slot', 'QB_Pocket']).describe() == "Archetype in (WR_Slot, QB_Pocket)"
+    assert Condition('Speed', '>=', 90.5).describe() == "Speed >= 90.5"
@@ -0,0 +1,142 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import rating_history
+from rating_history import MISSING_RATING, RatingHistory, RatingSnapshot, file_name_date, main
+
+
+def play_table(overall=(80, 70, 90), speed=(85, 90, 75), pgid=(3, 1, 2), positions=(0, 3, 3)):
+    return pd.DataFrame({
+        'PGID': list(pgid),
+        'PFNA': ['Tom', 'Joe', 'Sam'][:len(pgid)],
+        'PLNA': ['Brady', 'Burrow', 'Hunt'][:len(pgid)],
+        'PPOS': list(positions),
+        'POVR': list(overall),
+        'PSPD': list(speed),
+        'PJEN': [12, 9, 4][:len(pgid)],
+    })
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = RatingHistory(str(tmp_path / 'history'))
+    history.add_snapshot(RatingSnapshot.from_play_table('2026-09-01', play_table()), 'week1.ros')
+    history.add_snapshot(RatingSnapshot.from_play_table('2026-09-08', play_table(overall=(84, 65, 91))), 'week2.ros')
+    return history
+
+
+def test_snapshot_is_sorted_by_pgid_and_keeps_only_ratings():
+    snapshot = RatingSnapshot.from_play_table('2026-09-01', play_table())
+
+    assert snapshot.pgid.tolist() == [1, 2, 3]
+    assert snapshot.last_names.tolist() == ['Burrow', 'Hunt', 'Brady']
+    assert snapshot.positions.tolist() == [3, 3, 0]
+    assert snapshot.fields == ['POVR', 'PSPD']
+    assert snapshot.column('POVR').tolist() == [70, 90, 80]
+    assert np.isnan(snapshot.column('PTHP')).all()
+    assert snapshot.find(2) == 1 and snapshot.find(4) is None
+
+
+def test_snapshot_drops_missing_and_repeated_pgids():
+    play = play_table(pgid=(7, None, 7), overall=(80, 70, 60))
+
+    snapshot = RatingSnapshot.from_play_table('2026-09-01', play)
+    assert snapshot.pgid.tolist() == [7]
+    assert snapshot.column('POVR').tolist() == [80]
+
+
+def test_missing_and_out_of_range_ratings_are_stored_as_missing():
+    snapshot = RatingSnapshot.from_play_table('2026-09-01', play_table(overall=(np.nan, 300, -1), speed=(255, 99, 'x')))
+
+    assert (snapshot.ratings == MISSING_RATING).sum() == 5
+    # Rows are in PGID order: 1, 2, 3
+    np.testing.assert_array_equal(snapshot.column('POVR'), [np.nan, np.nan, np.nan])
+    np.testing.assert_array_equal(snapshot.column('PSPD'), [99, np.nan, np.nan])
+
+
+def test_snapshot_needs_pgids():
+    with pytest.raises(ValueError, match='no PGID column'):
+        RatingSnapshot.from_play_table('2026-09-01', play_table().drop(columns=['PGID']))
+
+
+def test_snapshots_survive_a_reopen(history):
+    reopened = RatingHistory(history.directory)
+
+    assert reopened.dates == ['2026-09-01', '2026-09-08']
+    assert reopened.index['2026-09-01']['source'] == os.path.abspath('week1.ros')
+    assert reopened.snapshot('2026-09-08').column('POVR').tolist() == [65, 91, 84]
+    with pytest.raises(KeyError):
+        reopened.snapshot('2026-01-01')
+
+
+def test_find_players(history):
+    assert history.find_players('Hunt') == [2]
+    assert history.find_players('joe burrow') == [1]
+    assert history.find_players(' 42 ') == [42]
+    assert history.find_players('Nobody') == []
+
+
+def test_player_history(history):
+    frame = history.player_history(3, ['POVR', 'PTHP'])
+
+    assert frame.index.tolist() == ['2026-09-01', '2026-09-08']
+    assert frame['POVR'].tolist() == [80, 84]
+    assert frame['PTHP'].isna().all()
+    assert history.player_name(3) == 'Tom Brady'
+
+
+def test_top_deltas(history):
+    assert history.top_deltas()[['pgid', 'old', 'new', 'delta']].values.tolist() == [[3, 80, 84, 4], [2, 90, 91, 1], [1, 70, 65, -5]]
+    assert history.top_deltas(fallers=True, n=1)['name'].tolist() == ['Joe Burrow']
+    assert history.top_deltas(positions=[3])['pgid'].tolist() == [2, 1]
+    assert history.top_deltas(field='PSPD')['delta'].tolist() == [0, 0, 0]
+
+
+def test_top_deltas_needs_two_snapshots(tmp_path):
+    with pytest.raises(ValueError, match='at least two snapshots'):
+        RatingHistory(str(tmp_path)).top_deltas()
+
+
+@pytest.fixture
+def rosters(tmp_path, monkeypatch):
+    monkeypatch.setattr(rating_history, 'load_play_table', lambda path, node='node': play_table())
+    paths = []
+    for name in ('ROSTER-2026-09-01.ros', 'ROSTER-2026-09-08.ros', 'copy.ros'):
+        path = tmp_path / name
+        path.write_bytes(b'')
+        paths.append(str(path))
+    return paths
+
+
+def test_ingest_refuses_two_rosters_with_one_date(history, rosters):
+    with pytest.raises(ValueError, match=r'same date: 2026-10-01 \(ROSTER-2026-09-01.ros, copy.ros\)'):
+        history.ingest([rosters[0], rosters[2]], ['2026-10-01', '2026-10-01'])
+    assert history.dates == ['2026-09-01', '2026-09-08']
+
+
+def test_ingest_replaces_a_stored_date_only_when_asked(history, rosters):
+    with pytest.raises(ValueError, match='already has a snapshot for 2026-09-08'):
+        history.ingest([rosters[2]], ['2026-09-08'])
+    assert history.index['2026-09-08']['source'] == os.path.abspath('week2.ros')
+
+    assert history.ingest([rosters[2]], ['2026-09-08'], replace=True) == ['2026-09-08']
+    assert history.index['2026-09-08']['source'] == os.path.abspath(rosters[2])
+    assert history.snapshot('2026-09-08').column('POVR').tolist() == [70, 90, 80]
+
+
+def test_dates_from_file_names(tmp_path, rosters, capsys):
+    assert file_name_date('ROSTER-2026-09-08.ros') == '2026-09-08'
+    assert file_name_date('2026-13-01 copy.ros') is None
+    assert file_name_date('copy.ros') is None
+
+    store = str(tmp_path / 'store')
+    assert main([store, 'ingest', '--date-from-name', rosters[0], rosters[1]]) == 0
+    assert RatingHistory(store).dates == ['2026-09-01', '2026-09-08']
+    assert capsys.readouterr().out.splitlines() == ['2026-09-01: 3 players from ROSTER-2026-09-01.ros',
+                                                    '2026-09-08: 3 players from ROSTER-2026-09-08.ros']
+
+    assert main([store, 'ingest', '--date-from-name', rosters[0]]) == 1
+    assert 'already has a snapshot' in capsys.readouterr().err
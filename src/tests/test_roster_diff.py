@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+
+from roster_diff import FALLBACK_PLAYER_KEY, PLAYER_KEY, diff_rosters
+
+
+def play_table(**columns):
+    defaults = {'PGID': [1, 2, 3], 'PFNA': ['Tom', 'Joe', 'Sam'], 'PLNA': ['Brady', 'Burrow', 'Hunt'],
+                'PPOS': [0, 0, 1], 'POVR': [90, 88, 70]}
+    defaults.update(columns)
+    return pd.DataFrame(defaults)
+
+
+def test_identical_tables_have_no_differences():
+    diff = diff_rosters(play_table(), play_table())
+    assert diff.is_empty
+    assert diff.key_columns == PLAYER_KEY
+
+
+def test_changed_cells_are_matched_by_player_id_not_row():
+    old = play_table()
+    new = play_table().iloc[::-1].reset_index(drop=True)
+    new.loc[new['PGID'] == 2, 'POVR'] = 91
+
+    diff = diff_rosters(old, new)
+    assert diff.by_player() == {'2': [('POVR', 88, 91)]}
+    assert diff.label('2') == 'Joe Burrow'
+
+
+def test_added_and_removed_players():
+    old = play_table()
+    new = pd.concat([play_table().iloc[1:], play_table(PGID=[4], PFNA=['Ja'], PLNA=['Chase'], PPOS=[3], POVR=[95])],
+                    ignore_index=True)
+
+    diff = diff_rosters(old, new)
+    assert diff.changes.empty
+    assert list(diff.added.index) == ['4']
+    assert list(diff.removed.index) == ['1']
+    assert diff.to_dict()['added'] == ['Ja Chase']
+    assert diff.to_dict()['removed'] == ['Tom Brady']
+
+
+def test_missing_on_both_sides_is_not_a_change():
+    old = play_table(POVR=[90, np.nan, 70])
+    new = play_table(POVR=[90, np.nan, 71])
+
+    diff = diff_rosters(old, new)
+    assert diff.by_player() == {'3': [('POVR', 70, 71)]}
+
+
+def test_float_ids_match_integer_ids():
+    old = play_table(PGID=[1.0, 2.0, 3.0])
+    diff = diff_rosters(old, play_table(POVR=[90, 88, 75]))
+    assert diff.key_columns == PLAYER_KEY
+    assert list(diff.by_player()) == ['3']
+
+
+def test_duplicate_ids_fall_back_to_name_and_position():
+    old = play_table(PGID=[0, 0, 0])
+    new = play_table(PGID=[0, 0, 0], POVR=[90, 88, 72])
+
+    diff = diff_rosters(old, new)
+    assert diff.key_columns == FALLBACK_PLAYER_KEY
+    assert diff.by_player() == {'Sam/Hunt/1#0': [('POVR', 70, 72)]}
+    assert diff.name_matched == 6
+
+
+def test_only_players_without_a_usable_id_fall_back_to_name_and_position():
+    # Everyone shares a name and position, so a fallback for all of them would pair players up by row order
+    old = play_table(PGID=[1, np.nan, 3, 4], PFNA=['Joe'] * 4, PLNA=['Smith'] * 4, PPOS=[0] * 4, POVR=[60, 70, 80, 90])
+    new = old.iloc[[3, 2, 1, 0]].reset_index(drop=True)
+    new.loc[new['PGID'] == 3, 'POVR'] = 81
+
+    diff = diff_rosters(old, new)
+    assert diff.by_player() == {'3': [('POVR', 80, 81)]}
+    assert diff.key_columns == PLAYER_KEY + FALLBACK_PLAYER_KEY
+    assert diff.name_matched == 2
+    assert diff.added.empty and diff.removed.empty
+
+
+def test_an_id_repeated_in_either_table_falls_back_for_those_players():
+    old = play_table(PGID=[1, 2, 3])
+    new = play_table(PGID=[1, 3, 3], POVR=[91, 88, 70])
+
+    diff = diff_rosters(old, new)
+    assert diff.by_player() == {'1': [('POVR', 90, 91)]}
+    # Joe's ID 2 is only in the old table, so the old Joe is matched on it and the new one, whose ID is
+    # repeated, on name and position
+    assert list(diff.removed.index) == ['2']
+    assert list(diff.added.index) == ['Joe/Burrow/0#0']
+    assert diff.name_matched == 3
+
+
+def test_ignored_and_unshared_columns_are_skipped():
+    old = play_table(PAGE=[30, 25, 24])
+    new = play_table(POVR=[91, 88, 70], PSPD=[80, 80, 80])
+
+    diff = diff_rosters(old, new, ignore_columns=['POVR'])
+    assert diff.is_empty
+
+
+def test_report_and_json_values():
+    diff = diff_rosters(play_table(), play_table(POVR=[90, 88, 71]))
+
+    assert diff.format_report({'POVR': 'Overall'}).splitlines() == [
+        "1 changed cells across 1 players, 0 players added, 0 removed",
+        "Sam Hunt:",
+        "  Overall: 70 -> 71",
+    ]
+    cells = diff.to_dict()['changed'][0]['cells']
+    assert cells == [{'column': 'POVR', 'old': 70, 'new': 71}]
+    assert type(cells[0]['old']) is int
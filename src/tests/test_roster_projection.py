@@ -0,0 +1,46 @@
+from column_codecs import ColumnCodec, ColumnCodecs
+from roster_projection import EDITOR_TABLES, INJURY_FIELDS, KEY_FIELDS, RosterProjection
+
+HEADER_MAP = {'PGID': 'Player ID', 'PFNA': 'First Name', 'PLNA': 'Last Name', 'PSPD': 'Speed',
+              'PSTR': 'Strength', 'PPOS': 'Position ID', 'TGID': 'Team ID', 'PLTY': 'Archetype'}
+
+
+def codecs():
+    return ColumnCodecs([
+        ColumnCodec('PositionName', 'Position ID', {0: 'QB'}),
+        ColumnCodec('TeamName', 'Team ID', {1: 'Bears'}),
+        ColumnCodec('Archetype', 'Archetype', {1: 'QB_FieldGeneral'}),
+    ])
+
+
+def test_full_reads_every_field_of_the_editor_tables():
+    projection = RosterProjection.full()
+
+    assert projection.tables == EDITOR_TABLES
+    assert not any(projection.is_partial(table) for table in EDITOR_TABLES)
+    assert projection.node_args() == ['--tables', 'PLAY,INJY,TEAM,DCHT']
+
+
+def test_for_columns_reads_the_fields_behind_the_columns():
+    projection = RosterProjection.for_columns(['Speed', 'Nickname'], HEADER_MAP, codecs())
+
+    # Key fields and every mapped ID field are read even when the layout doesn't show them
+    assert projection.fields['PLAY'] == sorted(set(KEY_FIELDS) | {'PSPD', 'PPOS', 'TGID', 'PLTY'})
+    assert 'PSTR' not in projection.fields['PLAY']
+    assert projection.fields['INJY'] == INJURY_FIELDS
+    assert projection.is_partial('PLAY') and not projection.is_partial('TEAM')
+
+
+def test_label_columns_are_read_through_their_id_field():
+    without_codecs = RosterProjection.for_columns(['PositionName'], HEADER_MAP, ColumnCodecs([]))
+    assert without_codecs.fields['PLAY'] == sorted(KEY_FIELDS)
+
+    with_codecs = RosterProjection.for_columns(['PositionName'], HEADER_MAP, codecs())
+    assert 'PPOS' in with_codecs.fields['PLAY']
+
+
+def test_node_args_list_the_fields_of_partial_tables():
+    projection = RosterProjection({'PLAY': ['PGID', 'PSPD'], 'INJY': ['PGID'], 'TEAM': None})
+
+    assert projection.node_args() == ['--tables', 'PLAY,INJY,TEAM',
+                                      '--fields', 'PLAY=PGID,PSPD', '--fields', 'INJY=PGID']
@@ -0,0 +1,79 @@
+import pandas as pd
+import pytest
+
+from roster_spreadsheet import KEY_COLUMN, export_roster, iter_spreadsheet_chunks, plan_import
+
+POSITION_IDS = {'QB': 0, 'HB': 1, 'WR': 3}
+
+
+def roster():
+    return pd.DataFrame({
+        KEY_COLUMN: [101, 102, 103],
+        'First Name': ['Tom', 'Joe', 'Sam'],
+        'Speed': [70, 88, 92],
+        'Position': ['QB', 'QB', 'HB'],
+        'PPOS': [0, 0, 1],
+        'UnmappedData': [{}, {}, {}],
+    }, index=[10, 11, 12])
+
+
+def test_rows_are_matched_on_player_id(changes_of):
+    sheet = pd.DataFrame({KEY_COLUMN: [103, 101], 'Speed': [95, 70], 'First Name': ['Sammy', 'Tom']})
+
+    plan = plan_import(roster(), [sheet])
+    assert changes_of(plan) == {(12, 'Speed'): (92, 95), (12, 'First Name'): ('Sam', 'Sammy')}
+    assert plan.to_results() == {12: {'Speed': 95, 'First Name': 'Sammy'}}
+    assert plan.column_counts().to_dict() == {'Speed': 1, 'First Name': 1}
+
+
+def test_blank_cells_are_left_alone(changes_of):
+    sheet = pd.DataFrame({KEY_COLUMN: [101, 102], 'Speed': [None, 90]})
+
+    assert changes_of(plan_import(roster(), [sheet])) == {(11, 'Speed'): (88, 90)}
+
+
+def test_invalid_values_are_rejected(changes_of):
+    sheet = pd.DataFrame({KEY_COLUMN: [101, 102, 103], 'Speed': ['fast', 80.5, 93]})
+
+    plan = plan_import(roster(), [sheet])
+    assert changes_of(plan) == {(12, 'Speed'): (92, 93)}
+    assert plan.rejected[['index', 'value']].values.tolist() == [[10, 'fast'], [11, 80.5]]
+
+
+def test_mapped_columns_update_their_id_column(changes_of):
+    sheet = pd.DataFrame({KEY_COLUMN: [101, 102], 'Position': ['WR', 'Kicker']})
+
+    plan = plan_import(roster(), [sheet], {'Position': (POSITION_IDS, 'PPOS')})
+    assert changes_of(plan) == {(10, 'Position'): ('QB', 'WR'), (10, 'PPOS'): (0, 3)}
+    assert plan.rejected[['index', 'column', 'value']].values.tolist() == [[11, 'Position', 'Kicker']]
+
+
+def test_unknown_players_and_columns_are_reported(changes_of):
+    sheet = pd.DataFrame({KEY_COLUMN: [101, 999], 'Speed': [71, 50], 'Nickname': ['TB12', 'X']})
+
+    plan = plan_import(roster(), [sheet])
+    assert changes_of(plan) == {(10, 'Speed'): (70, 71)}
+    assert plan.unknown_players == [999]
+    assert plan.unknown_columns == ['Nickname']
+
+
+def test_later_rows_for_the_same_cell_win(changes_of):
+    first = pd.DataFrame({KEY_COLUMN: [101], 'Speed': [75]})
+    second = pd.DataFrame({KEY_COLUMN: [101], 'Speed': [80]})
+
+    assert changes_of(plan_import(roster(), [first, second])) == {(10, 'Speed'): (70, 80)}
+
+
+def test_a_file_without_player_ids_is_refused():
+    with pytest.raises(ValueError, match=KEY_COLUMN):
+        plan_import(roster(), [pd.DataFrame({'Speed': [1]})])
+
+
+def test_an_unchanged_csv_export_imports_as_nothing(tmp_path):
+    path = str(tmp_path / 'roster.csv')
+    export_roster(roster(), path)
+
+    chunks = list(iter_spreadsheet_chunks(path, chunk_rows=2))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert 'UnmappedData' not in chunks[0].columns
+    assert plan_import(roster(), chunks).is_empty
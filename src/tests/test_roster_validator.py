@@ -0,0 +1,85 @@
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from roster_validator import RosterValidator, ValidationRule, default_rules
+
+POSITION_GROUPS = {'HB': 'RB', 'FB': 'RB', 'LT': 'OT', 'RT': 'OT'}
+RATINGS = ['Speed', 'Strength']
+
+
+def roster(**columns):
+    defaults = {
+        'PositionName': ['QB', 'HB', 'FB', 'LT'],
+        'Archetype': ['QB_FieldGeneral', 'RB_Elusive', 'RB_Blocking', 'OT_Power'],
+        'Speed': [80, 90, 70, 60],
+        'Strength': [60, 70, 80, 95],
+        'TeamName': ['Bears', 'Bears', 'Lions', 'Lions'],
+        'Jersey Num.': [1, 2, 1, 2],
+        'Player ID': [10, 11, 12, 13],
+    }
+    defaults.update(columns)
+    return pd.DataFrame(defaults, index=[100, 101, 102, 103])
+
+
+def violations(df):
+    validator = RosterValidator(default_rules(types.SimpleNamespace(position_group_map=POSITION_GROUPS), RATINGS))
+    return {rule: list(rows) for rule, rows in validator.validate(df).violations.items()}
+
+
+def test_a_clean_roster_has_no_violations():
+    assert violations(roster()) == {}
+
+
+def test_archetype_prefix_must_match_the_position_group():
+    df = roster(Archetype=['RB_Elusive', 'HB_Elusive', 'RB_Blocking', None])
+    assert violations(df) == {"Archetype doesn't match position": [100, 101]}
+
+    # Unknown and blank archetypes are left to their own rule
+    df = roster(Archetype=['Unknown', '', 'RB_Blocking', 'OT_Power'])
+    assert violations(df) == {"Unknown Archetype": [100]}
+
+
+def test_ratings_must_be_within_0_to_99():
+    df = roster(Speed=[100, np.nan, 70, 60], Strength=[60, 70, -1, 'x'])
+    assert violations(df) == {"Rating outside 0-99": [100, 102]}
+
+
+def test_jersey_numbers_must_be_unique_per_team():
+    df = roster(**{'Jersey Num.': [7, 7, 7, 8]})
+    assert violations(df) == {"Duplicate jersey number": [100, 101]}
+
+
+@pytest.mark.parametrize('team', ['NFL Draft', 'Free Agents'])
+def test_draft_prospects_and_free_agents_can_share_jerseys(team):
+    df = roster(TeamName=[team, team, 'Lions', 'Lions'], **{'Jersey Num.': [7, 7, 1, 2]})
+    assert violations(df) == {}
+
+
+def test_player_ids_must_be_unique():
+    df = roster(**{'Player ID': [10, 10, np.nan, np.nan]})
+    assert violations(df) == {"Duplicate player ID": [100, 101]}
+
+
+def test_unknown_labels_are_reported_per_column():
+    df = roster(PositionName=['QB', 'Unknown', 'FB', 'LT'], TeamName=['Bears', 'Bears', 'Unknown', 'Lions'],
+                Archetype=['QB_FieldGeneral', None, 'RB_Blocking', 'OT_Power'])
+    assert violations(df) == {"Unknown PositionName": [101], "Unknown TeamName": [102]}
+
+
+def test_rules_whose_columns_are_missing_are_skipped():
+    df = roster()[['Speed']].assign(Speed=[150, 1, 2, 3])
+    assert violations(df) == {"Rating outside 0-99": [100]}
+
+
+def test_report():
+    rules = [ValidationRule('Slow', 'Speed under 75.', lambda df: df['Speed'] < 75),
+             ValidationRule('Never', 'Nothing.', lambda df: df['Speed'] > 100)]
+
+    report = RosterValidator(rules).validate(roster())
+    assert not report.is_empty
+    assert report.total == 2
+    assert report.format_summary() == "Slow: 2 players"
+    assert report.descriptions['Never'] == 'Nothing.'
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+from team_aggregates import TeamAggregates
+
+
+def roster():
+    return pd.DataFrame({
+        'TeamName': ['Bears', 'Bears', 'Bears', 'Lions', 'Lions'],
+        'PositionName': ['QB', 'WR', 'WR', 'QB', 'HB'],
+        'Overall': [80, 70, 90, 85, 75],
+        'Salary Year 0': [10.0, 2.0, 5.0, 20.0, np.nan],
+        'Total Salary': [30.0, 4.0, 15.0, 60.0, 3.0],
+    }, index=[10, 11, 12, 13, 14])
+
+
+def apply_to(model, changes):
+    for index, row in changes.items():
+        for column, value in row.items():
+            model.loc[index, column] = value
+    return model
+
+
+def test_summary():
+    summary = TeamAggregates(roster(), starters=[10, 12, 13]).summary()
+
+    assert list(summary.index) == ['Bears', 'Lions']
+    assert summary.loc['Bears', 'Players'] == 3
+    assert summary.loc['Bears', 'Avg OVR'] == 80.0
+    assert summary.loc['Bears', 'Starter Avg OVR'] == 85.0
+    assert summary.loc['Lions', 'Starter Avg OVR'] == 85.0
+    assert summary.loc['Lions', 'Salary Year 0'] == 20.0
+    assert summary.loc['Bears', 'Total Salary'] == 49.0
+    assert summary.loc['Bears', ['QB', 'WR', 'HB']].tolist() == [1, 2, 0]
+    assert 'Bonus Year 0' not in summary.columns
+
+
+def test_a_team_without_starters_has_no_starter_average():
+    assert pd.isna(TeamAggregates(roster(), starters=[10]).summary().loc['Lions', 'Starter Avg OVR'])
+
+
+def test_edits_match_a_rebuild():
+    changes = {
+        11: {'Overall': 72, 'Total Salary': 6.0},
+        12: {'TeamName': 'Lions'},
+        13: {'PositionName': 'WR', 'Salary Year 0': None},
+        14: {'TeamName': 'Packers', 'Overall': 78},
+    }
+    aggregates = TeamAggregates(roster(), starters=[10, 13])
+    # An untracked column and a player that isn't in the roster are ignored
+    aggregates.apply_changes({**changes, 10: {'Nickname': 'Ice'}, 99: {'Overall': 99}})
+
+    expected = TeamAggregates(apply_to(roster(), changes), starters=[10, 13])
+    pd.testing.assert_frame_equal(aggregates.summary(), expected.summary(), check_like=True)
+
+
+def test_a_moved_starter_only_counts_for_the_old_team_until_the_depth_chart_is_rebuilt():
+    aggregates = TeamAggregates(roster(), starters=[10, 12])
+    aggregates.update_cell(12, 'TeamName', 'Lions')
+
+    summary = aggregates.summary()
+    assert summary.loc['Bears', 'Starter Avg OVR'] == 80.0
+    assert pd.isna(summary.loc['Lions', 'Starter Avg OVR'])
+    assert summary.loc['Lions', 'WR'] == 1
+
+    aggregates.set_starters([10, 12])
+    assert aggregates.summary().loc['Lions', 'Starter Avg OVR'] == 90.0
+
+
+def test_a_team_that_loses_every_player_is_left_out():
+    aggregates = TeamAggregates(roster())
+    aggregates.apply_changes({13: {'TeamName': 'Bears'}, 14: {'TeamName': 'Bears'}})
+
+    summary = aggregates.summary()
+    assert list(summary.index) == ['Bears']
+    assert summary.loc['Bears', 'Players'] == 5
+    assert summary.loc['Bears', 'HB'] == 1
@@ -0,0 +1,83 @@
+import os
+import threading
+
+import pytest
+from PIL import Image
+
+from thumbnail_cache import ThumbnailCache
+
+
+def write_portrait(folder, portrait_id, color, mtime_ns):
+    path = os.path.join(folder, f"{portrait_id}.dds")
+    Image.new('RGBA', (64, 64), color).save(path, format='DDS', pixel_format='DXT5')
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    images = tmp_path / 'portraits'
+    images.mkdir()
+    cache = ThumbnailCache(str(images), cache_folder=str(tmp_path / 'cache'), size=16, workers=1)
+    yield cache
+    cache.shutdown()
+
+
+def cached_files(cache):
+    return sorted(name for name in os.listdir(cache.cache_folder) if name.endswith('.png'))
+
+
+def test_a_missing_portrait_has_no_thumbnail(cache):
+    assert cache.thumbnail(1234) is None
+    assert cached_files(cache) == []
+
+
+def test_thumbnails_are_shrunk_and_cached_by_mtime(cache):
+    write_portrait(cache.images_folder, 7, (255, 0, 0, 255), 1_000_000_000)
+
+    img = cache.thumbnail(7)
+    assert img.mode == 'RGBA' and img.size == (16, 16)
+    assert cached_files(cache) == ['7_1000000000.png']
+
+
+def test_a_cached_thumbnail_is_used_without_decoding_the_portrait(cache):
+    path = write_portrait(cache.images_folder, 7, (255, 0, 0, 255), 1_000_000_000)
+    cache.thumbnail(7)
+
+    # Unreadable now, but with the same mtime the cache still has this version
+    with open(path, 'wb') as f:
+        f.write(b'not a dds')
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    assert cache.thumbnail(7).getpixel((8, 8))[:3] == (255, 0, 0)
+
+
+def test_a_replaced_portrait_is_decoded_again_and_the_old_thumbnail_removed(cache):
+    write_portrait(cache.images_folder, 7, (255, 0, 0, 255), 1_000_000_000)
+    cache.thumbnail(7)
+
+    write_portrait(cache.images_folder, 7, (0, 0, 255, 255), 2_000_000_000)
+    assert cache.thumbnail(7).getpixel((8, 8))[:3] == (0, 0, 255)
+    assert cached_files(cache) == ['7_2000000000.png']
+
+
+def test_an_unreadable_portrait_has_no_thumbnail(cache):
+    with open(os.path.join(cache.images_folder, '9.dds'), 'wb') as f:
+        f.write(b'not a dds')
+
+    assert cache.thumbnail(9) is None
+    assert cached_files(cache) == []
+
+
+def test_submit_calls_back_from_the_pool(cache):
+    write_portrait(cache.images_folder, 7, (255, 0, 0, 255), 1_000_000_000)
+    results = {}
+    done = threading.Event()
+
+    def callback(portrait_id, image):
+        results[portrait_id] = (image.size, threading.current_thread().name)
+        done.set()
+
+    cache.submit(7, callback).result(timeout=10)
+    assert done.is_set()
+    assert results[7][0] == (16, 16)
+    assert results[7][1].startswith('thumbnail')
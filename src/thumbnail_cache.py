@@ -0,0 +1,95 @@
+import glob
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+THUMBNAIL_SIZE = 32
+CACHE_FOLDER = 'thumbnail_cache'
+
+
+class ThumbnailCache:
+    """Small copies of the portrait .dds files, decoded on a thread pool and kept as PNGs on disk.
+
+    A thumbnail is stored under its portrait ID and the modification time of the .dds it came from,
+    so a replaced portrait is decoded again and an unchanged one never is, even across runs.
+    """
+
+    def __init__(self, images_folder, cache_folder=CACHE_FOLDER, size=THUMBNAIL_SIZE, workers=4):
+        self.images_folder = images_folder
+        self.size = size
+        self.cache_folder = os.path.join(cache_folder, str(size))
+        os.makedirs(self.cache_folder, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="thumbnail")
+        self._futures = {}
+
+    def source_path(self, portrait_id):
+        return os.path.join(self.images_folder, f"{portrait_id}.dds")
+
+    def cached_path(self, portrait_id, mtime_ns):
+        return os.path.join(self.cache_folder, f"{portrait_id}_{mtime_ns}.png")
+
+    def thumbnail(self, portrait_id):
+        """The thumbnail for portrait_id as an RGBA image, or None if there's no portrait or it can't be read.
+        Decodes the .dds only when the disk cache doesn't have this version of it."""
+        try:
+            mtime_ns = os.stat(self.source_path(portrait_id)).st_mtime_ns
+        except OSError:
+            return None
+
+        cached = self.cached_path(portrait_id, mtime_ns)
+        try:
+            with Image.open(cached) as img:
+                return img.convert("RGBA")
+        except (OSError, ValueError):
+            pass
+
+        try:
+            with Image.open(self.source_path(portrait_id)) as img:
+                img = img.convert("RGBA")
+                img.thumbnail((self.size, self.size), Image.Resampling.LANCZOS)
+        except (OSError, ValueError) as e:
+            print(f"Failed to load image {self.source_path(portrait_id)}: {e}")
+            return None
+        self._store(portrait_id, cached, img)
+        return img
+
+    def submit(self, portrait_id, callback):
+        """Loads the thumbnail on the pool and calls callback(portrait_id, image) from the pool thread.
+        A portrait that's already queued isn't queued twice."""
+        future = self._futures.get(portrait_id)
+        if future is not None and not future.done():
+            return future
+        future = self._executor.submit(self._load, portrait_id, callback)
+        self._futures[portrait_id] = future
+        return future
+
+    def cancel_except(self, portrait_ids):
+        """Drops queued loads that haven't started, except for portrait_ids, e.g. the rows still in view."""
+        for portrait_id, future in list(self._futures.items()):
+            if future.done() or (portrait_id not in portrait_ids and future.cancel()):
+                del self._futures[portrait_id]
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _load(self, portrait_id, callback):
+        callback(portrait_id, self.thumbnail(portrait_id))
+
+    def _store(self, portrait_id, cached, img):
+        # Written under a temporary name so another run never reads half a file
+        try:
+            fd, temp_path = tempfile.mkstemp(suffix='.png', dir=self.cache_folder)
+            with os.fdopen(fd, 'wb') as f:
+                img.save(f, format='PNG')
+            os.replace(temp_path, cached)
+        except OSError as e:
+            print(f"Failed to cache thumbnail for {portrait_id}: {e}")
+            return
+        for stale in glob.glob(os.path.join(glob.escape(self.cache_folder), f"{glob.escape(str(portrait_id))}_*.png")):
+            if stale != cached:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
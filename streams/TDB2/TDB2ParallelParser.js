@@ -0,0 +1,200 @@
+const os = require('os');
+const path = require('path');
+const { Worker } = require('worker_threads');
+const TDB2Parser = require('./TDB2Parser');
+const TDB2ColumnStore = require('../../filetypes/TDB2/TDB2ColumnStore');
+const tableScanner = require('./tableScanner');
+
+const WORKER_PATH = path.join(__dirname, 'tableParseWorker.js');
+
+// Tables smaller than this are parsed on the main thread, since handing them to a worker costs more than it saves
+const DEFAULT_MIN_WORKER_TABLE_SIZE = 256 * 1024;
+
+// Parses fully decompressed TDB2 data with a pool of worker threads. A quick scan finds the byte range of every
+// table, then the large tables are parsed by the workers while the main thread parses the rest. Workers parse in
+// columnar mode and post back their column stores, so the result is the same as TDB2Parser.parseBuffer() with the
+// columnar option.
+class TDB2ParallelParser {
+    constructor(options = {}) {
+        this._tablesToParse = options.tables || null;
+        // One core is left for the main thread. With no workers, every table is parsed on the main thread.
+        this._maxWorkers = options.workers !== undefined ? options.workers : os.cpus().length - 1;
+        this._minWorkerTableSize = options.minWorkerTableSize !== undefined ? options.minWorkerTableSize : DEFAULT_MIN_WORKER_TABLE_SIZE;
+    };
+
+    // Resolves with the parsed TDB2File
+    parse(buffer) {
+        const source = this._toSharedBuffer(buffer);
+        const parser = this._createParser();
+        const tableRanges = this._scanTables(parser, source);
+
+        // If the tables can't all be found up front, leave it to the regular parser to read as much as it can
+        if (tableRanges === null) {
+            return Promise.resolve(this._createParser().parseBuffer(source));
+        }
+
+        const workerRanges = tableRanges.filter((range) => {
+            return this._maxWorkers > 0 && !range.table.isSkipped && range.table.unknown2 !== 0x2 && range.length >= this._minWorkerTableSize;
+        });
+
+        const workerResults = this._parseOnWorkers(source, workerRanges);
+
+        // Parse everything else here while the workers are busy
+        const tables = tableRanges.map((range) => {
+            if (workerResults.has(range.offset)) {
+                return null;
+            }
+
+            return range.table.isSkipped ? range.table : parser.parseTable(source, range.offset);
+        });
+
+        return Promise.all(workerRanges.map((range) => workerResults.get(range.offset))).then((columnStores) => {
+            const file = parser.file;
+            const workerColumnStores = new Map(workerRanges.map((range, i) => [range.offset, columnStores[i]]));
+
+            for (let i = 0; i < tableRanges.length; i++) {
+                let table = tables[i];
+
+                if (workerColumnStores.has(tableRanges[i].offset)) {
+                    table = this._getWorkerTable(parser, source, tableRanges[i], workerColumnStores.get(tableRanges[i].offset));
+                }
+
+                // Same as parseBuffer: stop at the first table that can't be read
+                if (table === null) {
+                    break;
+                }
+
+                file.addTable(table);
+            }
+
+            return file;
+        });
+    };
+
+    _createParser() {
+        return new TDB2Parser({ tables: this._tablesToParse, columnar: true });
+    };
+
+    _toSharedBuffer(buffer) {
+        if (buffer.buffer instanceof SharedArrayBuffer) {
+            return buffer;
+        }
+
+        const source = Buffer.from(new SharedArrayBuffer(buffer.length));
+        buffer.copy(source);
+        return source;
+    };
+
+    // Returns the offset, length and header of every table, or null if the data can't be scanned to the end
+    _scanTables(parser, source) {
+        const tableRanges = [];
+        let offset = 0;
+
+        try {
+            while (offset + 5 <= source.length) {
+                const table = parser.readTableHeader(source, offset);
+                const length = table.isSkipped ? table.rawData.length : tableScanner.getTableLength(source, offset);
+
+                if (offset + length > source.length) {
+                    return null;
+                }
+
+                tableRanges.push({ offset: offset, length: length, table: table });
+                offset += length;
+            }
+        }
+        catch (err) {
+            return null;
+        }
+
+        return tableRanges;
+    };
+
+    // Builds the table from a worker's column store, or parses it here if the worker couldn't
+    _getWorkerTable(parser, source, range, columnStoreData) {
+        if (columnStoreData === null) {
+            return parser.parseTable(source, range.offset);
+        }
+
+        const table = range.table;
+        table.fieldDefinitions = columnStoreData.fieldDefinitions;
+        table.columnStore = TDB2ColumnStore.fromTransferable(columnStoreData, source);
+        return table;
+    };
+
+    // Starts parsing the given tables on worker threads. Returns a map of table offset to a promise that resolves
+    // with the table's column store data, or null if the worker couldn't parse it.
+    _parseOnWorkers(source, tableRanges) {
+        const results = new Map();
+
+        if (tableRanges.length === 0) {
+            return results;
+        }
+
+        const resolvers = new Map();
+
+        tableRanges.forEach((range) => {
+            results.set(range.offset, new Promise((resolve) => {
+                resolvers.set(range.offset, resolve);
+            }));
+        });
+
+        // Largest tables first, so a big one doesn't end up last on an otherwise idle pool
+        const queue = tableRanges.slice().sort((a, b) => b.length - a.length);
+        const numWorkers = Math.min(this._maxWorkers, queue.length);
+        let liveWorkers = numWorkers;
+
+        for (let i = 0; i < numWorkers; i++) {
+            const worker = new Worker(WORKER_PATH);
+            let currentRange = null;
+            let isRetired = false;
+
+            const runNext = () => {
+                currentRange = queue.shift() || null;
+
+                if (currentRange === null) {
+                    worker.terminate();
+                    return;
+                }
+
+                worker.postMessage({ sharedBuffer: source.buffer, offset: currentRange.offset });
+            };
+
+            worker.on('message', (message) => {
+                resolvers.get(message.offset)(message.columnStore);
+                runNext();
+            });
+
+            // A worker that fails, or exits without posting its result (e.g. out of memory or process.exit()),
+            // leaves its table and the rest of the queue to the other workers or the main thread
+            const retire = () => {
+                if (isRetired) {
+                    return;
+                }
+
+                isRetired = true;
+
+                // The main thread parses the table instead
+                if (currentRange !== null) {
+                    resolvers.get(currentRange.offset)(null);
+                    currentRange = null;
+                }
+
+                liveWorkers -= 1;
+
+                if (liveWorkers === 0) {
+                    queue.splice(0).forEach((range) => resolvers.get(range.offset)(null));
+                }
+            };
+
+            worker.on('error', retire);
+            worker.on('exit', retire);
+
+            runNext();
+        }
+
+        return results;
+    };
+};
+
+module.exports = TDB2ParallelParser;
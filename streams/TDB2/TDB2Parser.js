@@ -3,8 +3,10 @@ const utilService = require('../../services/utilService');
 const TDB2Table = require('../../filetypes/TDB2/TDB2Table');
 const TDB2Record = require('../../filetypes/TDB2/TDB2Record');
 const TDB2Field = require('../../filetypes/TDB2/TDB2Field');
+const TDB2ColumnStore = require('../../filetypes/TDB2/TDB2ColumnStore');
 const FileParser = require('../../filetypes/abstract/FileParser');
 const {SimpleParser} = require('../../filetypes/abstract/SimpleParser');
+const tableScanner = require('./tableScanner');
 const zlib = require('zlib');
 
 const FIELD_TYPE_INT = 0;
@@ -15,20 +17,419 @@ const FIELD_TYPE_SUBTABLE_COMPRESSED = 5;
 const FIELD_TYPE_FLOAT = 10;
 
 class TDB2Parser extends FileParser {
-    constructor() {
+    constructor(options = {}) {
         super();
         this.file = new TDB2File();
+
+        // Optional allow-list of table names. Other tables are kept as raw bytes instead of being parsed,
+        // which needs the whole decompressed data up front in 'source' so their length can be found.
+        // With a source, records also keep a slice of their original bytes.
+        this._tablesToParse = options.tables ? new Set(options.tables) : null;
+        this.source = options.source || null;
+
+        // Stores the records of each parsed table in a TDB2ColumnStore instead of one object per field.
+        // Tables of compressed records are left as they are.
+        this._columnar = options.columnar === true;
+
+        // Names already in each table's field definitions, so every field read doesn't have to search them
+        this._fieldDefinitionNames = new WeakMap();
+
         this.bytes(0x5, this._onTableStart);
     };
 
+    // Parses fully decompressed TDB2 data in one go with an offset cursor instead of streaming it.
+    // This follows the same rules as the stream parser and returns the parsed file.
+    parseBuffer(buffer) {
+        this.source = buffer;
+        const parser = new SimpleParser(buffer);
+
+        while (parser.offset + 5 <= buffer.length) {
+            const table = this._readBufferTable(parser);
+
+            // Stop at an unsupported field or if the data ends partway through a table
+            if (table === null) {
+                break;
+            }
+
+            this.file.addTable(table);
+        }
+
+        return this.file;
+    };
+
+    // Parses the one table that starts at 'offset' in fully decompressed data, the same way parseBuffer does.
+    // Returns null if the table can't be read.
+    parseTable(buffer, offset) {
+        this.source = buffer;
+        const parser = new SimpleParser(buffer);
+        parser.offset = offset;
+
+        return this._readBufferTable(parser);
+    };
+
+    // Reads just the header of the table at 'offset', without its records. Skipped tables come back complete.
+    readTableHeader(buffer, offset) {
+        this.source = buffer;
+        const parser = new SimpleParser(buffer);
+        parser.offset = offset;
+
+        return this._readBufferTableHeader(parser);
+    };
+
+    _readBufferTable(parser) {
+        const table = this._readBufferTableHeader(parser);
+
+        if (table.isSkipped) {
+            return table;
+        }
+
+        // Columnar tables are read straight into their column store, without building a field object for every cell
+        if (this._columnar && table.unknown2 !== 0x2 && table.numEntries > 0) {
+            const columnStore = this._readBufferColumnStore(parser, table);
+
+            if (columnStore === null) {
+                return null;
+            }
+
+            table.columnStore = columnStore;
+            return table;
+        }
+
+        if (!this._readBufferRecords(parser, table)) {
+            return null;
+        }
+
+        this._normalizeRecords(table);
+        this._useColumnStore(table);
+        return table;
+    };
+
+    _readBufferTableHeader(parser) {
+        const buffer = parser.buffer;
+        let table = new TDB2Table();
+        table.offset = parser.offset;
+        table.rawKey = parser.readBytes(5);
+        table.name = utilService.getSixBitKeyText(buffer, table.offset);
+        table.type = buffer[table.offset + 3];
+        table.unknown1 = buffer[table.offset + 4];
+
+        if (this._shouldSkipTable(table)) {
+            const tableLength = tableScanner.getTableLength(buffer, table.offset);
+            table.rawData = buffer.subarray(table.offset, table.offset + tableLength);
+            parser.offset = table.offset + tableLength;
+            return table;
+        }
+
+        if (table.type === 0x5) {
+            table.unknown2 = buffer[parser.offset];
+            parser.offset += 1;
+        }
+        else if (table.type === 0x3) {
+            // Table type 3 has some extra bytes before the record count
+            parser.offset += 4;
+            table.rawKey = buffer.subarray(table.offset, parser.offset);
+        }
+
+        table.numEntriesRaw = this._readBufferLeb(parser);
+        return table;
+    };
+
+    _readBufferColumnStore(parser, table) {
+        const buffer = parser.buffer;
+        const numEntries = table.numEntries;
+        const columnStore = new TDB2ColumnStore(table.fieldDefinitions, buffer, numEntries);
+
+        for (let row = 0; row < numEntries; row++) {
+            if (parser.offset >= buffer.length) {
+                return null;
+            }
+
+            if (table.type === 5) {
+                columnStore.setIndex(row, utilService.readModifiedLebCompressedInteger(this._readBufferLeb(parser)));
+            }
+            else {
+                columnStore.setIndex(row, row);
+            }
+
+            if (!this._readBufferColumnFields(parser, columnStore, row, table)) {
+                return null;
+            }
+        }
+
+        if (parser.offset > buffer.length) {
+            return null;
+        }
+
+        this._normalizeColumnStore(columnStore, table);
+        return columnStore;
+    };
+
+    // Same as _readBufferRecordFields, but the cells go into the column store
+    _readBufferColumnFields(parser, columnStore, row, table) {
+        const buffer = parser.buffer;
+        const recordOffset = parser.offset;
+
+        while (parser.offset + 4 <= buffer.length) {
+            const keyOffset = parser.offset;
+            const key = utilService.getSixBitKeyText(buffer, keyOffset);
+            const type = buffer[keyOffset + 3];
+            parser.offset += 4;
+
+            let column = columnStore.getColumn(key);
+
+            if (column === undefined) {
+                column = columnStore.addColumn(key, type, buffer.subarray(keyOffset, keyOffset + 4));
+                this._populateFieldDefinitions(table, column);
+            }
+
+            let rawOffset = parser.offset;
+
+            switch (type) {
+                case FIELD_TYPE_INT:
+                    this._readBufferLeb(parser);
+
+                    // UNWI (also the TREF field in M26) has an extra zero for some reason
+                    if (key === 'UNWI' || key === 'TREF') {
+                        parser.offset += 1;
+                    }
+                    break;
+                case FIELD_TYPE_STRING:
+                    // Lengths under 0x80 are a single byte, anything else is a LEB number
+                    let strLen;
+                    if (buffer[parser.offset] < 0x80) {
+                        strLen = buffer[parser.offset];
+                        parser.offset += 1;
+                    }
+                    else {
+                        strLen = utilService.readModifiedLebCompressedInteger(this._readBufferLeb(parser));
+                    }
+
+                    rawOffset = parser.offset;
+                    parser.offset += strLen;
+                    break;
+                case FIELD_TYPE_UNK:
+                    break;
+                case FIELD_TYPE_SUBTABLE:
+                case FIELD_TYPE_SUBTABLE_COMPRESSED:
+                    // Subtables are kept as regular field objects
+                    let field = new TDB2Field();
+                    field.rawKey = buffer.subarray(keyOffset, keyOffset + 4);
+                    field.key = key;
+                    field.type = type;
+
+                    if (!this._readBufferSubTable(parser, field, null, table)) {
+                        return false;
+                    }
+
+                    column.setCell(row, field);
+                    break;
+                case FIELD_TYPE_FLOAT:
+                    parser.offset += 4;
+                    break;
+                default:
+                    console.warn(`Unsupported field type: 0x${type.toString(16)} at index 0x${keyOffset.toString(16)}`);
+                    return false;
+            }
+
+            if (type !== FIELD_TYPE_SUBTABLE && type !== FIELD_TYPE_SUBTABLE_COMPRESSED) {
+                if (column.type === type) {
+                    column.setSourceCell(row, rawOffset, parser.offset - rawOffset);
+                }
+                else {
+                    // A field whose type doesn't match the column's is kept as a field object
+                    let field = new TDB2Field();
+                    field.rawKey = buffer.subarray(keyOffset, keyOffset + 4);
+                    field.key = key;
+                    field.type = type;
+                    field.raw = buffer.subarray(rawOffset, parser.offset);
+                    field.length = type === FIELD_TYPE_STRING ? field.raw.length : 0;
+                    column.setCell(row, field);
+                }
+            }
+
+            // Unknown fields have no data, and the next field key follows directly
+            if (type === FIELD_TYPE_UNK) {
+                continue;
+            }
+
+            // A null byte ends the record, otherwise it is the start of the next field key
+            if (buffer[parser.offset] === 0x0) {
+                parser.offset += 1;
+                columnStore.setRecordSourceRange(row, recordOffset, parser.offset - recordOffset);
+                return true;
+            }
+        }
+
+        return false;
+    };
+
+    _readBufferRecords(parser, table) {
+        const buffer = parser.buffer;
+        const numEntries = table.numEntries;
+
+        // Like the stream parser, at least one record is read before checking the entry count
+        do {
+            if (parser.offset >= buffer.length) {
+                return false;
+            }
+
+            let record = new TDB2Record();
+
+            if (table.type === 5) {
+                record.index = utilService.readModifiedLebCompressedInteger(this._readBufferLeb(parser));
+
+                if (table.unknown2 === 0x2) {
+                    const bytesToRead = utilService.readModifiedLebCompressedInteger(this._readBufferLeb(parser));
+                    this._deferCompressedRecord(parser.readBytes(bytesToRead), record, table);
+                    this._pushTableRecord(record, table);
+                    continue;
+                }
+            }
+            else {
+                record.index = table.records.length;
+            }
+
+            if (!this._readBufferRecordFields(parser, record, table)) {
+                return false;
+            }
+
+            this._pushTableRecord(record, table);
+        }
+        while (table.records.length !== numEntries);
+
+        return parser.offset <= buffer.length;
+    };
+
+    // Reads fields up to and including the record's null terminator. Returns false if the record couldn't be read.
+    _readBufferRecordFields(parser, record, table) {
+        const buffer = parser.buffer;
+        record.offset = parser.offset;
+
+        while (parser.offset + 4 <= buffer.length) {
+            const keyOffset = parser.offset;
+            let field = new TDB2Field();
+            field.rawKey = parser.readBytes(4);
+            field.key = utilService.getSixBitKeyText(buffer, keyOffset);
+            field.type = buffer[keyOffset + 3];
+
+            this._populateFieldDefinitions(table, field);
+
+            switch (field.type) {
+                case FIELD_TYPE_INT:
+                    this._readBufferLeb(parser);
+
+                    // UNWI (also the TREF field in M26) has an extra zero for some reason
+                    if (field.key === 'UNWI' || field.key === 'TREF') {
+                        parser.offset += 1;
+                    }
+
+                    field.raw = buffer.subarray(keyOffset + 4, parser.offset);
+                    break;
+                case FIELD_TYPE_STRING:
+                    // Lengths under 0x80 are a single byte, anything else is a LEB number
+                    if (buffer[parser.offset] < 0x80) {
+                        field.length = buffer[parser.offset];
+                        parser.offset += 1;
+                    }
+                    else {
+                        field.length = utilService.readModifiedLebCompressedInteger(this._readBufferLeb(parser));
+                    }
+
+                    field.raw = parser.readBytes(field.length);
+                    break;
+                case FIELD_TYPE_UNK:
+                    // No data, and the next field key follows directly
+                    field.raw = Buffer.alloc(0);
+                    record.fields[field.key] = field;
+                    continue;
+                case FIELD_TYPE_SUBTABLE:
+                case FIELD_TYPE_SUBTABLE_COMPRESSED:
+                    if (!this._readBufferSubTable(parser, field, record, table)) {
+                        return false;
+                    }
+                    break;
+                case FIELD_TYPE_FLOAT:
+                    field.raw = parser.readBytes(4);
+                    break;
+                default:
+                    console.warn(`Unsupported field type: 0x${field.type.toString(16)} at index 0x${keyOffset.toString(16)}`);
+                    return false;
+            }
+
+            record.fields[field.key] = field;
+
+            // A null byte ends the record, otherwise it is the start of the next field key
+            if (buffer[parser.offset] === 0x0) {
+                parser.offset += 1;
+                record.raw = buffer.subarray(record.offset, parser.offset);
+                return true;
+            }
+        }
+
+        return false;
+    };
+
+    // Reads the header and records of a subtable field, starting after its key
+    _readBufferSubTable(parser, field, record, table) {
+        const buffer = parser.buffer;
+        let subTable = new TDB2Table();
+        subTable.offset = parser.offset - 4;
+        subTable.rawKey = field.rawKey;
+        subTable.name = field.key;
+        subTable.type = field.type;
+        subTable.unknown1 = buffer[parser.offset];
+        parser.offset += 1;
+
+        // Field type 5 has the extra storage type byte just like table type 5
+        if (field.type === FIELD_TYPE_SUBTABLE_COMPRESSED) {
+            subTable.unknown2 = buffer[parser.offset];
+            parser.offset += 1;
+        }
+
+        subTable.numEntriesRaw = this._readBufferLeb(parser);
+        subTable.isSubTable = true;
+        subTable.parentInfo = { parentRecord: record, parentField: field, parentTable: table };
+
+        if (!this._readBufferRecords(parser, subTable)) {
+            return false;
+        }
+
+        field.value = subTable;
+        field.isChanged = false; // Setting the subtable value isn't a change since this is being done while reading
+        return true;
+    };
+
+    _readBufferLeb(parser) {
+        const buffer = parser.buffer;
+        const start = parser.offset;
+        let end = start;
+
+        while (buffer[end] & 0x80) {
+            end++;
+        }
+
+        parser.offset = end + 1;
+        return buffer.subarray(start, end + 1);
+    };
+
     _onTableStart(buf) {
         let table = new TDB2Table();
         table.offset = this.currentBufferIndex - 5;
         table.rawKey = buf.slice(0, 5)
-        table.name = utilService.getUncompressedTextFromSixBitCompression(buf.slice(0, 3));
+        table.name = utilService.getSixBitKeyText(buf);
         table.type = buf.readUInt8(3);
         table.unknown1 = buf.readUInt8(4);
 
+        if (this._shouldSkipTable(table)) {
+            const tableLength = tableScanner.getTableLength(this.source, table.offset);
+            table.rawData = this.source.subarray(table.offset, table.offset + tableLength);
+
+            return this.skipBytes(tableLength - 5, () => {
+                this.file.addTable(table);
+                this.bytes(0x5, this._onTableStart);
+            });
+        }
+
         this.bytes(0x1, function (buf) {
             if(table.type === 0x5)
             {
@@ -62,6 +463,10 @@ class TDB2Parser extends FileParser {
         });
     };
 
+    _shouldSkipTable(table) {
+        return this._tablesToParse !== null && this.source !== null && !this._tablesToParse.has(table.name);
+    };
+
     _getLebRecordKey(record, table) {
         this.bytes(0x1, (buf) => {
             this._readLebNumber(buf, (lebBuf) => {
@@ -75,13 +480,14 @@ class TDB2Parser extends FileParser {
                         this._readLebNumber(numBytesBuf, (lebBytesBuf) => {
                             const bytesToRead = utilService.readModifiedLebCompressedInteger(lebBytesBuf);
                             this.bytes(bytesToRead, (compressedRecordBuf) => {
-                                this._onCompressedTableFieldStart(compressedRecordBuf, record, table)
+                                this._onCompressedRecord(compressedRecordBuf, record, table);
                             });
                         });
                     });
                 }
                 else
                 {
+                    record.offset = this.currentBufferIndex;
                     this._onTableFieldStart(record, table);
                 }
             });
@@ -92,12 +498,31 @@ class TDB2Parser extends FileParser {
         let record = new TDB2Record();
         record.index = table.type === 5 ? this._getLebRecordKey(record, table) : table.records.length;
         if(table.type !== 5)
+        {
+            record.offset = this.currentBufferIndex;
             this._onTableFieldStart(record, table);
+        }
+    };
+
+    _onCompressedRecord(compressedRecordBuf, record, table) {
+        this._deferCompressedRecord(compressedRecordBuf, record, table);
+        this._pushTableRecord(record, table);
+        this._checkTableEnd(table);
+    };
+
+    _deferCompressedRecord(compressedRecordBuf, record, table) {
+        // Compressed records are only decompressed once something actually reads their fields.
+        // Until then the writer puts the original compressed bytes back as they were.
+        record.setLazyLoader(compressedRecordBuf, (lazyRecord) => {
+            this._parseCompressedRecord(lazyRecord, table);
+            this._normalizeRecord(lazyRecord, table);
+        });
     };
 
-    _onCompressedTableFieldStart(compressedRecordBuf, record, table, existingParser) {
-        const recordParser = new SimpleParser(zlib.gunzipSync(compressedRecordBuf));
+    _parseCompressedRecord(record, table) {
+        const recordParser = new SimpleParser(zlib.gunzipSync(record.compressedRaw));
         recordParser.readBytes(4); // Skip the header bytes
+        let currentRecord = record;
 
         // Quick and dirty check for M26 subrecord format based on table name. 
         // Should probably come up with a better way to detect M26, but it works for now
@@ -114,27 +539,42 @@ class TDB2Parser extends FileParser {
                 subRecord.parentRecord = record;
                 record.subRecord = subRecord;
 
-                this._onDecompressedTableFieldStart(recordParser, subRecord, table);
+                currentRecord = subRecord;
             }
             else
             {
                 // When there's no subrecord, there's 2 null bytes and then the 4 byte header
                 recordParser.readBytes(2);
                 recordParser.readBytes(4);
-                this._onDecompressedTableFieldStart(recordParser, record, table);
             }
         }
-        else
+
+        while (this._readDecompressedField(recordParser, currentRecord, table))
         {
-            this._onDecompressedTableFieldStart(recordParser, record, table);
+            if (recordParser.buffer.readUInt8(recordParser.offset) !== 0x0) {
+                continue;
+            }
+
+            // Read record terminator null byte
+            recordParser.readBytes(1);
+
+            // Subrecords work purely by a reference from the parent record, so once one ends we still need to read the parent record afterward
+            if(!currentRecord.isSubRecord)
+            {
+                break;
+            }
+
+            recordParser.readBytes(4); // Read CHVI header
+            currentRecord = currentRecord.parentRecord;
         }
     };
 
-    _onDecompressedTableFieldStart(recordParser, record, table)
+    // Reads one field of a decompressed record. Returns false if the field couldn't be read.
+    _readDecompressedField(recordParser, record, table)
     {
         let field = new TDB2Field();
         field.rawKey = recordParser.readBytes(4);
-        field.key = utilService.getUncompressedTextFromSixBitCompression(field.rawKey.slice(0, 3));
+        field.key = utilService.getSixBitKeyText(field.rawKey);
         field.type = field.rawKey.slice(3).readUInt8(0);
 
         this._populateFieldDefinitions(table, field);
@@ -153,19 +593,19 @@ class TDB2Parser extends FileParser {
 
                     record.fields[field.key] = field;
                 }
-                return this._checkCompressedTableRecordEnd(record, table, recordParser);
+                return true;
             case FIELD_TYPE_STRING:
                 const strLen = utilService.parseModifiedLebEncodedNumber(recordParser);
                 field.length = strLen;
                 field.raw = recordParser.readBytes(strLen);
                 record.fields[field.key] = field;
-                return this._checkCompressedTableRecordEnd(record, table, recordParser);
+                return true;
             case FIELD_TYPE_UNK:
                 // M25+ rosters decided to be weird, sometimes they have a 0 byte after this type byte, other times they don't.
                 // This field type generally never appears at the end of a record, so checking this way shouldn't cause any issues
                 field.raw = recordParser.buffer[recordParser.offset] === 0 ? recordParser.readBytes(1) : Buffer.alloc(0);
                 record.fields[field.key] = field;
-                return this._checkCompressedTableRecordEnd(record, table, recordParser);
+                return true;
             case FIELD_TYPE_SUBTABLE:
                 // Read subtable header information
                 field.value = new TDB2Table();
@@ -180,14 +620,16 @@ class TDB2Parser extends FileParser {
 
                 // Read subtable records
                 this._readCompressedRecordSubTable(field.value, recordParser);
+                field.isChanged = false; // Setting the subtable value isn't a change since this is being done while reading
                 record.fields[field.key] = field;
-                return this._checkCompressedTableRecordEnd(record, table, recordParser);
+                return true;
             case FIELD_TYPE_FLOAT:
                 field.raw = recordParser.readBytes(4);
                 record.fields[field.key] = field;
-                return this._checkCompressedTableRecordEnd(record, table, recordParser);
+                return true;
             default:
-                console.warn(`Unsupported field type: 0x${field.type.toString(16)} at index 0x${this.currentBufferIndex.toString(16)}`);
+                console.warn(`Unsupported field type: 0x${field.type.toString(16)} at index 0x${recordParser.offset.toString(16)} of a compressed ${table.name} record`);
+                return false;
         }
     };
 
@@ -201,7 +643,7 @@ class TDB2Parser extends FileParser {
             {
                 let field = new TDB2Field();
                 field.rawKey = recordParser.readBytes(4);
-                field.key = utilService.getUncompressedTextFromSixBitCompression(field.rawKey.slice(0, 3));
+                field.key = utilService.getSixBitKeyText(field.rawKey);
                 field.type = field.rawKey.slice(3).readUInt8(0);
 
                 this._populateFieldDefinitions(table, field);
@@ -233,6 +675,7 @@ class TDB2Parser extends FileParser {
                         field.value.parentInfo = { parentRecord: record, parentField: field, parentTable: table };
                         record.fields[field.key] = field;
                         this._readCompressedRecordSubTable(field.value, recordParser);
+                        field.isChanged = false;
                         break;
                     case FIELD_TYPE_FLOAT:
                         field.raw = recordParser.readBytes(4);
@@ -249,38 +692,15 @@ class TDB2Parser extends FileParser {
         }
     }
 
-    _checkCompressedTableRecordEnd(record, table, recordParser)
-    {
-        if (recordParser.buffer.readUInt8(recordParser.offset) === 0x0) {
-            // Subrecords work purely by a reference from the parent record, so don't push to table
-            if(!record.isSubRecord)
-            {
-                this._pushTableRecord(record, table);
-            }
-
-            // Read record terminator null byte
-            recordParser.readBytes(1);
-
-            // If it's the end of the subrecord, we still need to read the parent record afterward
-            if(record.isSubRecord)
-            {
-                recordParser.readBytes(4); // Read CHVI header
-                this._onDecompressedTableFieldStart(recordParser, record.parentRecord, table);
-            }
-            else
-            {
-                this._checkTableEnd(table);
-            }
-        }
-        else {
-            this._onDecompressedTableFieldStart(recordParser, record, table);
-        }
-    }
-
     _pushTableRecord(record, table)
     {
         table.records.push(new Proxy(record, {
             get: function (target, prop, receiver) {
+                // Record properties (index, isLoaded, ...) can be read without decompressing a lazily loaded record
+                if (!record.isLoaded && prop in record) {
+                    return record[prop] !== undefined ? record[prop] : null;
+                }
+
                 return record.fields[prop] !== undefined ? record.fields[prop].value : record[prop] !== undefined ? record[prop] : null;
             },
             set: function (target, prop, receiver) {
@@ -306,7 +726,7 @@ class TDB2Parser extends FileParser {
             
             let field = new TDB2Field();
             field.rawKey = tableKeyBuf.slice(0, 4);
-            field.key = utilService.getUncompressedTextFromSixBitCompression(tableKeyBuf.slice(0, 3));
+            field.key = utilService.getSixBitKeyText(tableKeyBuf);
             field.type = tableKeyBuf.readUInt8(3);
 
             this._populateFieldDefinitions(table, field);
@@ -419,6 +839,11 @@ class TDB2Parser extends FileParser {
     _checkTableRecordEnd(record, table) {
         this.bytes(0x1, (buf) => {
             if (buf.readUInt8(0) === 0x0) {
+                // Keep the record's original bytes so the writer can reuse them if nothing changes
+                if (this.source !== null) {
+                    record.raw = this.source.subarray(record.offset, this.currentBufferIndex);
+                }
+
                 this._pushTableRecord(record, table);
 
                 this._checkTableEnd(table);
@@ -431,6 +856,19 @@ class TDB2Parser extends FileParser {
 
     _populateFieldDefinitions(table, field)
     {
+        let definitionNames = this._fieldDefinitionNames.get(table);
+
+        if (definitionNames === undefined) {
+            definitionNames = new Set(table.fieldDefinitions.map((f) => f.name));
+            this._fieldDefinitionNames.set(table, definitionNames);
+        }
+
+        if (definitionNames.has(field.key)) {
+            return;
+        }
+
+        definitionNames.add(field.key);
+
         if (!table.fieldDefinitions.find((f) => f.name === field.key)) {
             const newFieldDef = {
                 'name': field.key,
@@ -448,48 +886,106 @@ class TDB2Parser extends FileParser {
         // Iterate through the records and add any missing fields that are present in some records but not all
         for (let i = 0; i < table.records.length; i++) {
             const record = table.records[i];
-            for (let key in table.fieldDefinitions) {
-                const fieldDef = table.fieldDefinitions[key];
-                if (!record.fields.hasOwnProperty(fieldDef.name)) {
-                    // Skip subtables as they could become a little tricky and don't really need this right now
-                    if(fieldDef.type === FIELD_TYPE_SUBTABLE)
-                    {
-                        continue;
-                    }
 
-                    const newField = new TDB2Field();
-
-                    newField.key = fieldDef.name;
-                    newField.type = fieldDef.type;
-                    newField.rawKey = Buffer.from([...utilService.compress6BitString(fieldDef.name), fieldDef.type]);
-
-                    // Set default values for the field based on type
-                    switch (fieldDef.type) {
-                        case FIELD_TYPE_INT:
-                            newField.value = 0;
-                            break;
-                        case FIELD_TYPE_STRING:
-                            newField.value = '';
-                            break;
-                        case FIELD_TYPE_UNK:
-                            newField.raw = Buffer.from([0x0]);
-                            break;
-                        case FIELD_TYPE_FLOAT:
-                            newField.value = 0.0;
-                            break;
-                        default:
-                            console.warn(`Unsupported field type: 0x${fieldDef.type.toString(16)}`);
-                    }
+            // Compressed records that haven't been read yet get normalized when they are loaded
+            if (!record.isLoaded) {
+                continue;
+            }
 
-                    // It's not really changed since this is being done while reading
-                    newField.isChanged = false;
-                    
-                    record.fields[fieldDef.name] = newField;
+            this._normalizeRecord(record, table);
+        }
+    }
+
+    _normalizeRecord(record, table) {
+        let addedFields = false;
+
+        for (let key in table.fieldDefinitions) {
+            const fieldDef = table.fieldDefinitions[key];
+            if (!record.fields.hasOwnProperty(fieldDef.name)) {
+                const newField = this._createDefaultField(fieldDef);
+
+                if (newField === null) {
+                    continue;
                 }
+
+                record.fields[fieldDef.name] = newField;
+                addedFields = true;
             }
         }
+
+        // The original bytes don't have the added fields, so the record has to be written from its fields
+        if (addedFields) {
+            record.discardRaw();
+        }
+    }
+
+    // Adds missing fields to the rows of a column store, the same way _normalizeRecord does for a record
+    _normalizeColumnStore(columnStore, table) {
+        for (let key in table.fieldDefinitions) {
+            const fieldDef = table.fieldDefinitions[key];
+            const column = columnStore.getColumn(fieldDef.name);
+
+            for (let row = 0; row < columnStore.numRows; row++) {
+                if (column.present[row] === 1) {
+                    continue;
+                }
+
+                const newField = this._createDefaultField(fieldDef);
+
+                if (newField === null) {
+                    break;
+                }
+
+                column.setCell(row, newField);
+                columnStore.setRecordRaw(row, null);
+            }
+        }
+    }
+
+    // Field with a default value, used to fill in fields that are missing from a record
+    _createDefaultField(fieldDef) {
+        // Skip subtables as they could become a little tricky and don't really need this right now
+        if(fieldDef.type === FIELD_TYPE_SUBTABLE)
+        {
+            return null;
+        }
+
+        const newField = new TDB2Field();
+
+        newField.key = fieldDef.name;
+        newField.type = fieldDef.type;
+        newField.rawKey = Buffer.from([...utilService.compress6BitString(fieldDef.name), fieldDef.type]);
+
+        // Set default values for the field based on type
+        switch (fieldDef.type) {
+            case FIELD_TYPE_INT:
+                newField.value = 0;
+                break;
+            case FIELD_TYPE_STRING:
+                newField.value = '';
+                break;
+            case FIELD_TYPE_UNK:
+                newField.raw = Buffer.from([0x0]);
+                break;
+            case FIELD_TYPE_FLOAT:
+                newField.value = 0.0;
+                break;
+            default:
+                console.warn(`Unsupported field type: 0x${fieldDef.type.toString(16)}`);
+        }
+
+        // It's not really changed since this is being done while reading
+        newField.isChanged = false;
+
+        return newField;
     }
 
+    _useColumnStore(table) {
+        if (this._columnar && table.unknown2 !== 0x2) {
+            table.columnStore = TDB2ColumnStore.fromTable(table, this.source);
+        }
+    };
+
     _checkTableEnd(table) {
         if (table.records.length === table.numEntries) {
             if(table.isSubTable)
@@ -502,11 +998,15 @@ class TDB2Parser extends FileParser {
                 delete table.parentInfo;
 
                 parentField.value = table;
+
+                // It's not really changed since this is being done while reading
+                parentField.isChanged = false;
                 this._checkTableRecordEnd(parentRecord, parentTable);
             }
             else
             {
                 this._normalizeRecords(table);
+                this._useColumnStore(table);
                 this.file.addTable(table);
                 this.bytes(0x5, this._onTableStart);
             }
@@ -3,104 +3,212 @@ const utilService = require('../../services/utilService');
 const zlib = require('zlib');
 const subTableWriter = require('./subTableWriter');
 
+// How many compressed records may be gzipping at once ahead of the stream position.
+// The gzip calls run on the libuv threadpool, so keep enough in flight to fill every thread.
+const DEFAULT_GZIP_LOOKAHEAD = (parseInt(process.env.UV_THREADPOOL_SIZE, 10) || 4) * 2;
+
 class TDB2Writer extends Readable {
-    constructor(tdb2File) {
+    constructor(tdb2File, options = {}) {
         super();
         this._file = tdb2File;
 
+        // Output is built up front as an ordered list of parts. A part is either a Buffer or a
+        // compression job whose gzip output is produced asynchronously and pushed in order in _read()
+        this._parts = [];
+        this._partIndex = 0;
+        this._jobs = [];
+        this._jobsStarted = 0;
+        this._jobsConsumed = 0;
+        this._waitingForJob = false;
+        this._gzipLookahead = options.gzipLookahead || DEFAULT_GZIP_LOOKAHEAD;
+
+        // Small buffers are collected here and joined into one part per record
+        this._pendingBuffers = [];
+
+        // Alphabetical field order for each table, worked out once from its field definitions
+        this._sortedFieldKeys = new Map();
+
         tdb2File.tables.forEach((table) => {
-            this.push(table.rawKey);
+            // Tables skipped by the parser are written back exactly as they were read
+            if (table.isSkipped) {
+                this._addPart(table.rawData);
+                this._flushPendingBuffers();
+                return;
+            }
+
+            this._addPart(table.rawKey);
             if(table.type === 5) {
                 // Push data storage type for keyed record tables (type 5)
-                this.push(Buffer.from([table.unknown2]));
+                this._addPart(Buffer.from([table.unknown2]));
 
                 // Sort the table's records by index (necessary for keyed search to work properly)
-                table.records.sort((a, b) => a.index - b.index);
+                this._sortRecordsByIndex(table.records);
                 
             }
-            this.push(table.numEntriesRaw);
+            this._addPart(table.numEntriesRaw);
 
             table.records.forEach((record) => {
                 // Write the record index for keyed record tables (type 5)
                 if(table.type === 5)
                 {
-                    this.push(utilService.writeModifiedLebCompressedInteger(record.index));
+                    this._addPart(utilService.writeModifiedLebCompressedInteger(record.index));
                 }
                 
                 // If the table is not a compressed record storage table, write the record data normally
-                if(table.unknown2 !== 0x2)
+                if(table.unknown2 !== 0x2 && record.raw !== null && !record.isChanged)
+                {
+                    // Nothing in the record changed, so its original bytes can be written back as they are
+                    this._addPart(record.raw);
+                }
+                else if(table.unknown2 !== 0x2)
                 {
-                    // Write the fields in alphabetical order
-                    const sortedFields = Object.keys(record.fields).sort();
+                    // Write the fields in alphabetical order. A columnar record builds its fields object on every access, so it's read once.
+                    const fields = record.fields;
+                    const sortedFields = this._getSortedFieldKeys(table, fields);
                     
                     sortedFields.map((fieldKey) => {
-                        const field = record.fields[fieldKey];
+                        const field = fields[fieldKey];
                         // Write the field key
-                        this.push(field.rawKey);
+                        this._addPart(field.rawKey);
 
                         // Write the string length for string fields
                         if (field.type === 1) {
-                            this.push(utilService.writeModifiedLebCompressedInteger(field.length));
+                            this._addPart(utilService.writeModifiedLebCompressedInteger(field.length));
                         }
 
                         // If it's not a subtable field, just push the raw field data, otherwise, push the subtable data and write the subtable
                         if(field.type !== 4 && field.type !== 5)
                         {
-                            this.push(field.raw);
+                            this._addPart(field.raw);
                         }
                         else if(field.type === 5) // Subtable type 5 (compressed version)
                         {
-                            field.value.records.sort((a, b) => a.index - b.index);
-                            this.push(Buffer.from([field.value.unknown1]));
-                            this.push(Buffer.from([field.value.unknown2]));
-                            this.push(field.value.numEntriesRaw);
-                            this.push(this._writeCompressedSubtable(field.value));
+                            this._sortRecordsByIndex(field.value.records);
+                            this._addPart(Buffer.from([field.value.unknown1]));
+                            this._addPart(Buffer.from([field.value.unknown2]));
+                            this._addPart(field.value.numEntriesRaw);
+                            this._writeCompressedSubtable(field.value);
                         }
                         else
                         {
-                            this.push(Buffer.from([field.value.unknown1]));
-                            this.push(field.value.numEntriesRaw);
-                            this.push(subTableWriter.write(field.value));
+                            this._addPart(Buffer.from([field.value.unknown1]));
+                            this._addPart(field.value.numEntriesRaw);
+                            this._addPart(subTableWriter.write(field.value));
                         }
                     });
                     
-                    this.push(Buffer.from([0x00]));
+                    this._addPart(Buffer.from([0x00]));
+                }
+                else if(!record.isLoaded || (record.compressedRaw !== null && !record.isChanged)) // Compressed records that were never read or changed are written back from their original bytes
+                {
+                    this._addPart(utilService.writeModifiedLebCompressedInteger(record.compressedRaw.length));
+                    this._addPart(record.compressedRaw);
                 }
                 else // Otherwise, write the record data separately and compress it before writing
                 {
                     const decompressedBufs = this._writeCompressedRecord(table, record);
 
-                    // Gzip compress the record data
-                    const compressedBuf = zlib.gzipSync(Buffer.concat(decompressedBufs));
-
-                    // Write the compressed record length and data
-                    this.push(utilService.writeModifiedLebCompressedInteger(compressedBuf.length));
-                    this.push(compressedBuf);
+                    // The compressed record length and data are written once the gzip job completes
+                    this._addCompressionJob(Buffer.concat(decompressedBufs));
                 }
+
+                this._flushPendingBuffers();
             });
+
+            this._flushPendingBuffers();
         });
+    }
 
-        this.push(null);
+    _addPart(buf) {
+        this._pendingBuffers.push(buf);
     }
 
-    _writeCompressedSubtable(subtable) {
-        const subTableBuffers = [];
+    _flushPendingBuffers() {
+        if (this._pendingBuffers.length === 0) {
+            return;
+        }
+
+        this._parts.push(this._pendingBuffers.length === 1 ? this._pendingBuffers[0] : Buffer.concat(this._pendingBuffers));
+        this._pendingBuffers = [];
+    }
+
+    _sortRecordsByIndex(records) {
+        for (let i = 1; i < records.length; i++) {
+            if (records[i - 1].index > records[i].index) {
+                records.sort((a, b) => a.index - b.index);
+                return;
+            }
+        }
+    }
+
+    _getSortedFieldKeys(table, fields) {
+        let tableFieldKeys = this._sortedFieldKeys.get(table);
+
+        if (tableFieldKeys === undefined) {
+            tableFieldKeys = table.fieldDefinitions.map((fieldDef) => fieldDef.name).sort();
+            this._sortedFieldKeys.set(table, tableFieldKeys);
+        }
+
+        const fieldKeys = Object.keys(fields);
+        const sortedFieldKeys = tableFieldKeys.filter((key) => fields[key] !== undefined);
+
+        // Fields the table's definitions don't know about (e.g. added by hand) need a full sort
+        return sortedFieldKeys.length === fieldKeys.length ? sortedFieldKeys : fieldKeys.sort();
+    }
+
+    _addCompressionJob(decompressedBuf) {
+        this._flushPendingBuffers();
 
+        const job = {
+            input: decompressedBuf,
+            output: null,
+            promise: null
+        };
+
+        this._parts.push(job);
+        this._jobs.push(job);
+    }
+
+    _startCompressionJobs() {
+        // Keep up to _gzipLookahead jobs running or finished-but-unwritten, in stream order
+        while (this._jobsStarted < this._jobs.length && this._jobsStarted - this._jobsConsumed < this._gzipLookahead) {
+            const job = this._jobs[this._jobsStarted++];
+
+            job.promise = new Promise((resolve, reject) => {
+                zlib.gzip(job.input, (err, result) => {
+                    if (err) {
+                        reject(err);
+                        return;
+                    }
+
+                    job.input = null;
+                    job.output = result;
+                    resolve();
+                });
+            });
+
+            // _read() only waits on a job once the stream reaches it. A job further ahead can fail
+            // first, so mark its rejection handled here; _read() still turns it into a stream error.
+            job.promise.catch(() => {});
+        }
+    }
+
+    _writeCompressedSubtable(subtable) {
         // Write the data for each record in the subtable
         subtable.records.forEach((record) => {
             // Always start with the key value
-            subTableBuffers.push(utilService.writeModifiedLebCompressedInteger(record.index));
+            this._addPart(utilService.writeModifiedLebCompressedInteger(record.index));
+
+            if (!record.isLoaded || (record.compressedRaw !== null && !record.isChanged)) {
+                this._addPart(utilService.writeModifiedLebCompressedInteger(record.compressedRaw.length));
+                this._addPart(record.compressedRaw);
+                return;
+            }
 
             // Write the decompressed record data, then compress it, write the compressed length, and finally the compressed data
             const decompressedBuf = this._writeCompressedRecord(subtable, record);
-            const compressedBuf = zlib.gzipSync(Buffer.concat(decompressedBuf));
-            subTableBuffers.push(utilService.writeModifiedLebCompressedInteger(compressedBuf.length));
-            subTableBuffers.push(compressedBuf);
-
+            this._addCompressionJob(Buffer.concat(decompressedBuf));
         });
-
-        // Return the complete subtable value buffer
-        return Buffer.concat(subTableBuffers);
     }
 
     _writeCompressedRecord(table, record) {
@@ -135,10 +243,11 @@ class TDB2Writer extends Readable {
         }
 
         // Write the fields in alphabetical order
-        const sortedFields = Object.keys(record.fields).sort();
+        const fields = record.fields;
+        const sortedFields = this._getSortedFieldKeys(table, fields);
 
         sortedFields.map((fieldKey) => {
-            const field = record.fields[fieldKey];
+            const field = fields[fieldKey];
             decompressedBufs.push(field.rawKey);
 
             if (field.type === 1) {
@@ -163,7 +272,43 @@ class TDB2Writer extends Readable {
     }
 
     _read() {
-        // No-op: all data is pushed in the constructor
+        if (this._waitingForJob) {
+            return;
+        }
+
+        this._startCompressionJobs();
+
+        while (this._partIndex < this._parts.length) {
+            let part = this._parts[this._partIndex];
+
+            if (!Buffer.isBuffer(part)) {
+                if (part.output === null) {
+                    // Resume once the next record in order has finished compressing
+                    this._waitingForJob = true;
+                    part.promise.then(() => {
+                        this._waitingForJob = false;
+                        this._read();
+                    }, (err) => {
+                        this.destroy(err);
+                    });
+                    return;
+                }
+
+                part = Buffer.concat([utilService.writeModifiedLebCompressedInteger(part.output.length), part.output]);
+                this._jobsConsumed += 1;
+                this._startCompressionJobs();
+            }
+
+            // Drop the reference so written parts can be collected
+            this._parts[this._partIndex] = null;
+            this._partIndex += 1;
+
+            if (!this.push(part)) {
+                return;
+            }
+        }
+
+        this.push(null);
     }
 };
 
@@ -0,0 +1,28 @@
+const { parentPort } = require('worker_threads');
+const TDB2Parser = require('./TDB2Parser');
+
+// Worker side of TDB2ParallelParser. Parses one table at a time from the shared decompressed data
+// in columnar mode and posts its column store back. If the table can't be posted that way,
+// an empty result tells the main thread to parse it itself.
+parentPort.on('message', (message) => {
+    let transferable = null;
+
+    try {
+        const parser = new TDB2Parser({ columnar: true });
+        const table = parser.parseTable(Buffer.from(message.sharedBuffer), message.offset);
+
+        if (table !== null && table.columnStore !== null) {
+            transferable = table.columnStore.toTransferable();
+        }
+    }
+    catch (err) {
+        transferable = null;
+    }
+
+    if (transferable === null) {
+        parentPort.postMessage({ offset: message.offset, columnStore: null });
+        return;
+    }
+
+    parentPort.postMessage({ offset: message.offset, columnStore: transferable.data }, transferable.transferList);
+});
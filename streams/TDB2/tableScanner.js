@@ -0,0 +1,147 @@
+const utilService = require('../../services/utilService');
+
+const FIELD_TYPE_INT = 0;
+const FIELD_TYPE_STRING = 1;
+const FIELD_TYPE_UNK = 3;
+const FIELD_TYPE_SUBTABLE = 4;
+const FIELD_TYPE_SUBTABLE_COMPRESSED = 5;
+const FIELD_TYPE_FLOAT = 10;
+
+// Main table int fields that are followed by an extra byte (see TDB2Parser._onTableFieldStart),
+// as their packed 3 byte keys
+const EXTRA_BYTE_INT_KEYS = ['UNWI', 'TREF'].map((key) => {
+    const keyBytes = utilService.compress6BitString(key);
+    return (keyBytes[0] << 16) | (keyBytes[1] << 8) | keyBytes[2];
+});
+
+// Walks a TDB2 table in a fully decompressed buffer without building any records, and
+// returns its length in bytes. This has to follow exactly the same rules as TDB2Parser.
+function getTableLength(buffer, tableOffset) {
+    let offset = tableOffset + 5;
+    const type = buffer[tableOffset + 3];
+    let unknown2 = 0;
+
+    if (type === 5) {
+        unknown2 = buffer[offset];
+        offset += 1;
+    }
+    else if (type === 3) {
+        // Table type 3 has some extra bytes before the record count
+        offset += 4;
+    }
+
+    const numEntries = _readLeb(buffer, offset);
+    offset = numEntries.end;
+
+    return _skipRecords(buffer, offset, type, unknown2, numEntries.value) - tableOffset;
+}
+
+function _skipRecords(buffer, offset, type, unknown2, numEntries) {
+    let recordCount = 0;
+
+    // The parser always reads at least one record before checking the entry count
+    do {
+        if (offset >= buffer.length) {
+            throw new Error(`Reached the end of the data while scanning table records at 0x${offset.toString(16)}`);
+        }
+
+        if (type === 5) {
+            // Record key
+            offset = _skipLeb(buffer, offset);
+
+            if (unknown2 === 0x2) {
+                // Compressed record: length followed by the gzip data
+                const compressedLength = _readLeb(buffer, offset);
+                offset = compressedLength.end + compressedLength.value;
+                recordCount++;
+                continue;
+            }
+        }
+
+        offset = _skipFields(buffer, offset);
+        recordCount++;
+    }
+    while (recordCount !== numEntries);
+
+    return offset;
+}
+
+function _skipFields(buffer, offset) {
+    while (true) {
+        const keyOffset = offset;
+        const fieldType = buffer[keyOffset + 3];
+        offset += 4;
+
+        switch (fieldType) {
+            case FIELD_TYPE_INT:
+                offset = _skipLeb(buffer, offset);
+
+                const packedKey = (buffer[keyOffset] << 16) | (buffer[keyOffset + 1] << 8) | buffer[keyOffset + 2];
+                if (packedKey === EXTRA_BYTE_INT_KEYS[0] || packedKey === EXTRA_BYTE_INT_KEYS[1]) {
+                    offset += 1;
+                }
+                break;
+            case FIELD_TYPE_STRING:
+                // Lengths under 0x80 are a single byte, anything else is a LEB number
+                if (buffer[offset] < 0x80) {
+                    offset += 1 + buffer[offset];
+                    break;
+                }
+
+                const strLen = _readLeb(buffer, offset);
+                offset = strLen.end + strLen.value;
+                break;
+            case FIELD_TYPE_UNK:
+                // No data, and never the last field of a record, so the next field key follows directly
+                continue;
+            case FIELD_TYPE_SUBTABLE:
+            case FIELD_TYPE_SUBTABLE_COMPRESSED:
+                offset += 1; // unknown1
+                let subTableUnknown2 = 0;
+
+                if (fieldType === FIELD_TYPE_SUBTABLE_COMPRESSED) {
+                    subTableUnknown2 = buffer[offset];
+                    offset += 1;
+                }
+
+                const numEntries = _readLeb(buffer, offset);
+                offset = _skipRecords(buffer, numEntries.end, fieldType, subTableUnknown2, numEntries.value);
+                break;
+            case FIELD_TYPE_FLOAT:
+                offset += 4;
+                break;
+            default:
+                throw new Error(`Unsupported field type while scanning table: 0x${fieldType.toString(16)} at index 0x${keyOffset.toString(16)}`);
+        }
+
+        // A null byte ends the record, otherwise it is the start of the next field key
+        if (buffer[offset] === 0x0) {
+            return offset + 1;
+        }
+    }
+}
+
+// Returns the offset after a LEB number, without decoding it
+function _skipLeb(buffer, offset) {
+    while (buffer[offset] & 0x80) {
+        offset++;
+    }
+
+    return offset + 1;
+}
+
+function _readLeb(buffer, offset) {
+    let end = offset;
+
+    while (buffer[end] & 0x80) {
+        end++;
+    }
+    end++;
+
+    return {
+        value: utilService.readModifiedLebCompressedInteger(buffer.subarray(offset, end)),
+        end: end
+    };
+}
+
+module.exports = { getTableLength };
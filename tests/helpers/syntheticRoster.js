@@ -0,0 +1,86 @@
+const fs = require('fs');
+const zlib = require('zlib');
+const utilService = require('../../services/utilService');
+
+// Offsets of the franchise roster header read by MaddenRosterHelper
+const HEADER_SIZE = 0x4A;
+const HEADER_DATA_LENGTH_OFFSET = 0x12;
+const HEADER_YEAR_OFFSET = 0x16;
+
+const FIELD_TYPE_INT = 0;
+const FIELD_TYPE_STRING = 1;
+const TABLE_TYPE_RECORDS = 4;
+
+function fieldKey(name, type) {
+    return Buffer.from([...utilService.compress6BitString(name), type]);
+}
+
+function intField(name, value) {
+    return Buffer.concat([fieldKey(name, FIELD_TYPE_INT), utilService.writeModifiedLebCompressedInteger(value)]);
+}
+
+function stringField(name, value) {
+    const data = Buffer.from(value + '\0');
+    return Buffer.concat([fieldKey(name, FIELD_TYPE_STRING), utilService.writeModifiedLebCompressedInteger(data.length), data]);
+}
+
+function table(name, records) {
+    return Buffer.concat([
+        fieldKey(name, TABLE_TYPE_RECORDS),
+        Buffer.from([0]),
+        utilService.writeModifiedLebCompressedInteger(records.length),
+        ...records.map((fields) => Buffer.concat([...fields, Buffer.from([0])]))
+    ]);
+}
+
+// Four-letter field names that aren't used by the named fields below
+function ratingNames(count) {
+    const names = [];
+    for (let i = 0; i < count; i++) {
+        names.push('R' + String.fromCharCode(65 + Math.floor(i / 676) % 26, 65 + Math.floor(i / 26) % 26, 65 + i % 26));
+    }
+    return names;
+}
+
+// The decompressed TDB2 data of a roster with a PLAY table of `players` rows and a 32-team TEAM table
+function buildRosterData(players, ratings = 100) {
+    const names = ratingNames(ratings);
+    const play = [];
+
+    for (let i = 0; i < players; i++) {
+        play.push([
+            intField('PGID', 1000 + i),
+            stringField('PFNA', 'First' + i),
+            stringField('PLNA', 'Last' + i),
+            intField('PPOS', i % 21),
+            intField('TGID', i % 32),
+            ...names.map((name, index) => intField(name, (i * 7 + index) % 100))
+        ]);
+    }
+
+    const team = [];
+    for (let i = 0; i < 32; i++) {
+        team.push([intField('TGID', i), stringField('TDNA', 'Team' + i)]);
+    }
+
+    return Buffer.concat([table('PLAY', play), table('TEAM', team)]);
+}
+
+// A roster file as the game writes it: header, deflated TDB2 data, then trailing bytes
+function buildRoster(players, ratings) {
+    const data = buildRosterData(players, ratings);
+    const header = Buffer.alloc(HEADER_SIZE);
+    header.writeUInt32LE(data.length, HEADER_DATA_LENGTH_OFFSET);
+    header.writeUInt16LE(2026, HEADER_YEAR_OFFSET);
+    return Buffer.concat([header, zlib.deflateSync(data), Buffer.from('TAILBYTES')]);
+}
+
+function writeRoster(filePath, players, ratings) {
+    fs.writeFileSync(filePath, buildRoster(players, ratings));
+}
+
+module.exports = {
+    buildRosterData,
+    buildRoster,
+    writeRoster
+};
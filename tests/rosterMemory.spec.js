@@ -0,0 +1,84 @@
+const os = require('os');
+const fs = require('fs');
+const path = require('path');
+const { expect } = require('chai');
+const { spawnSync } = require('child_process');
+
+const syntheticRoster = require('./helpers/syntheticRoster');
+
+const ROSTER_IO_PATH = path.join(__dirname, '..', 'roster_io.js');
+const PROFILE_PREFIX = 'MREP_PROFILE ';
+
+// A full franchise roster has about 3000 players
+const PLAYER_COUNT = 3000;
+
+// Bounds for a load or save of that roster, with headroom over what they use today. A change that
+// goes past them, e.g. keeping a second copy of every record, should be looked at before it ships.
+const MAX_PEAK_RSS_MB = 200;
+const MAX_HEAP_USED_MB = 80;
+
+// Runs roster_io.js with --profile and returns the stage report it printed to stderr
+function runProfiled(args, input) {
+    const result = spawnSync(process.execPath, [ROSTER_IO_PATH, ...args, '--profile'], {
+        input: input,
+        maxBuffer: 256 * 1024 * 1024,
+        encoding: 'utf8'
+    });
+
+    expect(result.status, result.stderr).to.equal(0);
+    const line = result.stderr.split(/\r?\n/).find((line) => line.startsWith(PROFILE_PREFIX));
+    expect(line, 'roster_io.js printed no profile').to.exist;
+
+    return {
+        stdout: result.stdout,
+        stages: JSON.parse(line.slice(PROFILE_PREFIX.length))
+    };
+}
+
+function peak(stages, key) {
+    return Math.max(...stages.map((stage) => stage[key]));
+}
+
+describe('roster load and save memory', function () {
+    this.timeout(60000);
+
+    let tempDir, rosterPath, savedPath, rosterJson;
+
+    before(function () {
+        tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'mrep-memory-'));
+        rosterPath = path.join(tempDir, 'synthetic.ros');
+        savedPath = path.join(tempDir, 'saved.ros');
+        syntheticRoster.writeRoster(rosterPath, PLAYER_COUNT);
+    });
+
+    after(function () {
+        fs.rmSync(tempDir, { recursive: true, force: true });
+    });
+
+    it('loads a full roster within the memory bounds', function () {
+        const { stdout, stages } = runProfiled(['read', rosterPath]);
+
+        rosterJson = JSON.parse(stdout);
+        expect(rosterJson.play).to.have.length(PLAYER_COUNT);
+        expect(peak(stages, 'peakRssMb')).to.be.below(MAX_PEAK_RSS_MB);
+        expect(peak(stages, 'heapUsedMb')).to.be.below(MAX_HEAP_USED_MB);
+    });
+
+    it('saves a full roster within the memory bounds', function () {
+        const edited = rosterJson.play.map((player) => Object.assign({}, player, { RAAA: 99 }));
+        const { stages } = runProfiled(['write', rosterPath, savedPath], JSON.stringify({ play: edited }));
+
+        expect(fs.existsSync(savedPath)).to.be.true;
+        expect(peak(stages, 'peakRssMb')).to.be.below(MAX_PEAK_RSS_MB);
+        expect(peak(stages, 'heapUsedMb')).to.be.below(MAX_HEAP_USED_MB);
+    });
+
+    it('saves the edits it was given', function () {
+        const { stdout } = runProfiled(['read', savedPath]);
+        const saved = JSON.parse(stdout);
+
+        expect(saved.play).to.have.length(PLAYER_COUNT);
+        expect(saved.play.every((player) => player.RAAA === 99)).to.be.true;
+        expect(saved.play[10].PLNA).to.equal('Last10');
+    });
+});